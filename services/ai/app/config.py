@@ -11,8 +11,11 @@ from pathlib import Path
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+from app.utils.compression import Compression
+from app.utils.html_extraction import ExtractionEngineType
+
 # Application version - increment when ScreeningResult schema changes
-APP_VERSION = "1.0.0"
+APP_VERSION = "1.1.0"
 
 
 class LLMProviderType(str, Enum):
@@ -57,6 +60,92 @@ class Settings(BaseSettings):
     # Processing
     log_level: str = "INFO"
 
+    # Local caches (LLM responses, ...) live here; defaults to <project_root>/cache
+    cache_dir: Path = Path(__file__).resolve().parents[1] / "cache"
+
+    # LLM response cache (keyed on rendered prompt, provider, model, prompt version)
+    llm_cache_enabled: bool = True
+    llm_cache_max_bytes: int = 256 * 1024 * 1024
+    llm_cache_ttl_seconds: float = 7 * 24 * 3600
+
+    # Per-article artifact reuse (scraped article, credibility, extraction)
+    article_artifacts_enabled: bool = True
+    article_artifacts_ttl_seconds: float = 24 * 3600
+
+    # Near-duplicate reuse: an article sharing at least this share of word
+    # shingles (MinHash estimate) with an analysed one reuses its extraction;
+    # credibility is reassessed for a different domain unless disabled
+    near_duplicate_enabled: bool = True
+    near_duplicate_min_similarity: float = 0.9
+    near_duplicate_fresh_credibility: bool = True
+
+    # Fetched article HTML (used without revalidation inside the freshness window,
+    # then revalidated with If-None-Match / If-Modified-Since until the TTL)
+    http_cache_enabled: bool = True
+    http_cache_max_bytes: int = 512 * 1024 * 1024
+    http_cache_fresh_seconds: float = 15 * 60
+    http_cache_ttl_seconds: float = 7 * 24 * 3600
+
+    # Shared HTTP client connection pool (article scraping)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+
+    # Article downloads (read timeout applies between received chunks; bodies
+    # over the size limit or with a non-HTML content type are rejected)
+    http_connect_timeout_seconds: float = 5.0
+    http_read_timeout_seconds: float = 20.0
+    scrape_max_bytes: int = 8 * 1024 * 1024
+
+    # Per-host politeness for async article downloads: concurrent requests and
+    # request rate per host; 429/503 (honouring Retry-After), 502/504 and
+    # network errors are retried with jittered exponential backoff
+    scrape_host_scheduler_enabled: bool = True
+    scrape_max_connections_per_host: int = 4
+    scrape_requests_per_second_per_host: float = 2.0
+    scrape_burst_per_host: int = 4
+    scrape_max_retries: int = 3
+    scrape_backoff_base_seconds: float = 0.5
+    scrape_backoff_max_seconds: float = 30.0
+
+    # Article extraction engine (lxml gives the same title and paragraphs as
+    # readabilipy from a single parse; see benchmarks/extraction_engines.py)
+    extraction_engine: ExtractionEngineType = ExtractionEngineType.READABILIPY
+
+    # HTML extraction worker processes (0 parses in the request's own thread);
+    # pages taking longer than the timeout fall back to simple extraction
+    extraction_workers: int = 2
+    extraction_task_timeout_seconds: float = 10.0
+
+    # Entity extraction: articles over the chunk size (in model tokens) are split
+    # into overlapping chunks extracted in parallel and merged
+    entity_extraction_chunk_max_tokens: int = 4000
+    entity_extraction_chunk_overlap_tokens: int = 200
+    entity_extraction_max_concurrency: int = 4
+
+    # Person matching (async path)
+    matching_max_concurrency: int = 8
+    matching_entity_timeout_seconds: float = 60.0
+    # Deterministic name pre-filter (skips LLM calls for clearly unrelated names)
+    matching_prefilter_enabled: bool = True
+    matching_prefilter_min_similarity: float = 0.75
+
+    # Saved results: compression for data files and article blobs (none, gzip,
+    # or zstd, which needs the zstandard package)
+    results_compression: Compression = Compression.GZIP
+    # Write-behind saving (results held in memory before saving inline; results
+    # saved per storage call)
+    results_write_queue_size: int = 1000
+    results_write_batch_size: int = 32
+
+    # Background screening jobs (SQLite queue under results/)
+    job_workers: int = 4
+    job_poll_interval_seconds: float = 1.0
+    job_max_attempts: int = 3
+    job_lease_seconds: float = 60.0
+    # Hosts (and subdomains) job callbacks may go to; empty = any public host
+    job_callback_allowed_hosts: list[str] = []
+
     model_config = {
         "env_file": [".env.defaults", ".env.secrets"],
         "env_file_encoding": "utf-8",
@@ -0,0 +1,229 @@
+"""
+Application-lifetime service container.
+
+Builds settings, LLM clients, HTTP clients and analysers once at startup so
+requests share them instead of reconstructing them per call. Created and closed
+by the FastAPI lifespan in app.factory.
+"""
+
+import asyncio
+
+import httpx
+
+from app.config import APP_VERSION, Settings
+from app.services.artifacts import ArticleArtifactStore
+from app.services.credibility.analyser import CredibilityAnalyser
+from app.services.extraction.llm import EntityExtractor
+from app.services.jobs import JobQueue, JobRunner
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_factory import create_llm, select_llm_config
+from app.services.matching.matcher import PersonMatcher
+from app.services.matching.prefilter import NamePrefilter
+from app.services.results.persister import ResultPersister
+from app.services.results.storage import ResultsStorage
+from app.services.screening_pipeline import ScreeningPipeline
+from app.services.sentiment.analyser import SentimentAnalyser
+from app.utils.disk_cache import DiskCache
+from app.utils.extraction_pool import ExtractionPool
+from app.utils.host_scheduler import HostScheduler
+from app.utils.http_cache import HTTPCache
+from app.utils.logger import get_logger
+from app.utils.scraping import ArticleScraper
+
+
+class ServiceContainer:
+    """
+    Holds long-lived services shared across requests.
+
+    Everything here is safe to share: the LLM chat models and httpx clients are
+    thread-safe and pool their own connections, and the analysers keep no
+    per-request state.
+    """
+
+    def __init__(self, settings: Settings, logger=None) -> None:
+        """
+        Build all shared services from settings.
+
+        Args:
+            settings: Application settings (read once at startup)
+            logger: Optional logger instance
+        """
+        self.settings = settings
+        self.logger = logger or get_logger(service="api")
+
+        limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        )
+        timeout = httpx.Timeout(
+            settings.http_read_timeout_seconds,
+            connect=settings.http_connect_timeout_seconds,
+        )
+        self.http_client = httpx.Client(
+            follow_redirects=True, limits=limits, timeout=timeout
+        )
+        self.async_http_client = httpx.AsyncClient(
+            follow_redirects=True, limits=limits, timeout=timeout
+        )
+        self.http_cache: HTTPCache | None = None
+        if settings.http_cache_enabled:
+            self.http_cache = HTTPCache(
+                DiskCache(
+                    settings.cache_dir / "http_responses.sqlite3",
+                    max_bytes=settings.http_cache_max_bytes,
+                    ttl_seconds=settings.http_cache_ttl_seconds,
+                    logger=self.logger,
+                ),
+                fresh_seconds=settings.http_cache_fresh_seconds,
+            )
+        self.extraction_pool: ExtractionPool | None = None
+        if settings.extraction_workers > 0:
+            self.extraction_pool = ExtractionPool(
+                workers=settings.extraction_workers,
+                task_timeout_seconds=settings.extraction_task_timeout_seconds,
+                logger=self.logger,
+            )
+        self.host_scheduler: HostScheduler | None = None
+        if settings.scrape_host_scheduler_enabled:
+            self.host_scheduler = HostScheduler(
+                max_connections_per_host=settings.scrape_max_connections_per_host,
+                requests_per_second=settings.scrape_requests_per_second_per_host,
+                burst=settings.scrape_burst_per_host,
+                max_retries=settings.scrape_max_retries,
+                backoff_base_seconds=settings.scrape_backoff_base_seconds,
+                backoff_max_seconds=settings.scrape_backoff_max_seconds,
+                logger=self.logger,
+            )
+        self.scraper = ArticleScraper(
+            logger=self.logger,
+            http_client=self.http_client,
+            async_http_client=self.async_http_client,
+            http_cache=self.http_cache,
+            max_bytes=settings.scrape_max_bytes,
+            extraction_pool=self.extraction_pool,
+            extraction_engine=settings.extraction_engine,
+            host_scheduler=self.host_scheduler,
+        )
+
+        # One chat model instance is shared by all analysers
+        provider, cfg = select_llm_config(settings)
+        self.llm = create_llm(provider, cfg.model, cfg.api_key, cfg.temperature)
+
+        self.llm_cache: LLMResponseCache | None = None
+        if settings.llm_cache_enabled:
+            self.llm_cache = LLMResponseCache(
+                DiskCache(
+                    settings.cache_dir / "llm_responses.sqlite3",
+                    max_bytes=settings.llm_cache_max_bytes,
+                    ttl_seconds=settings.llm_cache_ttl_seconds,
+                    logger=self.logger,
+                )
+            )
+
+        self.extractor = EntityExtractor(
+            llm=self.llm,
+            logger=self.logger,
+            provider=provider,
+            model_name=cfg.model,
+            cache=self.llm_cache,
+            chunk_max_tokens=settings.entity_extraction_chunk_max_tokens,
+            chunk_overlap_tokens=settings.entity_extraction_chunk_overlap_tokens,
+            max_concurrency=settings.entity_extraction_max_concurrency,
+        )
+        self.credibility_analyser = CredibilityAnalyser(
+            llm=self.llm,
+            provider=provider,
+            model_name=cfg.model,
+            logger=self.logger,
+            cache=self.llm_cache,
+        )
+        self.matcher = PersonMatcher(
+            llm=self.llm,
+            provider=provider,
+            model_name=cfg.model,
+            logger=self.logger,
+            max_concurrency=settings.matching_max_concurrency,
+            entity_timeout_seconds=settings.matching_entity_timeout_seconds,
+            prefilter=(
+                NamePrefilter(min_similarity=settings.matching_prefilter_min_similarity)
+                if settings.matching_prefilter_enabled
+                else None
+            ),
+            cache=self.llm_cache,
+        )
+        self.sentiment_analyser = SentimentAnalyser(
+            llm=self.llm,
+            provider=provider,
+            model_name=cfg.model,
+            logger=self.logger,
+            cache=self.llm_cache,
+        )
+        self.results_storage = ResultsStorage(
+            results_dir=settings.project_root / "results",
+            schema_version=APP_VERSION,
+            logger=self.logger,
+            compression=settings.results_compression,
+        )
+        self.result_persister = ResultPersister(
+            self.results_storage,
+            max_queue_size=settings.results_write_queue_size,
+            batch_size=settings.results_write_batch_size,
+            logger=self.logger,
+        )
+        self.artifact_store: ArticleArtifactStore | None = None
+        if settings.article_artifacts_enabled:
+            self.artifact_store = ArticleArtifactStore(
+                settings.cache_dir / "article_artifacts.sqlite3",
+                ttl_seconds=settings.article_artifacts_ttl_seconds,
+                logger=self.logger,
+            )
+        self.screening_pipeline = ScreeningPipeline(
+            self.scraper,
+            self.extractor,
+            self.matcher,
+            settings,
+            self.credibility_analyser,
+            self.sentiment_analyser,
+            self.results_storage,
+            self.artifact_store,
+            self.result_persister,
+        )
+        self.job_queue = JobQueue(
+            settings.project_root / "results" / "jobs.sqlite3",
+            max_attempts=settings.job_max_attempts,
+            lease_seconds=settings.job_lease_seconds,
+            logger=self.logger,
+        )
+        self.job_runner = JobRunner(
+            self.job_queue,
+            self.screening_pipeline,
+            self.async_http_client,
+            workers=settings.job_workers,
+            poll_interval_seconds=settings.job_poll_interval_seconds,
+            callback_allowed_hosts=frozenset(settings.job_callback_allowed_hosts),
+            logger=self.logger,
+        )
+
+    async def astart(self) -> None:
+        """Start background workers (requires a running event loop)."""
+        self.results_storage.start_backfill()
+        if self.extraction_pool is not None:
+            await asyncio.to_thread(self.extraction_pool.warm_up)
+        await self.result_persister.start()
+        await self.job_runner.start()
+
+    async def aclose(self) -> None:
+        """Stop background workers, flush pending results, release connections."""
+        await self.job_runner.stop()
+        await self.result_persister.stop()
+        try:
+            self.http_client.close()
+            await self.async_http_client.aclose()
+        except Exception:
+            self.logger.exception("Failed to close HTTP clients")
+        if self.extraction_pool is not None:
+            await asyncio.to_thread(self.extraction_pool.close)
+        if self.llm_cache is not None:
+            self.logger.info("LLM cache stats: {}", self.llm_cache.stats())
+        self.logger.info("Service container closed")
@@ -1,12 +1,14 @@
 import httpx
-from fastapi import Depends
+from fastapi import Depends, Request
 
-from app.config import APP_VERSION, Settings
+from app.config import Settings
+from app.container import ServiceContainer
 from app.services.credibility.analyser import CredibilityAnalyser
 from app.services.extraction.llm import EntityExtractor
-from app.services.llm_factory import create_llm, select_llm_config
+from app.services.jobs import JobQueue, JobRunner
 from app.services.matching.matcher import PersonMatcher
 from app.services.pipeline import ArticleExtractionPipeline
+from app.services.results.persister import ResultPersister
 from app.services.results.storage import ResultsStorage
 from app.services.screening_pipeline import ScreeningPipeline
 from app.services.sentiment.analyser import SentimentAnalyser
@@ -18,35 +20,30 @@ def get_app_logger():
     return get_logger(service="api")
 
 
-def get_http_client():
-    return httpx.Client(follow_redirects=True)
+def get_container(request: Request) -> ServiceContainer:
+    """Return the app-lifetime service container built by the lifespan."""
+    return request.app.state.container
 
 
-def get_scraper(logger=Depends(get_app_logger), client=Depends(get_http_client)):
-    return ArticleScraper(logger=logger, http_client=client)
+def get_http_client(container=Depends(get_container)) -> httpx.Client:
+    return container.http_client
 
 
-def get_settings() -> Settings:
-    return Settings()
+def get_scraper(container=Depends(get_container)) -> ArticleScraper:
+    return container.scraper
 
 
-def get_extractor(settings=Depends(get_settings), logger=Depends(get_app_logger)):
-    provider, cfg = select_llm_config(settings)
-    llm = create_llm(provider, cfg.model, cfg.api_key, cfg.temperature)
-    return EntityExtractor(
-        llm=llm, logger=logger, provider=provider, model_name=cfg.model
-    )
+def get_settings(container=Depends(get_container)) -> Settings:
+    return container.settings
 
 
-def get_credibility_analyser(
-    settings=Depends(get_settings), logger=Depends(get_app_logger)
-) -> CredibilityAnalyser:
-    """Create CredibilityAnalyser with configured LLM (reuse default)."""
-    provider, cfg = select_llm_config(settings)
-    llm = create_llm(provider, cfg.model, cfg.api_key, cfg.temperature)
-    return CredibilityAnalyser(
-        llm=llm, provider=provider, model_name=cfg.model, logger=logger
-    )
+def get_extractor(container=Depends(get_container)) -> EntityExtractor:
+    return container.extractor
+
+
+def get_credibility_analyser(container=Depends(get_container)) -> CredibilityAnalyser:
+    """Shared CredibilityAnalyser with configured LLM."""
+    return container.credibility_analyser
 
 
 def get_pipeline(
@@ -56,49 +53,36 @@ def get_pipeline(
     return ArticleExtractionPipeline(scraper, extractor)
 
 
-def get_matcher(
-    settings=Depends(get_settings), logger=Depends(get_app_logger)
-) -> PersonMatcher:
-    """Create PersonMatcher with configured LLM."""
-    provider, cfg = select_llm_config(settings)
-    llm = create_llm(provider, cfg.model, cfg.api_key, cfg.temperature)
-    return PersonMatcher(
-        llm=llm, provider=provider, model_name=cfg.model, logger=logger
-    )
-
-
-def get_sentiment_analyser(
-    settings=Depends(get_settings), logger=Depends(get_app_logger)
-) -> SentimentAnalyser:
-    """Create SentimentAnalyser with configured LLM."""
-    provider, cfg = select_llm_config(settings)
-    llm = create_llm(provider, cfg.model, cfg.api_key, cfg.temperature)
-    return SentimentAnalyser(
-        llm=llm, provider=provider, model_name=cfg.model, logger=logger
-    )
-
-
-def get_results_storage(
-    settings: Settings = Depends(get_settings), logger=Depends(get_app_logger)
-) -> ResultsStorage:
-    """Create ResultsStorage for persisting screening results."""
-    return ResultsStorage(
-        results_dir=settings.project_root / "results",
-        schema_version=APP_VERSION,
-        logger=logger,
-    )
-
-
-def get_screening_pipeline(
-    scraper=Depends(get_scraper),
-    extractor=Depends(get_extractor),
-    matcher=Depends(get_matcher),
-    analyser=Depends(get_credibility_analyser),
-    sentiment_analyser=Depends(get_sentiment_analyser),
-    storage=Depends(get_results_storage),
-    settings=Depends(get_settings),
-) -> ScreeningPipeline:
-    """Create ScreeningPipeline with all required services."""
-    return ScreeningPipeline(
-        scraper, extractor, matcher, settings, analyser, sentiment_analyser, storage
-    )
+def get_matcher(container=Depends(get_container)) -> PersonMatcher:
+    """Shared PersonMatcher with configured LLM."""
+    return container.matcher
+
+
+def get_sentiment_analyser(container=Depends(get_container)) -> SentimentAnalyser:
+    """Shared SentimentAnalyser with configured LLM."""
+    return container.sentiment_analyser
+
+
+def get_results_storage(container=Depends(get_container)) -> ResultsStorage:
+    """Shared ResultsStorage for persisting screening results."""
+    return container.results_storage
+
+
+def get_result_persister(container=Depends(get_container)) -> ResultPersister:
+    """Shared write-behind persister holding results not yet saved."""
+    return container.result_persister
+
+
+def get_screening_pipeline(container=Depends(get_container)) -> ScreeningPipeline:
+    """Shared ScreeningPipeline with all required services."""
+    return container.screening_pipeline
+
+
+def get_job_queue(container=Depends(get_container)) -> JobQueue:
+    """Shared JobQueue holding background screening jobs."""
+    return container.job_queue
+
+
+def get_job_runner(container=Depends(get_container)) -> JobRunner:
+    """Shared JobRunner that submits and runs background screening jobs."""
+    return container.job_runner
@@ -1,15 +1,35 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.config import Settings
+from app.container import ServiceContainer
 from app.routes import router
 from app.utils.logger import configure_logger
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build shared services on startup and release them on shutdown.
+    """
+    container = ServiceContainer(Settings())
+    app.state.container = container
+    await container.astart()
+    try:
+        yield
+    finally:
+        await container.aclose()
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
     """
     configure_logger()
-    app = FastAPI(title="Adverse Media Screening AI Service", version="0.1.0")
+    app = FastAPI(
+        title="Adverse Media Screening AI Service", version="0.1.0", lifespan=lifespan
+    )
 
     app.include_router(router)
     return app
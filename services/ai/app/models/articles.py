@@ -9,8 +9,10 @@ class Article(BaseModel):
         url: Source URL of the article
         title: Article title
         content: Full text content of the article
+        canonical_url: URL the page declares as canonical (rel=canonical), if any
     """
 
     url: str
     title: str
     content: str
+    canonical_url: str | None = None
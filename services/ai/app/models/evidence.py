@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from pydantic.json_schema import SkipJsonSchema
+
+
+# The docstring is part of the schema shown to the LLM
+class EvidenceSpan(BaseModel):
+    """
+    Article text supporting a claim: cite the sentence by its id, and quote
+    only when the evidence is part of a sentence.
+    """
+
+    # Id in the article's sentence index (see app.utils.sentences)
+    sentence_id: int | None = None
+    # Exact evidence text (filled in from sentence_id after the LLM call)
+    quote: str = ""
+    # Character offsets in Article.content, resolved by the pipeline
+    start_index: SkipJsonSchema[int | None] = None
+    end_index: SkipJsonSchema[int | None] = None
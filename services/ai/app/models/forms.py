@@ -5,13 +5,13 @@ Form data models for API endpoints.
 from datetime import date
 
 from fastapi import Form
-from pydantic import BaseModel, Field, HttpUrl
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, HttpUrl, ValidationError
 
 
-class ScreeningFormData(BaseModel):
-    """Form data for adverse media screening request."""
+class PersonData(BaseModel):
+    """Person details supplied by the analyst."""
 
-    url: HttpUrl = Field(..., description="Article URL to screen")
     first_name: str = Field(..., min_length=1, description="Person's first name")
     last_name: str = Field(..., min_length=1, description="Person's last name")
     middle_names: str | None = Field(None, description="Optional middle name(s)")
@@ -19,6 +19,31 @@ class ScreeningFormData(BaseModel):
         None, description="Date of birth in YYYY-MM-DD format"
     )
 
+    @property
+    def full_name(self) -> str:
+        """Construct full name from components."""
+        parts = [self.first_name]
+        if self.middle_names:
+            parts.append(self.middle_names)
+        parts.append(self.last_name)
+        return " ".join(parts)
+
+    @property
+    def birth_year(self) -> int | None:
+        """Extract birth year from date of birth."""
+        return self.date_of_birth.year if self.date_of_birth else None
+
+    @property
+    def dob_string(self) -> str | None:
+        """Date of birth as ISO string for QueryPerson."""
+        return self.date_of_birth.isoformat() if self.date_of_birth else None
+
+
+class ScreeningFormData(PersonData):
+    """Form data for adverse media screening request."""
+
+    url: HttpUrl = Field(..., description="Article URL to screen")
+
     @classmethod
     def as_form(
         cls,
@@ -29,7 +54,8 @@ class ScreeningFormData(BaseModel):
         date_of_birth: str | None = Form(None),
     ) -> "ScreeningFormData":
         """Parse form data into ScreeningFormData model."""
-        return cls(
+        return _parse_form(
+            cls,
             url=url,
             first_name=first_name,
             last_name=last_name,
@@ -37,21 +63,50 @@ class ScreeningFormData(BaseModel):
             date_of_birth=date_of_birth,
         )
 
-    @property
-    def full_name(self) -> str:
-        """Construct full name from components."""
-        parts = [self.first_name]
-        if self.middle_names:
-            parts.append(self.middle_names)
-        parts.append(self.last_name)
-        return " ".join(parts)
 
-    @property
-    def birth_year(self) -> int | None:
-        """Extract birth year from date of birth."""
-        return self.date_of_birth.year if self.date_of_birth else None
+class JobFormData(ScreeningFormData):
+    """Form data for a background screening job."""
 
-    @property
-    def dob_string(self) -> str | None:
-        """Date of birth as ISO string for QueryPerson."""
-        return self.date_of_birth.isoformat() if self.date_of_birth else None
+    callback_url: HttpUrl | None = Field(
+        None, description="Optional http(s) URL that receives the finished job"
+    )
+
+    @classmethod
+    def as_form(
+        cls,
+        url: str = Form(...),
+        first_name: str = Form(...),
+        last_name: str = Form(...),
+        middle_names: str | None = Form(None),
+        date_of_birth: str | None = Form(None),
+        callback_url: str | None = Form(None),
+    ) -> "JobFormData":
+        """Parse form data into JobFormData model."""
+        return _parse_form(
+            cls,
+            url=url,
+            first_name=first_name,
+            last_name=last_name,
+            middle_names=middle_names,
+            date_of_birth=date_of_birth,
+            callback_url=callback_url or None,
+        )
+
+
+class BatchScreeningRequest(BaseModel):
+    """JSON body for screening many persons against one article."""
+
+    url: HttpUrl = Field(..., description="Article URL to screen")
+    persons: list[PersonData] = Field(
+        ..., min_length=1, max_length=50, description="Persons to screen"
+    )
+
+
+def _parse_form(model: type[BaseModel], **fields) -> BaseModel:
+    """Validate form fields, reporting invalid ones as a 422 like body fields."""
+    try:
+        return model(**fields)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        ) from e
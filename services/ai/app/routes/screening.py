@@ -2,21 +2,48 @@
 Screening router for adverse media analysis.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
 
-from app.dependencies import get_results_storage, get_screening_pipeline
-from app.models.forms import ScreeningFormData
-from app.services.matching.models import QueryPerson
-from app.services.results.models import ResultMetadata
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+
+from app.dependencies import (
+    get_job_queue,
+    get_job_runner,
+    get_result_persister,
+    get_results_storage,
+    get_screening_pipeline,
+)
+from app.models.forms import BatchScreeningRequest, JobFormData, ScreeningFormData
+from app.services.jobs import JobQueue, JobRunner, ScreeningJob
+from app.services.matching.models import MatchDecision, QueryPerson
+from app.services.results.models import (
+    ResultQuery,
+    ResultSearchPage,
+    ResultSort,
+    ResultsPage,
+)
+from app.services.results.persister import ResultPersister
 from app.services.results.storage import ResultsStorage
 from app.services.screening.models import ScreeningResult
 from app.services.screening_pipeline import ScreeningPipeline
 
 router = APIRouter(prefix="/screening", tags=["screening"])
 
+# Saved results never change, but an app upgrade can change how older ones are
+# served (their ETag changes with it), so clients revalidate after an hour
+RESULT_CACHE_CONTROL = "private, max-age=3600"
+
 
 @router.post("/screen", response_model=ScreeningResult)
-def screen_article(
+async def screen_article(
     form_data: ScreeningFormData = Depends(ScreeningFormData.as_form),
     pipeline: ScreeningPipeline = Depends(get_screening_pipeline),
 ):
@@ -40,35 +67,220 @@ def screen_article(
     query_person = QueryPerson(
         name=form_data.full_name, date_of_birth=form_data.dob_string
     )
-    return pipeline.screen(str(form_data.url), query_person)
+    return await pipeline.ascreen(str(form_data.url), query_person)
 
 
-@router.get("/results", response_model=list[ResultMetadata])
-def list_results(storage: ResultsStorage = Depends(get_results_storage)):
+@router.post("/batch", response_model=list[ScreeningResult])
+async def screen_batch(
+    request: BatchScreeningRequest,
+    pipeline: ScreeningPipeline = Depends(get_screening_pipeline),
+):
     """
-    List all saved screening results.
+    Screen many persons against one article in a single request.
 
-    Returns results filtered by current schema version,
-    ordered by creation date (newest first).
+    The article is scraped, assessed for credibility and extracted once; all
+    persons are matched concurrently and sentiment runs once per unique
+    matched entity.
+
+    Accepts JSON with:
+    - url: Article URL (validated)
+    - persons: List of {first_name, last_name, middle_names?, date_of_birth?}
+
+    Returns one screening result per person, in request order.
     """
-    return storage.list_results()
+    query_persons = [
+        QueryPerson(name=person.full_name, date_of_birth=person.dob_string)
+        for person in request.persons
+    ]
+    return await pipeline.ascreen_batch(str(request.url), query_persons)
+
+
+@router.post("/jobs", response_model=ScreeningJob, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    form_data: JobFormData = Depends(JobFormData.as_form),
+    runner: JobRunner = Depends(get_job_runner),
+):
+    """
+    Queue a screening to run in the background.
+
+    Accepts the same form data as /screen, plus:
+    - callback_url: Optional http(s) URL that receives the finished job as JSON
+      (public hosts only, or those in JOB_CALLBACK_ALLOWED_HOSTS)
+
+    Returns the queued job immediately; poll /jobs/{job_id} for its status.
+    Once it succeeds, result_id points at the saved screening result.
+
+    Raises:
+        HTTPException: 422 if callback_url points at a host that is not allowed
+    """
+    query_person = QueryPerson(
+        name=form_data.full_name, date_of_birth=form_data.dob_string
+    )
+    callback_url = str(form_data.callback_url) if form_data.callback_url else None
+    try:
+        return await runner.submit(str(form_data.url), query_person, callback_url)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get("/jobs/{job_id}", response_model=ScreeningJob)
+def get_job(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    """
+    Get the status of a background screening job.
+
+    Raises:
+        HTTPException: 404 if job not found
+    """
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/results", response_model=ResultsPage)
+def list_results(
+    person_name: str | None = None,
+    url: str | None = None,
+    domain: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    match_decision: MatchDecision | None = None,
+    risk_category: str | None = None,
+    sort: ResultSort = ResultSort.NEWEST,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    storage: ResultsStorage = Depends(get_results_storage),
+):
+    """
+    List saved screening results for the current schema version, paginated.
+
+    Query parameters:
+    - person_name: Words of the screened person's name (the last may be partial)
+    - url / domain: Exact article URL, or article domain (includes subdomains)
+    - created_from / created_to: Inclusive creation time range (ISO 8601)
+    - match_decision: Primary match decision (no_match if nothing matched)
+    - risk_category: Highest sentiment risk category
+    - sort: newest (default), oldest or person_name
+    - limit: Page size (1-200, default 50)
+    - cursor: next_cursor from the previous page
+
+    Returns a page of result metadata and the cursor for the next page
+    (null on the last page).
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid for this sort order, or
+            person_name has no searchable terms
+    """
+    query = ResultQuery(
+        person_name=person_name,
+        url=url,
+        domain=domain,
+        created_from=created_from,
+        created_to=created_to,
+        match_decision=match_decision,
+        risk_category=risk_category,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+    )
+    try:
+        return storage.list_results(query)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/results/search", response_model=ResultSearchPage)
+def search_results(
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    storage: ResultsStorage = Depends(get_results_storage),
+):
+    """
+    Full-text search over saved screening results.
+
+    Matches the screened person, entity names and aliases, organisations,
+    allegation categories and descriptions, the article title and sentences
+    mentioning entities. All words must match; use "quotes" for phrases.
+
+    Query parameters:
+    - q: Search text
+    - limit: Page size (1-100, default 20)
+    - offset: Hits to skip (use next_offset from the previous page)
+
+    Returns hits ranked by relevance, each with a highlighted snippet.
+
+    Raises:
+        HTTPException: 400 if the query has no searchable terms
+    """
+    try:
+        return storage.search_results(q, limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/results/{result_id}", response_model=ScreeningResult)
-def get_result(result_id: str, storage: ResultsStorage = Depends(get_results_storage)):
+def get_result(
+    result_id: str,
+    fields: str | None = None,
+    if_none_match: str | None = Header(None),
+    storage: ResultsStorage = Depends(get_results_storage),
+    persister: ResultPersister = Depends(get_result_persister),
+):
     """
     Get a specific screening result by ID.
 
+    The stored JSON is sent as-is (no re-validation) with a strong ETag;
+    a matching If-None-Match gets 304 Not Modified without reading the result.
+    A result that is still queued for saving is served from memory (uncached).
+
     Args:
         result_id: UUID of the result to retrieve
+        fields: Optional comma-separated top-level fields to return, e.g.
+            "matching,sentiment"; only those sections are read from disk
 
     Returns:
-        Complete screening result with all analysis data
+        Complete screening result with all analysis data (or the requested
+        fields only)
 
     Raises:
-        HTTPException: 404 if result not found
+        HTTPException: 400 if fields names an unknown field, 404 if result
+            not found
     """
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    if field_list:
+        try:
+            field_list = storage.resolve_fields(field_list)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    pending = persister.get_pending(result_id)
+    if pending is not None:
+        include = set(field_list) if field_list else None
+        return Response(
+            content=pending.model_dump_json(include=include),
+            media_type="application/json",
+            headers={"Cache-Control": "no-store"},
+        )
+
+    etag = storage.get_result_etag(result_id, field_list)
+    if etag is None:
+        raise HTTPException(status_code=404, detail="Result not found")
+
+    headers = {"ETag": etag, "Cache-Control": RESULT_CACHE_CONTROL}
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     try:
-        return storage.get_result(result_id)
+        body = storage.get_result_json(result_id, field_list)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Result not found")
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, per RFC 9110: W/ prefixes are ignored)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
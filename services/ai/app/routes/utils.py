@@ -1,6 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from app.schemas.utils import HealthResponse
+from app.container import ServiceContainer
+from app.dependencies import get_container
+from app.schemas.utils import HealthResponse, MetricsResponse
 
 router = APIRouter()
 
@@ -8,3 +10,22 @@ router = APIRouter()
 @router.get("/health", response_model=HealthResponse)
 async def health():
     return HealthResponse(message="OK")
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def metrics(container: ServiceContainer = Depends(get_container)):
+    """
+    Process-level counters: result write-behind queue, caches, extraction pool
+    and per-host scrape scheduling.
+    """
+    return MetricsResponse(
+        results_persister=container.result_persister.stats(),
+        llm_cache=container.llm_cache.stats() if container.llm_cache else None,
+        http_cache=container.http_cache.stats() if container.http_cache else None,
+        extraction_pool=(
+            container.extraction_pool.stats() if container.extraction_pool else None
+        ),
+        host_scheduler=(
+            container.host_scheduler.stats() if container.host_scheduler else None
+        ),
+    )
@@ -1,5 +1,18 @@
 from pydantic import BaseModel
 
+from app.services.results.persister import PersisterStats
+from app.utils.disk_cache import CacheStats
+from app.utils.extraction_pool import ExtractionPoolStats
+from app.utils.host_scheduler import SchedulerStats
+
 
 class HealthResponse(BaseModel):
     message: str
+
+
+class MetricsResponse(BaseModel):
+    results_persister: PersisterStats
+    llm_cache: CacheStats | None = None
+    http_cache: CacheStats | None = None
+    extraction_pool: ExtractionPoolStats | None = None
+    host_scheduler: SchedulerStats | None = None
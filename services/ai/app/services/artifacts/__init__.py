@@ -0,0 +1,6 @@
+"""Per-article analysis artifacts reused across screenings."""
+
+from .models import ArticleArtifacts
+from .store import ArticleArtifactStore, article_content_hash
+
+__all__ = ["ArticleArtifacts", "ArticleArtifactStore", "article_content_hash"]
@@ -0,0 +1,83 @@
+"""
+MinHash fingerprints for near-duplicate article detection.
+
+Syndicated wire stories reach many domains almost word for word, give or take
+a byline, a headline tweak or a trailing "related stories" paragraph. The
+share of word shingles two articles have in common (their Jaccard similarity)
+is close to 1 for such copies and low for unrelated articles; a MinHash
+signature estimates it from NUM_HASHES small integers.
+
+For lookup, signatures are split into LSH bands: articles sharing any whole
+band are candidates, which catches pairs above roughly 0.5 similarity almost
+surely, and the candidates' signatures are then compared in full.
+"""
+
+import hashlib
+import random
+import re
+
+# Words per shingle (overlapping word n-grams)
+SHINGLE_WORDS = 3
+# Texts with fewer words give unreliable signatures and are not indexed
+MIN_WORDS = 50
+NUM_HASHES = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_HASHES // BANDS
+
+_PRIME = (1 << 61) - 1
+# Fixed seed: signatures are stored, so the hash family must never change
+_rng = random.Random(0x5EED)
+_HASH_PARAMS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_HASHES)
+]
+_WORD = re.compile(r"\w+")
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def minhash(text: str) -> list[int] | None:
+    """
+    MinHash signature of a text's word shingles, or None if it is too short.
+
+    Example:
+        >>> similarity(minhash(story), minhash(story + " Reporting by X.")) > 0.9
+        True
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return None
+    shingles = {
+        _hash64(" ".join(words[i : i + SHINGLE_WORDS]).encode("utf-8"))
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+    return [min((a * x + b) % _PRIME for x in shingles) for a, b in _HASH_PARAMS]
+
+
+def similarity(a: list[int], b: list[int]) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_HASHES
+
+
+def band_keys(signature: list[int]) -> list[int]:
+    """
+    One key per LSH band, as signed 64-bit integers (SQLite's INTEGER range).
+
+    The band's position is part of the key, so equal keys mean the same band
+    matched.
+    """
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        key = _hash64(f"{band}:{','.join(map(str, rows))}".encode("ascii"))
+        keys.append(key - (1 << 64) if key >= 1 << 63 else key)
+    return keys
+
+
+def encode_signature(signature: list[int]) -> bytes:
+    return b"".join(value.to_bytes(8, "big") for value in signature)
+
+
+def decode_signature(data: bytes) -> list[int]:
+    return [int.from_bytes(data[i : i + 8], "big") for i in range(0, len(data), 8)]
@@ -0,0 +1,38 @@
+"""
+Data models for per-article analysis artifacts.
+
+Credibility and entity extraction depend only on the article, not on the
+person being screened, so their results can be shared by every screening of
+the same article.
+"""
+
+from pydantic import BaseModel
+
+from app.models.articles import Article
+from app.services.credibility.models import CredibilityResult
+from app.services.extraction.models import ExtractionResult
+
+
+class ArticleArtifacts(BaseModel):
+    """
+    Query-independent analysis of one article.
+
+    Attributes:
+        url_key: Normalised article URL
+        content_hash: Hash of the scraped title and content
+        article: Scraped article
+        credibility: Credibility result, if assessed
+        credibility_stamp: version_stamp of the analyser that produced it
+        extraction: Entity extraction result, if extracted
+        extraction_stamp: version_stamp of the extractor that produced it
+        created_at: Unix timestamp when the article was scraped
+    """
+
+    url_key: str
+    content_hash: str
+    article: Article
+    credibility: CredibilityResult | None = None
+    credibility_stamp: str | None = None
+    extraction: ExtractionResult | None = None
+    extraction_stamp: str | None = None
+    created_at: float
@@ -0,0 +1,216 @@
+"""
+SQLite-backed store for per-article analysis artifacts.
+
+Keyed by canonical URL and content hash. A fresh entry for a URL lets a
+screening skip scraping entirely; an entry for the same URL and content lets
+it skip credibility and extraction even after a re-scrape. A MinHash index
+over article content finds near-duplicates (syndicated copies on other
+domains) whose extraction can be reused.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+
+from app.models.articles import Article
+from app.utils.logger import get_logger
+from app.utils.sqlite import ThreadLocalConnection
+from app.utils.urls import canonical_url
+
+from .fingerprint import (
+    band_keys,
+    decode_signature,
+    encode_signature,
+    minhash,
+    similarity,
+)
+from .models import ArticleArtifacts
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    url_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (url_key, content_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_url_created
+    ON artifacts (url_key, created_at);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    url_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (url_key, content_hash)
+);
+CREATE TABLE IF NOT EXISTS fingerprint_bands (
+    band_key INTEGER NOT NULL,
+    url_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (url_key, content_hash, band_key)
+);
+CREATE INDEX IF NOT EXISTS idx_fingerprint_bands_key
+    ON fingerprint_bands (band_key);
+"""
+
+
+def article_content_hash(article: Article) -> str:
+    """Hash an article's title and content (URL excluded)."""
+    payload = f"{article.title}\n{article.content}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ArticleArtifactStore:
+    """
+    Stores Article, CredibilityResult and ExtractionResult per article.
+
+    Entries older than ttl_seconds are ignored and purged on write, so changed
+    articles are eventually re-scraped and re-analysed.
+    """
+
+    def __init__(self, db_path: Path, ttl_seconds: float, logger=None) -> None:
+        """
+        Initialise artifact store.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+            ttl_seconds: How long stored artifacts may be reused
+            logger: Optional logger instance
+        """
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger or get_logger(service="artifacts")
+        self._db = ThreadLocalConnection(db_path)
+        self._db.get().executescript(SCHEMA)
+
+    def get_latest(self, url_key: str) -> ArticleArtifacts | None:
+        """
+        Return the most recent fresh artifacts for a URL, if any.
+        """
+        row = (
+            self._db.get()
+            .execute(
+                "SELECT data FROM artifacts WHERE url_key = ? AND created_at >= ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (url_key, self._cutoff()),
+            )
+            .fetchone()
+        )
+        return ArticleArtifacts.model_validate_json(row["data"]) if row else None
+
+    def get(self, url_key: str, content_hash: str) -> ArticleArtifacts | None:
+        """
+        Return fresh artifacts for a URL and exact article content, if any.
+        """
+        row = (
+            self._db.get()
+            .execute(
+                "SELECT data FROM artifacts "
+                "WHERE url_key = ? AND content_hash = ? AND created_at >= ?",
+                (url_key, content_hash, self._cutoff()),
+            )
+            .fetchone()
+        )
+        return ArticleArtifacts.model_validate_json(row["data"]) if row else None
+
+    def find_near_duplicate(
+        self,
+        article: Article,
+        min_similarity: float,
+        exclude_url_keys: frozenset[str] = frozenset(),
+    ) -> ArticleArtifacts | None:
+        """
+        Return fresh artifacts for the most similar indexed article, if its
+        estimated content similarity (Jaccard, 0-1) is at least min_similarity.
+
+        Articles stored under, or declaring as canonical, one of
+        exclude_url_keys are skipped: those are earlier versions of the same
+        page rather than copies. Articles too short to fingerprint never match.
+        """
+        signature = minhash(article.content)
+        if signature is None:
+            return None
+        keys = band_keys(signature)
+        rows = (
+            self._db.get()
+            .execute(
+                "SELECT a.data, f.signature FROM fingerprints f "
+                "JOIN artifacts a USING (url_key, content_hash) "
+                "WHERE (f.url_key, f.content_hash) IN ("
+                "SELECT url_key, content_hash FROM fingerprint_bands "
+                f"WHERE band_key IN ({', '.join('?' * len(keys))})"
+                ") AND a.created_at >= ?",
+                (*keys, self._cutoff()),
+            )
+            .fetchall()
+        )
+        candidates = []
+        for row in rows:
+            score = similarity(signature, decode_signature(row["signature"]))
+            if score >= min_similarity:
+                candidates.append((score, row["data"]))
+        for score, data in sorted(candidates, key=lambda c: c[0], reverse=True):
+            artifacts = ArticleArtifacts.model_validate_json(data)
+            declared = artifacts.article.canonical_url
+            if artifacts.url_key in exclude_url_keys or (
+                declared and canonical_url(declared) in exclude_url_keys
+            ):
+                continue
+            self.logger.info(
+                "Near-duplicate of {} found (similarity {:.2f})",
+                artifacts.url_key,
+                score,
+            )
+            return artifacts
+        return None
+
+    def put(self, artifacts: ArticleArtifacts) -> None:
+        """
+        Insert or replace artifacts, purging expired entries.
+        """
+        conn = self._db.get()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts "
+                "(url_key, content_hash, data, created_at) VALUES (?, ?, ?, ?)",
+                (
+                    artifacts.url_key,
+                    artifacts.content_hash,
+                    artifacts.model_dump_json(),
+                    artifacts.created_at,
+                ),
+            )
+            self._index(conn, artifacts)
+            for table in ("artifacts", "fingerprints", "fingerprint_bands"):
+                conn.execute(
+                    f"DELETE FROM {table} WHERE created_at < ?", (self._cutoff(),)
+                )
+        self.logger.info(
+            "Stored article artifacts for {} ({})",
+            artifacts.url_key,
+            artifacts.content_hash[:12],
+        )
+
+    def _index(self, conn, artifacts: ArticleArtifacts) -> None:
+        """Add the article's MinHash signature and LSH band keys to the index."""
+        signature = minhash(artifacts.article.content)
+        if signature is None:
+            return
+        key = (artifacts.url_key, artifacts.content_hash)
+        conn.execute(
+            "INSERT OR REPLACE INTO fingerprints "
+            "(url_key, content_hash, signature, created_at) VALUES (?, ?, ?, ?)",
+            (*key, encode_signature(signature), artifacts.created_at),
+        )
+        conn.execute(
+            "DELETE FROM fingerprint_bands WHERE url_key = ? AND content_hash = ?",
+            key,
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO fingerprint_bands "
+            "(band_key, url_key, content_hash, created_at) VALUES (?, ?, ?, ?)",
+            [(band, *key, artifacts.created_at) for band in band_keys(signature)],
+        )
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl_seconds
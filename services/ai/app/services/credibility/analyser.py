@@ -14,11 +14,14 @@ from langchain_core.prompts import ChatPromptTemplate
 
 from app.models.articles import Article
 from app.models.llm_metadata import AnalyserMetadata
+from app.services.llm_cache import LLMResponseCache, build_chain
 from app.utils.logger import get_logger
 
 from .models import CredibilityAssessment, CredibilityResult
 from .prompt import CREDIBILITY_PROMPT, PROMPT_VERSION
 
+ANALYSER_VERSION = "0.1.0"
+
 
 class CredibilityAnalyser:
     """
@@ -43,6 +46,7 @@ class CredibilityAnalyser:
         provider,
         model_name: str,
         logger=get_logger(service="credibility"),
+        cache: LLMResponseCache | None = None,
     ):
         """
         Initialize credibility analyser with LLM.
@@ -50,6 +54,7 @@ class CredibilityAnalyser:
         Args:
             llm: Language model to use
             logger: Logger instance
+            cache: Optional LLM response cache
 
         NOTE: Consider using cheaper models for credibility assessment
         (gpt-4o-mini, claude-haiku) as this runs before extraction and may
@@ -60,6 +65,47 @@ class CredibilityAnalyser:
         self.provider = provider
         self.model_name = model_name
 
+        # Setup Pydantic parser, prompt template and LCEL chain once
+        self.parser = PydanticOutputParser(pydantic_object=CredibilityAssessment)
+        self.prompt_template = ChatPromptTemplate.from_template(CREDIBILITY_PROMPT)
+        self.chain = build_chain(
+            self.prompt_template,
+            self.llm,
+            self.parser,
+            cache=cache,
+            provider=self.provider,
+            model_name=self.model_name,
+            prompt_version=PROMPT_VERSION,
+        )
+
+    @property
+    def version_stamp(self) -> str:
+        """Identifies the model, analyser and prompt that produce a result."""
+        return ":".join(
+            [self.provider.value, self.model_name, ANALYSER_VERSION, PROMPT_VERSION]
+        )
+
+    def compose_prompt(self, article: Article) -> dict:
+        """Build prompt data from the article and format instructions."""
+        return {
+            **article.model_dump(),
+            "format_instructions": self.parser.get_format_instructions(),
+        }
+
+    def build_result(
+        self, assessment: CredibilityAssessment, processing_time: float
+    ) -> CredibilityResult:
+        """Wrap the parsed assessment with analyser metadata."""
+        metadata = AnalyserMetadata(
+            processed_at=datetime.now().isoformat(),
+            processing_time_seconds=round(processing_time, 2),
+            llm_provider=str(self.provider.value),
+            llm_model=self.model_name,
+            analyser_version=ANALYSER_VERSION,
+            prompt_version=PROMPT_VERSION,
+        )
+        return CredibilityResult(assessment=assessment, metadata=metadata)
+
     def assess(self, article: Article) -> CredibilityResult:
         """
         Assess article credibility via LLM signal extraction.
@@ -76,42 +122,29 @@ class CredibilityAnalyser:
         self.logger.info("Assessing credibility for: {}", article.title)
         start_time = time.time()
 
-        # Setup Pydantic parser for structured output
-        parser = PydanticOutputParser(pydantic_object=CredibilityAssessment)
-
-        # Create prompt template
-        prompt = ChatPromptTemplate.from_template(CREDIBILITY_PROMPT)
-
-        # Build chain with LCEL
-        chain = prompt | self.llm | parser
-
-        prompt_data = {
-            **article.model_dump(),
-            "format_instructions": parser.get_format_instructions(),
-        }
-
         try:
             # Invoke chain with article data
-            assessment: CredibilityAssessment = chain.invoke(prompt_data)
-
-            # Build metadata
-            processing_time = time.time() - start_time
-
-            metadata = AnalyserMetadata(
-                processed_at=datetime.now().isoformat(),
-                processing_time_seconds=round(processing_time, 2),
-                llm_provider=str(self.provider.value),
-                llm_model=self.model_name,
-                analyser_version="0.1.0",
-                prompt_version=PROMPT_VERSION,
+            assessment: CredibilityAssessment = self.chain.invoke(
+                self.compose_prompt(article)
             )
+            return self.build_result(assessment, time.time() - start_time)
 
-            credibility_result = CredibilityResult(
-                assessment=assessment,
-                metadata=metadata,
-            )
+        except Exception as e:
+            self.logger.exception("Credibility assessment failed: {}", e)
+            raise
 
-            return credibility_result
+    async def aassess(self, article: Article) -> CredibilityResult:
+        """
+        Async variant of assess() using the chain's ainvoke.
+        """
+        self.logger.info("Assessing credibility for: {}", article.title)
+        start_time = time.time()
+
+        try:
+            assessment: CredibilityAssessment = await self.chain.ainvoke(
+                self.compose_prompt(article)
+            )
+            return self.build_result(assessment, time.time() - start_time)
 
         except Exception as e:
             self.logger.exception("Credibility assessment failed: {}", e)
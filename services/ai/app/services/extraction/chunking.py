@@ -0,0 +1,96 @@
+"""
+Token-aware splitting of long articles for chunked entity extraction.
+
+The model's own tokenizer (get_num_tokens) sizes the whole article once; the
+text is then packed into chunks of whole paragraphs (or sentences, for
+paragraphs too long on their own) using the article's characters-per-token
+ratio. Each chunk repeats the tail of the previous one, so mentions and
+coreferences near a boundary are seen with some context.
+"""
+
+import re
+
+from langchain_core.language_models import BaseChatModel
+
+# Rough ratio for English text, used when the model cannot count tokens
+FALLBACK_CHARS_PER_TOKEN = 4.0
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def count_tokens(llm: BaseChatModel, text: str) -> int:
+    """Tokens in text per the model's tokenizer, or an estimate if unavailable."""
+    try:
+        return llm.get_num_tokens(text)
+    except Exception:
+        return int(len(text) / FALLBACK_CHARS_PER_TOKEN)
+
+
+def split_text(
+    text: str, total_tokens: int, max_tokens: int, overlap_tokens: int
+) -> list[str]:
+    """
+    Split text into chunks of about max_tokens, overlapping by overlap_tokens.
+
+    Args:
+        text: Article text (paragraphs separated by blank lines)
+        total_tokens: Token count of the whole text
+        max_tokens: Token budget per chunk
+        overlap_tokens: Tokens of trailing context repeated in the next chunk
+
+    Returns:
+        [text] if it fits in one chunk, otherwise the chunks in order
+    """
+    if total_tokens <= max_tokens or not text:
+        return [text]
+    chars_per_token = len(text) / max(total_tokens, 1)
+    max_chars = int(max_tokens * chars_per_token)
+    # At most half a chunk, so every chunk adds new text
+    overlap_chars = min(int(overlap_tokens * chars_per_token), max_chars // 2)
+
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for unit in _units(text, max_chars):
+        if current and size + len(unit) > max_chars:
+            chunks.append("\n\n".join(current))
+            current = _tail(current, overlap_chars)
+            size = sum(len(part) for part in current)
+        current.append(unit)
+        size += len(unit)
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def _units(text: str, max_chars: int) -> list[str]:
+    """Paragraphs, with any longer than max_chars split into sentences."""
+    units = []
+    for paragraph in (p.strip() for p in text.split("\n\n")):
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            units.append(paragraph)
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            # A single sentence over the budget is cut at word boundaries
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                units.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            if sentence:
+                units.append(sentence)
+    return units
+
+
+def _tail(units: list[str], max_chars: int) -> list[str]:
+    """The last units of a chunk fitting within max_chars (the overlap)."""
+    tail: list[str] = []
+    size = 0
+    for unit in reversed(units):
+        if size + len(unit) > max_chars:
+            break
+        tail.insert(0, unit)
+        size += len(unit)
+    return tail
@@ -1,9 +1,17 @@
 """
 Entity extraction from articles using LLM-based approach.
+
+Long articles are split into overlapping token-bounded chunks (see
+chunking.py), extracted in parallel and merged (see merge.py), so latency
+follows the slowest chunk rather than the article's length. The model cites
+mentions and evidence by sentence id (see app.utils.sentences); ids are
+resolved to text and offsets in postprocess.
 """
 
+import asyncio
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 from langchain_core.language_models import BaseChatModel
@@ -12,12 +20,19 @@ from langchain_core.prompts import ChatPromptTemplate
 
 from app.config import LLMProviderType
 from app.models.articles import Article
+from app.models.evidence import EvidenceSpan
 from app.models.llm_metadata import AnalyserMetadata
+from app.services.llm_cache import LLMResponseCache, build_chain
 from app.utils.logger import get_logger
+from app.utils.sentences import SentenceIndex
 
-from .models import EntitiesOutput, ExtractionResult
+from .chunking import count_tokens, split_text
+from .merge import merge_entities
+from .models import EntitiesOutput, Entity, ExtractionResult
 from .prompt import EXTRACTION_PROMPT, PROMPT_VERSION
 
+ANALYSER_VERSION = "0.4.0"
+
 
 class EntityExtractor:
     """
@@ -45,15 +60,27 @@ class EntityExtractor:
         provider: LLMProviderType,
         model_name: str,
         logger=get_logger(service="extraction"),
+        cache: LLMResponseCache | None = None,
+        chunk_max_tokens: int = 4000,
+        chunk_overlap_tokens: int = 200,
+        max_concurrency: int = 4,
     ):
         """
-        Initialise extractor with an LLM.
+        Initialise extractor with an LLM and optional response cache.
 
+        Args:
+            chunk_max_tokens: Article tokens per LLM call; longer articles are
+                split into chunks extracted in parallel
+            chunk_overlap_tokens: Trailing context repeated in the next chunk
+            max_concurrency: Max in-flight chunk extractions per article
         """
         self.llm = llm
         self.logger = logger
         self.provider = provider
         self.model_name = model_name
+        self.chunk_max_tokens = chunk_max_tokens
+        self.chunk_overlap_tokens = chunk_overlap_tokens
+        self.max_concurrency = max_concurrency
         self.logger.info(
             "Initialised EntityExtractor provider={} model={}",
             self.provider,
@@ -63,16 +90,41 @@ class EntityExtractor:
         # Setup parser and prompt template
         self.parser = PydanticOutputParser(pydantic_object=EntitiesOutput)
         self.prompt_template = ChatPromptTemplate.from_template(EXTRACTION_PROMPT)
-        self.chain = self.prompt_template | self.llm | self.parser
+        self.chain = build_chain(
+            self.prompt_template,
+            self.llm,
+            self.parser,
+            cache=cache,
+            provider=self.provider,
+            model_name=self.model_name,
+            prompt_version=PROMPT_VERSION,
+        )
 
-    def preprocess(self, article: Article) -> dict:
-        """Prepare input for the model."""
-        return {
-            "article_text": article.content,
-            "format_instructions": self.parser.get_format_instructions(),
-        }
+    @property
+    def version_stamp(self) -> str:
+        """Identifies the model, analyser and prompt that produce a result."""
+        return ":".join(
+            [self.provider.value, self.model_name, ANALYSER_VERSION, PROMPT_VERSION]
+        )
+
+    def preprocess(self, article: Article) -> list[dict]:
+        """Prepare model input per chunk of the article (usually just one)."""
+        text = SentenceIndex.for_article(article).render()
+        chunks = split_text(
+            text,
+            total_tokens=count_tokens(self.llm, text),
+            max_tokens=self.chunk_max_tokens,
+            overlap_tokens=self.chunk_overlap_tokens,
+        )
+        if len(chunks) > 1:
+            self.logger.info("Article split into {} chunks for extraction", len(chunks))
+        format_instructions = self.parser.get_format_instructions()
+        return [
+            {"article_text": chunk, "format_instructions": format_instructions}
+            for chunk in chunks
+        ]
 
-    def compose_prompt(self, preprocessed_input: dict) -> dict:
+    def compose_prompt(self, preprocessed_input: list[dict]) -> list[dict]:
         """Compose prompt data (already done in preprocess for this analyser)."""
         return preprocessed_input
 
@@ -80,25 +132,128 @@ class EntityExtractor:
         """Invoke LLM chain and return parsed output."""
         return self.chain.invoke(prompt_data)
 
+    async def ainvoke_model(self, prompt_data: dict) -> EntitiesOutput:
+        """Invoke LLM chain asynchronously and return parsed output."""
+        return await self.chain.ainvoke(prompt_data)
+
+    def invoke_chunks(self, prompts: list[dict]) -> EntitiesOutput:
+        """Extract every chunk, in parallel threads, and merge the outputs."""
+        if len(prompts) == 1:
+            return self.invoke_model(prompts[0])
+        workers = min(self.max_concurrency, len(prompts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outputs = list(executor.map(self.invoke_model, prompts))
+        return self.merge(outputs)
+
+    async def ainvoke_chunks(self, prompts: list[dict]) -> EntitiesOutput:
+        """Async variant of invoke_chunks, bounded by max_concurrency."""
+        if len(prompts) == 1:
+            return await self.ainvoke_model(prompts[0])
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(prompt_data: dict) -> EntitiesOutput:
+            async with semaphore:
+                return await self.ainvoke_model(prompt_data)
+
+        tasks = [asyncio.create_task(bounded(prompt)) for prompt in prompts]
+        try:
+            outputs = list(await asyncio.gather(*tasks))
+        except Exception:
+            # Don't leave sibling LLM calls running after a failure
+            for task in tasks:
+                task.cancel()
+            raise
+        return self.merge(outputs)
+
+    def merge(self, outputs: list[EntitiesOutput]) -> EntitiesOutput:
+        """Combine per-chunk outputs, deduplicating entities across chunks."""
+        entities = merge_entities([output.entities for output in outputs])
+        self.logger.info(
+            "Merged {} chunk entities into {}",
+            sum(len(output.entities) for output in outputs),
+            len(entities),
+        )
+        return EntitiesOutput(entities=entities)
+
     def postprocess(
         self, output: EntitiesOutput, article: Article, processing_time: float
     ) -> ExtractionResult:
-        """Assign IDs, build metadata, construct result."""
-        # Assign unique IDs to each entity
+        """Assign IDs, resolve cited sentences, build metadata, construct result."""
+        index = SentenceIndex.for_article(article)
         for entity in output.entities:
             entity.id = str(uuid.uuid4())
+            self._resolve_evidence(entity, index)
 
         metadata = AnalyserMetadata(
             processed_at=datetime.now(timezone.utc).isoformat(),
             processing_time_seconds=round(processing_time, 2),
             llm_provider=str(self.provider.value),
             llm_model=self.model_name,
-            analyser_version="0.2.0",
+            analyser_version=ANALYSER_VERSION,
             prompt_version=PROMPT_VERSION,
         )
 
         return ExtractionResult(entities=output.entities, metadata=metadata)
 
+    def _resolve_evidence(self, entity: Entity, index: SentenceIndex) -> None:
+        """Fill in mention and evidence text and offsets from sentence ids."""
+        spans = [
+            span
+            for sentence_id in dict.fromkeys(entity.mention_sentence_ids)
+            if (span := index.span(sentence_id)) is not None
+        ]
+        dropped = len(entity.mention_sentence_ids) - len(spans)
+        if dropped:
+            self.logger.warning(
+                "Ignored {} unknown sentence ids for {}", dropped, entity.name
+            )
+        _set_mentions(entity, spans)
+
+        for record in [*entity.employments, *entity.relationships]:
+            record.evidence = index.resolve(
+                EvidenceSpan(
+                    sentence_id=record.evidence_sentence_id,
+                    quote=record.evidence_quote,
+                )
+            )
+            if record.evidence is not None:
+                record.evidence_quote = record.evidence.quote
+
+    def reanchor(
+        self, extraction: ExtractionResult, article: Article
+    ) -> ExtractionResult:
+        """
+        Copy of an extraction from another text, re-resolved against article.
+
+        Sentence ids and offsets only hold for the text they were resolved
+        against, so a near-duplicate's extraction is re-anchored by locating
+        its stored quotes in this article. Mentions that cannot be found are
+        dropped, as is evidence (leaving the record itself).
+        """
+        index = SentenceIndex.for_article(article)
+        result = extraction.model_copy(deep=True)
+        for entity in result.entities:
+            located = (index.locate(quote) for quote in entity.mention_sentences)
+            spans = list(
+                {
+                    span.start_index: span for span in located if span is not None
+                }.values()
+            )
+            _set_mentions(entity, sorted(spans, key=lambda span: span.start_index))
+
+            for record in [*entity.employments, *entity.relationships]:
+                quote = record.evidence.quote if record.evidence else ""
+                record.evidence = (
+                    index.locate(quote or record.evidence_quote)
+                    if quote or record.evidence_quote
+                    else None
+                )
+                record.evidence_sentence_id = (
+                    record.evidence.sentence_id if record.evidence else None
+                )
+                record.evidence_quote = record.evidence.quote if record.evidence else ""
+        return result
+
     def extract(self, article: Article) -> ExtractionResult:
         """
         Extract person entities from article using LLM with comprehensive metadata
@@ -111,7 +266,7 @@ class EntityExtractor:
             # Standard 4-phase lifecycle
             preprocessed = self.preprocess(article)
             prompt_data = self.compose_prompt(preprocessed)
-            output = self.invoke_model(prompt_data)
+            output = self.invoke_chunks(prompt_data)
             processing_time = time.time() - start_time
             extraction_result = self.postprocess(output, article, processing_time)
 
@@ -125,3 +280,41 @@ class EntityExtractor:
         except Exception as e:
             self.logger.exception("Entity extraction failed: {}", e)
             raise RuntimeError(f"Failed to extract entities: {e}")
+
+    async def aextract(self, article: Article) -> ExtractionResult:
+        """
+        Async variant of extract() using the chain's ainvoke.
+        """
+        self.logger.info("Extracting entities from article: {}", article.title)
+        start_time = time.time()
+
+        try:
+            # Token counting and sentence resolution are CPU-bound; keep them
+            # off the event loop
+            preprocessed = await asyncio.to_thread(self.preprocess, article)
+            prompt_data = self.compose_prompt(preprocessed)
+            output = await self.ainvoke_chunks(prompt_data)
+            processing_time = time.time() - start_time
+            extraction_result = await asyncio.to_thread(
+                self.postprocess, output, article, processing_time
+            )
+
+            self.logger.info(
+                "Successfully extracted {} entities in {:.2f}s",
+                len(extraction_result.entities),
+                processing_time,
+            )
+            return extraction_result
+
+        except Exception as e:
+            self.logger.exception("Entity extraction failed: {}", e)
+            raise RuntimeError(f"Failed to extract entities: {e}")
+
+
+def _set_mentions(entity: Entity, spans: list[EvidenceSpan]) -> None:
+    entity.mention_sentence_ids = [
+        span.sentence_id for span in spans if span.sentence_id is not None
+    ]
+    entity.mention_spans = spans
+    entity.mention_sentences = [span.quote for span in spans]
+    entity.mention_count = len(spans)
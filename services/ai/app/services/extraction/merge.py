@@ -0,0 +1,104 @@
+"""
+Merging of entities extracted from separate chunks of one article.
+
+The same person usually appears in several chunks (overlapping chunks repeat
+some sentences, too). Entities are the same person when one's name matches
+the other's name or one of its aliases, compared as in person matching
+(ignoring case, accents, punctuation and titles). Merged entities keep the
+first chunk's name and the union of everything else, without duplicates.
+Mentions and evidence are still sentence ids at this point; they are resolved
+to text once, after merging.
+"""
+
+from app.services.matching.utils import name_tokens
+
+from .models import EmploymentRecord, Entity, EntityRelationship
+
+
+def name_key(name: str) -> str:
+    """
+    Comparison key for a name: its name_tokens(), or the whole name if it is
+    only a title.
+
+    Example:
+        >>> name_key("Mr. John  O'Neill")
+        "john oneill"
+    """
+    return " ".join(name_tokens(name) or name.casefold().split())
+
+
+def merge_entities(chunks: list[list[Entity]]) -> list[Entity]:
+    """
+    Merge per-chunk entity lists into one, in order of first appearance.
+
+    Args:
+        chunks: Entities extracted from each chunk, in chunk order
+
+    Returns:
+        One entity per distinct person
+    """
+    merged: list[Entity] = []
+    keys: list[set[str]] = []  # Name and alias keys of each merged entity
+    for entity in (entity for chunk in chunks for entity in chunk):
+        own = {name_key(alias) for alias in entity.aliases} | {name_key(entity.name)}
+        for index, existing in enumerate(merged):
+            if name_key(entity.name) in keys[index] or name_key(existing.name) in own:
+                merged[index] = _merge_pair(existing, entity)
+                keys[index] |= own
+                break
+        else:
+            merged.append(entity.model_copy(deep=True))
+            keys.append(own)
+    return merged
+
+
+def _merge_pair(first: Entity, second: Entity) -> Entity:
+    aliases = _union(first.aliases, second.aliases + [second.name], key=name_key)
+    return first.model_copy(
+        update={
+            "aliases": [a for a in aliases if name_key(a) != name_key(first.name)],
+            "age": first.age or second.age,
+            "birth_year": first.birth_year or second.birth_year,
+            "date_of_birth": first.date_of_birth or second.date_of_birth,
+            "employments": _union(
+                first.employments, second.employments, key=_employment_key
+            ),
+            "locations": _union(first.locations, second.locations),
+            "nationalities": _union(first.nationalities, second.nationalities),
+            "place_of_birth": first.place_of_birth or second.place_of_birth,
+            "identifiers": _union(first.identifiers, second.identifiers),
+            "relationships": _union(
+                first.relationships, second.relationships, key=_relationship_key
+            ),
+            "mention_sentence_ids": sorted(
+                set(first.mention_sentence_ids) | set(second.mention_sentence_ids)
+            ),
+            "extraction_confidence": max(
+                first.extraction_confidence, second.extraction_confidence
+            ),
+        }
+    )
+
+
+def _union(first: list, second: list, key=None) -> list:
+    """Items of both lists in order, dropping later items with a seen key."""
+    key = key or (lambda item: item.strip().casefold())
+    seen = set()
+    items = []
+    for item in first + second:
+        item_key = key(item)
+        if item_key not in seen:
+            seen.add(item_key)
+            items.append(item)
+    return items
+
+
+def _employment_key(record: EmploymentRecord) -> tuple:
+    return (record.role.casefold(), (record.organization or "").casefold())
+
+
+def _relationship_key(relationship: EntityRelationship) -> tuple:
+    return (
+        name_key(relationship.related_entity_name),
+        relationship.relationship_type.casefold(),
+    )
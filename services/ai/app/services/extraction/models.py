@@ -1,7 +1,12 @@
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
+from app.models.evidence import EvidenceSpan
 from app.models.llm_metadata import AnalyserMetadata
 
+# Fields wrapped in SkipJsonSchema are filled in by the pipeline, not the LLM
+# (they are left out of the output schema the LLM is given)
+
 
 class EntityRelationship(BaseModel):
     """
@@ -13,7 +18,9 @@ class EntityRelationship(BaseModel):
     related_entity_name: str  # Name of the other person
     relationship_type: str  # worked_for, associate_of, investigated_by, sued_by
     description: str  # Human-readable description
-    evidence_quote: str  # Sentence describing relationship
+    evidence_sentence_id: int | None = None  # Sentence describing relationship
+    evidence_quote: SkipJsonSchema[str] = ""  # Text of that sentence
+    evidence: SkipJsonSchema[EvidenceSpan | None] = None  # With offsets
 
 
 class EmploymentRecord(BaseModel):
@@ -27,7 +34,9 @@ class EmploymentRecord(BaseModel):
     organization: str | None = None  # Which organization
     location: str | None = None  # Where they held this role
     timeframe: str | None = None  # "current", "former", "2018-2020"
-    evidence_quote: str  # Sentence stating this employment
+    evidence_sentence_id: int | None = None  # Sentence stating this employment
+    evidence_quote: SkipJsonSchema[str] = ""  # Text of that sentence
+    evidence: SkipJsonSchema[EvidenceSpan | None] = None  # With offsets
 
 
 # Allegation extraction has been moved to the sentiment step.
@@ -65,9 +74,12 @@ class Entity(BaseModel):
     # Relationships
     relationships: list[EntityRelationship] = []
 
-    # Audit trail & confidence
-    mention_sentences: list[str] = []
-    mention_count: int = 0
+    # Audit trail & confidence (sentence ids from the article's sentence index,
+    # resolved to text and offsets after extraction)
+    mention_sentence_ids: list[int] = []
+    mention_sentences: SkipJsonSchema[list[str]] = []
+    mention_spans: SkipJsonSchema[list[EvidenceSpan]] = []
+    mention_count: SkipJsonSchema[int] = 0
     extraction_confidence: float = Field(ge=0, le=1, default=1.0)
 
 
@@ -1,5 +1,5 @@
 # IMPORTANT: Update this version when you make changes to the prompt
-PROMPT_VERSION = "0.2.0"
+PROMPT_VERSION = "0.3.0"
 
 EXTRACTION_PROMPT = """You are an information extraction agent for regulatory compliance and adverse media screening.
 
@@ -16,7 +16,7 @@ Extract ALL person entities mentioned in the article. For EACH entity, capture:
   * organization: which company/institution
   * location: where they held this role
   * timeframe: "current", "former", "2018-2020", etc.
-  * evidence_quote: exact sentence stating this employment
+  * evidence_sentence_id: id of the sentence stating this employment
 
 **Additional Identity (explicit only):**
 - nationalities/citizenships (explicit only)
@@ -28,16 +28,15 @@ Extract ALL person entities mentioned in the article. For EACH entity, capture:
   * related_entity_name: name of other person
   * relationship_type: worked_for, associate_of, investigated_by, sued_by, etc.
   * description: human-readable description
-  * evidence_quote: sentence describing relationship
+  * evidence_sentence_id: id of the sentence describing relationship
 
 **Locations & Audit Trail:**
 - locations: general location associations (cities, countries)
-- mention_sentences: ALL sentences mentioning this person BY NAME OR REFERENCE
-- mention_count: how many times mentioned (count of mention_sentences)
+- mention_sentence_ids: ids of ALL sentences mentioning this person BY NAME OR REFERENCE
 - extraction_confidence: 0-1 score of how confident you are about this entity
 
 **CRITICAL COREFERENCE RESOLUTION:**
-You MUST resolve coreferences when capturing mention_sentences. Include sentences where the entity is referenced by:
+You MUST resolve coreferences when capturing mention_sentence_ids. Include sentences where the entity is referenced by:
 
 1. **Explicit name**: "Rachel Reeves said..."
 2. **Pronouns**: "she said...", "he denied...", "they investigated...", "his resignation...", "her statement..."
@@ -50,19 +49,18 @@ You MUST resolve coreferences when capturing mention_sentences. Include sentence
   * Grammatical agreement (gender, number)
   * Proximity to last named mention
   * Context and subject matter
-- Add that sentence to the correct entity's mention_sentences
+- Add that sentence's id to the correct entity's mention_sentence_ids
 - Be conservative - only include if you're confident about the reference (better to miss than misattribute)
 
 **Examples:**
 
-Article: "The chancellor, Rachel Reeves, must avoid risky tax increases. She will announce the budget next month. The chancellor faces pressure..."
+Article: "[1] The chancellor, Rachel Reeves, must avoid risky tax increases. [2] She will announce the budget next month. [3] The chancellor faces pressure..."
 
 Entity: Rachel Reeves
-mention_sentences:
-- "The chancellor, Rachel Reeves, must avoid risky tax increases." (explicit name)
-- "She will announce the budget next month." (pronoun "she" = Rachel Reeves)
-- "The chancellor faces pressure..." (role "the chancellor" = Rachel Reeves)
-mention_count: 3
+mention_sentence_ids: [1, 2, 3]
+- 1: explicit name
+- 2: pronoun "she" = Rachel Reeves
+- 3: role "the chancellor" = Rachel Reeves
 
 **Edge cases:**
 - If uncertain about a pronoun reference, exclude it (better to miss than misattribute)
@@ -76,12 +74,12 @@ mention_count: 3
 1. Do NOT invent information not in the article
 2. Each name must literally appear in text
 3. Link roles to organizations in employments (solves "which role at which org" ambiguity)
-4. Calculate mention_count by counting sentences (including coreferences)
+4. Cite sentences by their [id] only - never copy sentence text into the output
 5. Set extraction_confidence: 1.0 if very clear, lower if uncertain
-6. RESOLVE COREFERENCES: Include pronoun and role references in mention_sentences
+6. RESOLVE COREFERENCES: Include pronoun and role references in mention_sentence_ids
 
 {format_instructions}
 
-Article text:
+Article text (each sentence starts with its [id]):
 
 {article_text}"""
@@ -0,0 +1,7 @@
+"""Background screening jobs: persistent queue and worker pool."""
+
+from .models import JobStatus, ScreeningJob
+from .queue import JobQueue
+from .runner import JobRunner
+
+__all__ = ["JobStatus", "ScreeningJob", "JobQueue", "JobRunner"]
@@ -0,0 +1,46 @@
+"""
+Data models for background screening jobs.
+"""
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+from app.services.matching.models import QueryPerson
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of a screening job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ScreeningJob(BaseModel):
+    """
+    A screening accepted for background processing.
+
+    Attributes:
+        id: Job UUID
+        status: Current lifecycle status
+        url: Article URL to screen
+        query_person: Person to screen
+        callback_url: Optional URL that receives this job as JSON on completion
+        result_id: Saved ScreeningResult ID once the job succeeds
+        error: Failure message once the job fails
+        attempts: Number of times a worker has picked the job up
+        created_at / updated_at: ISO format timestamps
+    """
+
+    id: str
+    status: JobStatus
+    url: str
+    query_person: QueryPerson
+    callback_url: str | None = None
+    result_id: str | None = None
+    error: str | None = None
+    attempts: int = 0
+    created_at: str
+    updated_at: str
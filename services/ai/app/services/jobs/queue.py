@@ -0,0 +1,275 @@
+"""
+SQLite-backed persistent queue for screening jobs.
+
+Jobs survive restarts. Each claim is leased to the claiming process, which
+renews the lease while it works on the job; a job whose lease has run out
+(its process stopped or crashed) is put back on the queue, or failed once it
+has used up its attempts.
+"""
+
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from app.services.matching.models import QueryPerson
+from app.utils.logger import get_logger
+from app.utils.sqlite import ThreadLocalConnection, migrate
+
+from .models import JobStatus, ScreeningJob
+
+# Schema migrations, applied in order; PRAGMA user_version records how many
+# have run. Append new steps, never edit existing ones.
+MIGRATIONS = [
+    # owner is the claiming process's boot id; lease_expires_at is in epoch
+    # seconds
+    """
+CREATE TABLE jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    url TEXT NOT NULL,
+    query_person TEXT NOT NULL,
+    callback_url TEXT,
+    result_id TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_expires_at REAL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX idx_jobs_status_created ON jobs (status, created_at);
+""",
+]
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobQueue:
+    """
+    Durable FIFO queue of screening jobs.
+
+    Safe for concurrent use from several threads or processes; claiming a job
+    is a single atomic UPDATE, so each job is handed to exactly one worker.
+    Claims are owned by this queue instance (a random boot id) and expire
+    after lease_seconds unless renewed with heartbeat().
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_attempts: int = 3,
+        lease_seconds: float = 60.0,
+        logger=None,
+    ) -> None:
+        """
+        Initialise job queue.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+            max_attempts: Pick-ups allowed before an interrupted job is failed
+            lease_seconds: How long a claim stays valid without a heartbeat
+            logger: Optional logger instance
+        """
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+        self.logger = logger or get_logger(service="jobs")
+        self._db = ThreadLocalConnection(db_path)
+        migrate(self._db.get(), MIGRATIONS)
+
+    def enqueue(
+        self, url: str, query_person: QueryPerson, callback_url: str | None = None
+    ) -> ScreeningJob:
+        """Add a job to the queue and return it."""
+        now = _now()
+        job = ScreeningJob(
+            id=str(uuid.uuid4()),
+            status=JobStatus.QUEUED,
+            url=url,
+            query_person=query_person,
+            callback_url=callback_url,
+            created_at=now,
+            updated_at=now,
+        )
+        conn = self._db.get()
+        with conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, url, query_person, callback_url, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.status.value,
+                    job.url,
+                    job.query_person.model_dump_json(),
+                    job.callback_url,
+                    job.created_at,
+                    job.updated_at,
+                ),
+            )
+        self.logger.info("Queued screening job {}", job.id)
+        return job
+
+    def get(self, job_id: str) -> ScreeningJob | None:
+        """Load a job by ID."""
+        row = (
+            self._db.get()
+            .execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            .fetchone()
+        )
+        return self._to_job(row) if row else None
+
+    def claim_next(self) -> ScreeningJob | None:
+        """Atomically mark the oldest queued job RUNNING and return it."""
+        conn = self._db.get()
+        with conn:
+            row = conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, owner = ?, "
+                "lease_expires_at = ?, updated_at = ? "
+                "WHERE id = (SELECT id FROM jobs WHERE status = ? "
+                "ORDER BY created_at LIMIT 1) RETURNING *",
+                (
+                    JobStatus.RUNNING.value,
+                    self.owner,
+                    time.time() + self.lease_seconds,
+                    _now(),
+                    JobStatus.QUEUED.value,
+                ),
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def heartbeat(self, job_ids: list[str]) -> int:
+        """
+        Renew the leases of jobs this instance is running.
+
+        Returns:
+            Number of leases renewed (jobs whose lease already expired and
+            were taken over elsewhere are not)
+        """
+        if not job_ids:
+            return 0
+        placeholders = ", ".join("?" * len(job_ids))
+        conn = self._db.get()
+        with conn:
+            return conn.execute(
+                f"UPDATE jobs SET lease_expires_at = ? WHERE status = ? "
+                f"AND owner = ? AND id IN ({placeholders})",
+                (
+                    time.time() + self.lease_seconds,
+                    JobStatus.RUNNING.value,
+                    self.owner,
+                    *job_ids,
+                ),
+            ).rowcount
+
+    def complete(self, job_id: str, result_id: str | None) -> ScreeningJob | None:
+        """
+        Mark a job SUCCEEDED with the saved result ID.
+
+        Returns None if the job is no longer claimed by this instance.
+        """
+        return self._finish(job_id, JobStatus.SUCCEEDED, result_id=result_id)
+
+    def fail(self, job_id: str, error: str) -> ScreeningJob | None:
+        """
+        Mark a job FAILED with an error message.
+
+        Returns None if the job is no longer claimed by this instance.
+        """
+        return self._finish(job_id, JobStatus.FAILED, error=error)
+
+    def recover_interrupted(self) -> int:
+        """
+        Requeue RUNNING jobs whose lease has expired.
+
+        Jobs claimed by live processes keep their lease and are left alone.
+        Jobs that have already used max_attempts are failed instead, so a job
+        that crashes the worker cannot loop forever.
+
+        Returns:
+            Number of jobs put back on the queue
+        """
+        requeued = self._requeue(
+            "(lease_expires_at IS NULL OR lease_expires_at < ?)", (time.time(),)
+        )
+        if requeued:
+            self.logger.info("Requeued {} interrupted screening jobs", requeued)
+        return requeued
+
+    def release(self) -> int:
+        """
+        Requeue the jobs this instance is running (on shutdown).
+
+        Returns:
+            Number of jobs put back on the queue
+        """
+        return self._requeue("owner = ?", (self.owner,))
+
+    def _requeue(self, condition: str, params: tuple) -> int:
+        """Fail exhausted, then requeue, RUNNING jobs matching condition."""
+        conn = self._db.get()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, owner = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                f"WHERE status = ? AND attempts >= ? AND {condition}",
+                (
+                    JobStatus.FAILED.value,
+                    "Interrupted too many times",
+                    _now(),
+                    JobStatus.RUNNING.value,
+                    self.max_attempts,
+                    *params,
+                ),
+            )
+            return conn.execute(
+                "UPDATE jobs SET status = ?, owner = NULL, lease_expires_at = NULL, "
+                f"updated_at = ? WHERE status = ? AND {condition}",
+                (JobStatus.QUEUED.value, _now(), JobStatus.RUNNING.value, *params),
+            ).rowcount
+
+    def _finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result_id: str | None = None,
+        error: str | None = None,
+    ) -> ScreeningJob | None:
+        conn = self._db.get()
+        with conn:
+            row = conn.execute(
+                "UPDATE jobs SET status = ?, result_id = ?, error = ?, owner = NULL, "
+                "lease_expires_at = NULL, updated_at = ? "
+                "WHERE id = ? AND status = ? AND owner = ? RETURNING *",
+                (
+                    status.value,
+                    result_id,
+                    error,
+                    _now(),
+                    job_id,
+                    JobStatus.RUNNING.value,
+                    self.owner,
+                ),
+            ).fetchone()
+        if row is None:
+            self.logger.warning(
+                "Screening job {} lost its lease before finishing", job_id
+            )
+            return None
+        return self._to_job(row)
+
+    def _to_job(self, row) -> ScreeningJob:
+        return ScreeningJob(
+            id=row["id"],
+            status=JobStatus(row["status"]),
+            url=row["url"],
+            query_person=QueryPerson.model_validate_json(row["query_person"]),
+            callback_url=row["callback_url"],
+            result_id=row["result_id"],
+            error=row["error"],
+            attempts=row["attempts"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
@@ -0,0 +1,228 @@
+"""
+Worker pool that runs queued screening jobs in the background.
+
+Workers are asyncio tasks on the application's event loop, so each one drives
+an async ScreeningPipeline.ascreen() call without holding a thread.
+"""
+
+import asyncio
+import socket
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.services.matching.models import QueryPerson
+from app.services.screening_pipeline import ScreeningPipeline
+from app.utils.logger import get_logger
+from app.utils.urls import host_matches, is_public_address
+
+from .models import ScreeningJob
+from .queue import JobQueue
+
+
+class JobRunner:
+    """
+    Pulls jobs from a JobQueue and screens them with a fixed number of workers.
+
+    Example:
+        >>> runner = JobRunner(queue, pipeline, http_client, workers=4)
+        >>> await runner.start()
+        >>> job = await runner.submit(url, query_person)
+        >>> await runner.stop()
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        pipeline: ScreeningPipeline,
+        http_client: httpx.AsyncClient,
+        workers: int = 4,
+        poll_interval_seconds: float = 1.0,
+        callback_allowed_hosts: frozenset[str] = frozenset(),
+        logger=None,
+    ) -> None:
+        """
+        Initialise job runner.
+
+        Args:
+            queue: Persistent job queue
+            pipeline: Screening pipeline used to run jobs
+            http_client: Async client for completion callbacks
+            workers: Number of concurrent worker tasks
+            poll_interval_seconds: Idle wait before re-checking the queue (picks up
+                jobs enqueued by other processes)
+            callback_allowed_hosts: Hosts (and their subdomains) callbacks may
+                go to; empty allows any host that resolves to public addresses
+            logger: Optional logger instance
+        """
+        self.queue = queue
+        self.pipeline = pipeline
+        self.http_client = http_client
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.callback_allowed_hosts = frozenset(
+            host.lower() for host in callback_allowed_hosts
+        )
+        self.logger = logger or get_logger(service="jobs")
+        self._wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._running: set[str] = set()  # IDs of jobs this runner holds leases on
+
+    async def start(self) -> None:
+        """Requeue interrupted jobs and start the worker and heartbeat tasks."""
+        await asyncio.to_thread(self.queue.recover_interrupted)
+        self._tasks = [
+            asyncio.create_task(self._work(n), name=f"screening-worker-{n}")
+            for n in range(self.workers)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._heartbeat(), name="screening-heartbeat")
+        )
+        self.logger.info("Started {} screening job workers", self.workers)
+
+    async def stop(self) -> None:
+        """
+        Cancel worker tasks.
+
+        Jobs in progress are put back on the queue for any running process.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._running.clear()
+        await asyncio.to_thread(self.queue.release)
+        self.logger.info("Stopped screening job workers")
+
+    async def submit(
+        self, url: str, query_person: QueryPerson, callback_url: str | None = None
+    ) -> ScreeningJob:
+        """
+        Persist a new job and wake an idle worker.
+
+        Raises:
+            ValueError: If callback_url points at a host callbacks may not go to
+        """
+        if callback_url is not None:
+            self.check_callback_url(callback_url)
+        job = await asyncio.to_thread(
+            self.queue.enqueue, url, query_person, callback_url
+        )
+        self._wakeup.set()
+        return job
+
+    def check_callback_url(self, url: str) -> None:
+        """
+        Reject callback URLs for hosts that are not allowed.
+
+        Without an allowlist, loopback names and non-public IP literals are
+        rejected here; names are resolved and checked again before sending.
+
+        Raises:
+            ValueError: If the host is not allowed
+        """
+        host = (urlsplit(url).hostname or "").lower().rstrip(".")
+        if self.callback_allowed_hosts:
+            if not host_matches(host, self.callback_allowed_hosts):
+                raise ValueError(f"Callback host {host!r} is not allowed")
+            return
+        if host == "localhost" or host.endswith(".localhost"):
+            raise ValueError("Callback URL must point at a public host")
+        try:
+            public = is_public_address(host)
+        except ValueError:
+            return  # A name; checked when the callback is sent
+        if not public:
+            raise ValueError("Callback URL must point at a public host")
+
+    async def _work(self, worker_id: int) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim_next)
+                if job is None:
+                    await self._wait_for_work()
+                    continue
+                await self._run(job, worker_id)
+            except Exception as e:
+                # e.g. "database is locked" under load: keep the worker alive.
+                # A job that could not be marked finished keeps no heartbeat,
+                # so its lease runs out and it is requeued.
+                self.logger.exception("Screening worker {} failed: {}", worker_id, e)
+                await self._wait_for_work()
+
+    async def _heartbeat(self) -> None:
+        """
+        Renew this runner's leases, and requeue other processes' expired ones.
+
+        Runs three times per lease, so one missed beat does not lose a job.
+        """
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.queue.heartbeat, list(self._running))
+                if await asyncio.to_thread(self.queue.recover_interrupted):
+                    self._wakeup.set()
+            except Exception as e:
+                self.logger.exception("Screening job heartbeat failed: {}", e)
+
+    async def _wait_for_work(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+        except TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _run(self, job: ScreeningJob, worker_id: int) -> None:
+        self.logger.info("Worker {} running screening job {}", worker_id, job.id)
+        self._running.add(job.id)
+        try:
+            result = await self.pipeline.ascreen(job.url, job.query_person)
+            # Only report success once the result is actually on disk (a
+            # failed save fails the job)
+            if self.pipeline.persister is not None:
+                await self.pipeline.persister.wait_written(result.id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.exception("Screening job {} failed: {}", job.id, e)
+            finished = await asyncio.to_thread(self.queue.fail, job.id, str(e))
+        else:
+            finished = await asyncio.to_thread(self.queue.complete, job.id, result.id)
+        finally:
+            self._running.discard(job.id)
+
+        if finished is not None and finished.callback_url:
+            await self._notify(finished)
+
+    async def _notify(self, job: ScreeningJob) -> None:
+        """POST the finished job to its callback URL (best effort)."""
+        try:
+            await self._check_callback_addresses(job.callback_url)
+            resp = await self.http_client.post(
+                job.callback_url, json=job.model_dump(mode="json")
+            )
+            resp.raise_for_status()
+        except Exception as e:
+            self.logger.warning("Callback for job {} failed: {}", job.id, e)
+
+    async def _check_callback_addresses(self, url: str) -> None:
+        """
+        Refuse callbacks to hosts that resolve to non-public addresses.
+
+        Allowlisted hosts are trusted and may be internal.
+
+        Raises:
+            ValueError: If the host is not allowed or any address is not public
+        """
+        self.check_callback_url(url)
+        if self.callback_allowed_hosts:
+            return
+        parts = urlsplit(url)
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            parts.hostname, parts.port or 443, type=socket.SOCK_STREAM
+        )
+        for *_, sockaddr in infos:
+            if not is_public_address(sockaddr[0]):
+                raise ValueError(
+                    f"Callback host {parts.hostname!r} resolves to {sockaddr[0]}"
+                )
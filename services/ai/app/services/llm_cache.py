@@ -0,0 +1,163 @@
+"""
+Content-addressed LLM response cache for LCEL chains.
+
+All analysers run at temperature 0.0 with a versioned prompt, so the raw model
+output for a given rendered prompt, provider, model and prompt version can be
+reused. The cache sits between the rendered prompt and the LLM call; output
+parsing still runs on every call, so a cached response is validated exactly
+like a fresh one.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import BaseOutputParser, StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+
+from app.config import LLMProviderType
+from app.utils.disk_cache import CacheStats, DiskCache
+from app.utils.logger import get_logger
+
+
+class LLMResponseCache:
+    """
+    Maps a cache key to the raw text an LLM returned for it.
+
+    Backend-agnostic: any object with get(key) -> bytes | None, set(key, bytes)
+    and stats() -> CacheStats can be plugged in (DiskCache by default).
+    """
+
+    def __init__(self, backend: DiskCache) -> None:
+        self.backend = backend
+
+    @staticmethod
+    def make_key(
+        rendered_prompt: str,
+        provider: LLMProviderType,
+        model_name: str,
+        prompt_version: str,
+    ) -> str:
+        """Hash the rendered prompt together with provider, model and version."""
+        payload = json.dumps(
+            {
+                "prompt": rendered_prompt,
+                "provider": str(provider.value),
+                "model": model_name,
+                "prompt_version": prompt_version,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        value = self.backend.get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, text: str) -> None:
+        self.backend.set(key, text.encode("utf-8"))
+
+    def stats(self) -> CacheStats:
+        return self.backend.stats()
+
+
+class CachedChain:
+    """
+    Drop-in replacement for `prompt | llm | parser` with a response cache.
+
+    Exposes invoke/ainvoke like the LCEL chain it replaces. Only responses that
+    parse successfully are stored.
+    """
+
+    def __init__(
+        self,
+        prompt: ChatPromptTemplate,
+        llm: BaseChatModel,
+        parser: BaseOutputParser,
+        cache: LLMResponseCache,
+        *,
+        provider: LLMProviderType,
+        model_name: str,
+        prompt_version: str,
+        logger=None,
+    ) -> None:
+        self.prompt = prompt
+        self.llm = llm
+        self.parser = parser
+        self.cache = cache
+        self.provider = provider
+        self.model_name = model_name
+        self.prompt_version = prompt_version
+        self.logger = logger or get_logger(service="llm_cache")
+        self._to_text = StrOutputParser()
+
+    def invoke(self, prompt_data: dict) -> Any:
+        prompt_value = self.prompt.invoke(prompt_data)
+        key = self._key(prompt_value.to_string())
+
+        cached = self._parse_cached(key, self.cache.get(key))
+        if cached is not None:
+            return cached
+
+        text = self._to_text.invoke(self.llm.invoke(prompt_value))
+        output = self.parser.parse(text)
+        self.cache.set(key, text)
+        return output
+
+    async def ainvoke(self, prompt_data: dict) -> Any:
+        prompt_value = await self.prompt.ainvoke(prompt_data)
+        key = self._key(prompt_value.to_string())
+
+        cached_text = await asyncio.to_thread(self.cache.get, key)
+        cached = self._parse_cached(key, cached_text)
+        if cached is not None:
+            return cached
+
+        text = self._to_text.invoke(await self.llm.ainvoke(prompt_value))
+        output = self.parser.parse(text)
+        await asyncio.to_thread(self.cache.set, key, text)
+        return output
+
+    def _key(self, rendered_prompt: str) -> str:
+        return LLMResponseCache.make_key(
+            rendered_prompt, self.provider, self.model_name, self.prompt_version
+        )
+
+    def _parse_cached(self, key: str, text: str | None) -> Any:
+        """Parse a cached response; unparseable entries are treated as misses."""
+        if text is None:
+            return None
+        try:
+            return self.parser.parse(text)
+        except Exception as e:
+            self.logger.warning("Discarding unparseable cached response {}: {}", key, e)
+            return None
+
+
+def build_chain(
+    prompt: ChatPromptTemplate,
+    llm: BaseChatModel,
+    parser: BaseOutputParser,
+    *,
+    cache: LLMResponseCache | None,
+    provider: LLMProviderType,
+    model_name: str,
+    prompt_version: str,
+) -> Runnable | CachedChain:
+    """
+    Build an analyser chain, wrapped with the response cache if one is given.
+    """
+    if cache is None:
+        return prompt | llm | parser
+    return CachedChain(
+        prompt,
+        llm,
+        parser,
+        cache,
+        provider=provider,
+        model_name=model_name,
+        prompt_version=prompt_version,
+    )
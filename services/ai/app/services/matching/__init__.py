@@ -9,6 +9,7 @@ from .models import (
     QueryPerson,
     SignalValue,
 )
+from .prefilter import NamePrefilter
 
 __all__ = [
     "MatchDecision",
@@ -18,4 +19,5 @@ __all__ = [
     "PersonMatch",
     "MatchingResult",
     "PersonMatcher",
+    "NamePrefilter",
 ]
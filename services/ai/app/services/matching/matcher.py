@@ -23,6 +23,7 @@ CONSERVATIVE BIAS:
 - Detailed reasoning for every decision (regulatory compliance)
 """
 
+import asyncio
 import time
 from datetime import datetime
 
@@ -33,15 +34,21 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.config import LLMProviderType
 from app.models.llm_metadata import AnalyserMetadata
 from app.services.extraction.models import Entity, ExtractionResult
+from app.services.llm_cache import LLMResponseCache, build_chain
 from app.utils.logger import get_logger
 
 from .models import (
+    DemographicSignals,
     MatchAnalysis,
     MatchDecision,
     MatchingResult,
+    MatchSignals,
+    NameSignals,
     PersonMatch,
     QueryPerson,
+    SignalValue,
 )
+from .prefilter import NamePrefilter
 from .prompt import MATCHING_PROMPT, PROMPT_VERSION
 
 
@@ -60,6 +67,10 @@ class PersonMatcher:
         provider: LLMProviderType,
         model_name: str,
         logger=None,
+        max_concurrency: int = 8,
+        entity_timeout_seconds: float | None = 60.0,
+        prefilter: NamePrefilter | None = None,
+        cache: LLMResponseCache | None = None,
     ):
         """
         Initialize matcher with LLM and metadata.
@@ -69,10 +80,19 @@ class PersonMatcher:
             provider: LLM provider type (for metadata)
             model_name: Model name (for metadata)
             logger: Optional logger instance
+            max_concurrency: Max in-flight entity matches per amatch() call
+            entity_timeout_seconds: Per-entity LLM timeout in amatch() (None = no
+                limit). Timed-out entities are flagged UNCERTAIN for manual review.
+            prefilter: Optional deterministic name pre-filter; entities it rules
+                out are recorded as NO_MATCH without an LLM call
+            cache: Optional LLM response cache
         """
         self.llm = llm
         self.provider = provider
         self.model_name = model_name
+        self.max_concurrency = max_concurrency
+        self.entity_timeout_seconds = entity_timeout_seconds
+        self.prefilter = prefilter
         self.logger = logger or get_logger(service="matching")
         self.output_parser = PydanticOutputParser(pydantic_object=MatchAnalysis)
 
@@ -80,7 +100,15 @@ class PersonMatcher:
         self.prompt = ChatPromptTemplate.from_template(MATCHING_PROMPT)
 
         # Create chain
-        self.chain = self.prompt | self.llm | self.output_parser
+        self.chain = build_chain(
+            self.prompt,
+            self.llm,
+            self.output_parser,
+            cache=cache,
+            provider=self.provider,
+            model_name=self.model_name,
+            prompt_version=PROMPT_VERSION,
+        )
 
     def match(
         self, query_person: QueryPerson, extraction_result: ExtractionResult
@@ -105,27 +133,151 @@ class PersonMatcher:
         # Normalise query person
         query_person.normalise()
 
-        # Track entities analysed
-        entities_analysed: list[str] = [
-            entity.id for entity in extraction_result.entities
-        ]
-
         # Track start time for metadata
         start_time: float = time.time()
 
-        # Match against each entity (no article date needed)
-        matches: list[PersonMatch] = []
-        for entity in extraction_result.entities:
+        # Rule out clearly unrelated names before any LLM call
+        candidates, rejections = self._prefilter(query_person, extraction_result)
+
+        # Match against each candidate entity (no article date needed)
+        decisions: list[PersonMatch] = []
+        for entity in candidates:
             try:
-                match = self._match_entity(query_person, entity)
+                decisions.append(self._match_entity(query_person, entity))
+            except Exception as e:
+                self.logger.exception(f"Error matching entity {entity.name}: {e}")
+                raise
+
+        return self._build_result(
+            query_person, extraction_result, decisions, rejections, start_time
+        )
+
+    async def amatch(
+        self,
+        query_person: QueryPerson,
+        extraction_result: ExtractionResult,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> MatchingResult:
+        """
+        Async variant of match() that matches entities concurrently.
+
+        At most max_concurrency LLM calls are in flight at once, unless a
+        semaphore shared across several amatch() calls is passed in. Results
+        keep entity order before ranking, so ordering, primary match and
+        summary are the same as match().
+        """
+        query_person.normalise()
+        start_time: float = time.time()
+
+        candidates, rejections = self._prefilter(query_person, extraction_result)
+
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._amatch_entity_bounded(query_person, e, semaphore))
+            for e in candidates
+        ]
+        try:
+            decisions: list[PersonMatch] = list(await asyncio.gather(*tasks))
+        except Exception:
+            # Don't leave sibling LLM calls running after a failure
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return self._build_result(
+            query_person, extraction_result, decisions, rejections, start_time
+        )
+
+    def _prefilter(
+        self, query_person: QueryPerson, extraction_result: ExtractionResult
+    ) -> tuple[list[Entity], list[PersonMatch]]:
+        """Split entities into LLM candidates and pre-filter NO_MATCH records."""
+        if self.prefilter is None:
+            return list(extraction_result.entities), []
 
-                # Only include non-NO_MATCH results
-                if match.decision != MatchDecision.NO_MATCH:
-                    matches.append(match)
+        candidates, rejections = self.prefilter.partition(
+            query_person, extraction_result.entities
+        )
+        self.logger.info(
+            "Name pre-filter: {} of {} entities sent to LLM matching",
+            len(candidates),
+            len(extraction_result.entities),
+        )
+        return candidates, rejections
+
+    async def _amatch_entity_bounded(
+        self, query: QueryPerson, entity: Entity, semaphore: asyncio.Semaphore
+    ) -> PersonMatch:
+        """Match one entity under the concurrency limit and per-entity timeout."""
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    self._amatch_entity(query, entity),
+                    timeout=self.entity_timeout_seconds,
+                )
+            except TimeoutError:
+                self.logger.warning(
+                    "Matching timed out after {}s for entity {}",
+                    self.entity_timeout_seconds,
+                    entity.name,
+                )
+                return self._timeout_match(entity)
             except Exception as e:
                 self.logger.exception(f"Error matching entity {entity.name}: {e}")
                 raise
 
+    def _timeout_match(self, entity: Entity) -> PersonMatch:
+        """
+        Build an UNCERTAIN match for an entity whose LLM call timed out.
+
+        Conservative bias: a timeout must not silently become a NO_MATCH.
+        """
+        return PersonMatch(
+            entity_id=entity.id,
+            entity_name=entity.name,
+            decision=MatchDecision.UNCERTAIN,
+            confidence=0.0,
+            signals=MatchSignals(
+                name=NameSignals(exact_match=SignalValue.UNKNOWN, fuzzy_similarity=0.0),
+                demographics=DemographicSignals(),
+            ),
+            reasoning=(
+                f"Matching timed out after {self.entity_timeout_seconds}s; "
+                "manual review required."
+            ),
+        )
+
+    def _build_result(
+        self,
+        query_person: QueryPerson,
+        extraction_result: ExtractionResult,
+        decisions: list[PersonMatch],
+        rejections: list[PersonMatch],
+        start_time: float,
+    ) -> MatchingResult:
+        """
+        Rank per-entity decisions and build the overall matching result.
+
+        Args:
+            query_person: Normalised query person
+            extraction_result: Extracted entities from article
+            decisions: One LLM PersonMatch per candidate entity, in entity order
+            rejections: NO_MATCH records from the name pre-filter
+            start_time: Matching start time (for metadata)
+
+        Returns:
+            MatchingResult with matches ranked by confidence
+        """
+        # Track entities analysed
+        entities_analysed: list[str] = [
+            entity.id for entity in extraction_result.entities
+        ]
+
+        # Only include non-NO_MATCH results
+        matches: list[PersonMatch] = [
+            m for m in decisions if m.decision != MatchDecision.NO_MATCH
+        ]
+
         # Sort by confidence (highest first)
         matches.sort(key=lambda m: m.confidence, reverse=True)
 
@@ -159,6 +311,7 @@ class PersonMatcher:
         return MatchingResult(
             query_person=query_person,
             entities_analysed=entities_analysed,
+            prefilter_rejections=rejections,
             matches=matches,
             has_definite_match=has_definite,
             has_any_match=len(matches) > 0,
@@ -179,8 +332,24 @@ class PersonMatcher:
         Returns:
             PersonMatch with decision, confidence, signals, and reasoning
         """
-        # Build prompt data from query and entity
-        prompt_data: dict[str, str] = {
+        # Invoke LLM chain - Pydantic parser returns MatchAnalysis
+        analysis: MatchAnalysis = self.chain.invoke(
+            self._build_prompt_data(query, entity)
+        )
+
+        # Parse LLM output into structured match
+        return self._parse_match_analysis(analysis, entity)
+
+    async def _amatch_entity(self, query: QueryPerson, entity: Entity) -> PersonMatch:
+        """Async variant of _match_entity() using the chain's ainvoke."""
+        analysis: MatchAnalysis = await self.chain.ainvoke(
+            self._build_prompt_data(query, entity)
+        )
+        return self._parse_match_analysis(analysis, entity)
+
+    def _build_prompt_data(self, query: QueryPerson, entity: Entity) -> dict[str, str]:
+        """Build prompt data from query and entity."""
+        return {
             **query.to_prompt_fields(),
             "entity_name": entity.name,
             "entity_aliases": ", ".join(entity.aliases) if entity.aliases else "None",
@@ -191,12 +360,6 @@ class PersonMatcher:
             "format_instructions": self.output_parser.get_format_instructions(),
         }
 
-        # Invoke LLM chain - Pydantic parser returns MatchAnalysis
-        analysis: MatchAnalysis = self.chain.invoke(prompt_data)
-
-        # Parse LLM output into structured match
-        return self._parse_match_analysis(analysis, entity)
-
     def _parse_match_analysis(
         self, analysis: MatchAnalysis, entity: Entity
     ) -> PersonMatch:
@@ -278,6 +278,8 @@ class MatchingResult(BaseModel):
     query_person: QueryPerson
     # Entity tracking
     entities_analysed: list[str] = []  # Entity IDs checked
+    # NO_MATCH records for entities ruled out by the name pre-filter (no LLM call)
+    prefilter_rejections: list[PersonMatch] = []
 
     # Match results
     matches: list[PersonMatch]
@@ -0,0 +1,212 @@
+"""
+Deterministic candidate generation for person matching.
+
+Cheap, local name comparison that runs before the matching LLM. Entities whose
+names share no token, nickname, initial or fuzzy similarity with the query are
+recorded as NO_MATCH without an LLM call; everything else is passed on.
+
+CONSERVATIVE BIAS:
+- Only rejects entities that are clearly a different name
+- Any overlap (token, nickname, typo-level similarity, initials) → LLM decides
+- Entities without a usable name are always sent to the LLM
+"""
+
+from difflib import SequenceMatcher
+
+from pydantic import BaseModel
+
+from app.services.extraction.models import Entity
+
+from .models import (
+    DemographicSignals,
+    MatchDecision,
+    MatchSignals,
+    NameSignals,
+    PersonMatch,
+    QueryPerson,
+    SignalValue,
+)
+from .utils import get_name_variations, name_tokens, token_set_similarity
+
+# Per-token similarity above which two tokens count as a typo of each other
+TOKEN_TYPO_SIMILARITY = 0.8
+
+
+class PrefilterDecision(BaseModel):
+    """Outcome of the deterministic pre-filter for one entity."""
+
+    plausible: bool
+    score: float  # Best token-set similarity across entity name and aliases
+    reason: str
+
+
+class NamePrefilter:
+    """
+    Split entities into plausible candidates and clear non-matches.
+
+    Example:
+        >>> prefilter = NamePrefilter(min_similarity=0.75)
+        >>> candidates, rejected = prefilter.partition(query, entities)
+    """
+
+    def __init__(self, min_similarity: float = 0.75) -> None:
+        """
+        Initialise pre-filter.
+
+        Args:
+            min_similarity: Token-set similarity at or above which an entity is
+                treated as plausible even without a shared token
+        """
+        self.min_similarity = min_similarity
+
+    def partition(
+        self, query: QueryPerson, entities: list[Entity]
+    ) -> tuple[list[Entity], list[PersonMatch]]:
+        """
+        Partition entities for matching.
+
+        Args:
+            query: Normalised query person
+            entities: Extracted entities from the article
+
+        Returns:
+            (entities to send to the LLM, NO_MATCH results for the rest),
+            both in original entity order
+        """
+        query_tokens = name_tokens(query.normalised_name or query.name)
+        expanded = self._expand_with_nicknames(query_tokens)
+
+        candidates: list[Entity] = []
+        rejected: list[PersonMatch] = []
+        for entity in entities:
+            decision = self.evaluate(query_tokens, expanded, entity)
+            if decision.plausible:
+                candidates.append(entity)
+            else:
+                rejected.append(self._no_match(entity, decision))
+        return candidates, rejected
+
+    def evaluate(
+        self, query_tokens: list[str], expanded: set[str], entity: Entity
+    ) -> PrefilterDecision:
+        """
+        Decide whether an entity could plausibly be the query person.
+
+        Args:
+            query_tokens: Query name tokens
+            expanded: Query tokens plus their nickname variations
+            entity: Entity to evaluate (name and aliases are considered)
+
+        Returns:
+            PrefilterDecision with the first rule that fired
+        """
+        if not query_tokens:
+            return PrefilterDecision(plausible=True, score=0.0, reason="empty query")
+
+        best_score = 0.0
+        has_usable_name = False
+        for candidate in [entity.name, *entity.aliases]:
+            tokens = name_tokens(candidate)
+            if not tokens:
+                continue
+            has_usable_name = True
+
+            shared = expanded & set(tokens)
+            if shared:
+                return PrefilterDecision(
+                    plausible=True,
+                    score=1.0,
+                    reason=f"shared name token or nickname: {sorted(shared)}",
+                )
+
+            if self._has_typo_token(query_tokens, tokens):
+                return PrefilterDecision(
+                    plausible=True, score=1.0, reason="near-identical name token"
+                )
+
+            if self._initials_compatible(query_tokens, tokens):
+                return PrefilterDecision(
+                    plausible=True, score=1.0, reason="compatible initials"
+                )
+
+            best_score = max(best_score, token_set_similarity(query_tokens, tokens))
+
+        if not has_usable_name:
+            return PrefilterDecision(
+                plausible=True, score=0.0, reason="entity has no comparable name"
+            )
+
+        if best_score >= self.min_similarity:
+            return PrefilterDecision(
+                plausible=True,
+                score=best_score,
+                reason=f"token-set similarity {best_score:.2f}",
+            )
+
+        return PrefilterDecision(
+            plausible=False,
+            score=best_score,
+            reason=(
+                "Deterministic pre-filter: no shared name token, nickname or "
+                f"initial, and token-set similarity {best_score:.2f} is below "
+                f"{self.min_similarity:.2f}."
+            ),
+        )
+
+    def _expand_with_nicknames(self, tokens: list[str]) -> set[str]:
+        """Add nickname and canonical-name variations for each query token."""
+        expanded = set(tokens)
+        for token in tokens:
+            expanded.update(get_name_variations(token)["all_variations"])
+        return expanded
+
+    def _has_typo_token(self, query_tokens: list[str], tokens: list[str]) -> bool:
+        """True if any pair of multi-letter tokens differs by a typo or two."""
+        return any(
+            SequenceMatcher(None, q, t).ratio() >= TOKEN_TYPO_SIMILARITY
+            for q in query_tokens
+            for t in tokens
+            if len(q) > 2 and len(t) > 2
+        )
+
+    def _initials_compatible(self, query_tokens: list[str], tokens: list[str]) -> bool:
+        """
+        True if the entity name is written with initials the query can expand to.
+
+        "J Smith" and "J. R." are compatible with "John Robert Smith"; each
+        initial must match the first letter of a distinct query token, in order.
+        """
+        initials = [t for t in tokens if len(t) == 1]
+        if not initials:
+            return False
+        full_tokens = [t for t in tokens if len(t) > 1]
+        if any(t not in query_tokens for t in full_tokens):
+            return False
+
+        remaining = [q[0] for q in query_tokens]
+        for initial in initials:
+            if initial not in remaining:
+                return False
+            remaining = remaining[remaining.index(initial) + 1 :]
+        return True
+
+    def _no_match(self, entity: Entity, decision: PrefilterDecision) -> PersonMatch:
+        """Build the NO_MATCH record for an entity rejected by the pre-filter."""
+        return PersonMatch(
+            entity_id=entity.id,
+            entity_name=entity.name,
+            decision=MatchDecision.NO_MATCH,
+            confidence=0.0,
+            signals=MatchSignals(
+                name=NameSignals(
+                    exact_match=SignalValue.NO_MATCH,
+                    fuzzy_similarity=round(decision.score, 2),
+                    nickname_match=SignalValue.NO_MATCH,
+                    partial_match=SignalValue.NO_MATCH,
+                    title_stripped_match=SignalValue.NO_MATCH,
+                ),
+                demographics=DemographicSignals(),
+            ),
+            reasoning=decision.reason,
+            evidence_against_match=[decision.reason],
+        )
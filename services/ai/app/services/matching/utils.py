@@ -1,11 +1,14 @@
 """
 Helper utilities for person matching.
 
-Provides name normalisation, nickname variations, and date parsing.
+Provides name normalisation, nickname variations, name tokenisation, fuzzy
+scoring, and date parsing.
 """
 
 import re
+import unicodedata
 from datetime import datetime
+from difflib import SequenceMatcher
 
 from nicknames import NickNamer
 
@@ -48,6 +51,75 @@ def normalise_name(name: str) -> str:
     return " ".join(name.split()).title()
 
 
+# Honorifics and suffixes ignored when comparing names
+NAME_TITLES: frozenset[str] = frozenset(
+    {
+        "mr",
+        "mrs",
+        "ms",
+        "miss",
+        "mx",
+        "dr",
+        "prof",
+        "professor",
+        "sir",
+        "dame",
+        "lord",
+        "lady",
+        "rev",
+        "hon",
+        "judge",
+        "justice",
+        "jr",
+        "sr",
+        "ii",
+        "iii",
+        "mp",
+        "qc",
+        "kc",
+    }
+)
+
+
+def name_tokens(name: str) -> list[str]:
+    """
+    Split a name into lowercase, accent-folded tokens with titles removed.
+
+    Example:
+        >>> name_tokens("Dr. José  O'Brien-Smith")
+        ["jose", "obrien", "smith"]
+    """
+    folded = unicodedata.normalize("NFKD", name)
+    folded = "".join(c for c in folded if not unicodedata.combining(c)).lower()
+    folded = folded.replace("'", "").replace("\u2019", "")
+    tokens = re.findall(r"[a-z0-9]+", folded)
+    return [t for t in tokens if t not in NAME_TITLES]
+
+
+def token_set_similarity(a: list[str], b: list[str]) -> float:
+    """
+    Order-insensitive fuzzy similarity between two token lists (0-1).
+
+    Compares the shared tokens and each side's remainder, so "Smith John" vs
+    "John Smith" scores 1.0 and small typos ("Jon Smyth") still score highly.
+    """
+    set_a, set_b = set(a), set(b)
+    if not set_a or not set_b:
+        return 0.0
+
+    shared = " ".join(sorted(set_a & set_b))
+    rest_a = " ".join(sorted(set_a - set_b))
+    rest_b = " ".join(sorted(set_b - set_a))
+    full_a = f"{shared} {rest_a}".strip()
+    full_b = f"{shared} {rest_b}".strip()
+
+    scores = [SequenceMatcher(None, full_a, full_b).ratio()]
+    if shared:
+        scores.append(SequenceMatcher(None, shared, full_a).ratio())
+        scores.append(SequenceMatcher(None, shared, full_b).ratio())
+    return max(scores)
+
+
 def extract_year_from_date_string(dob: str) -> int | None:
     """
     Extract birth year from various date formats.
@@ -0,0 +1 @@
+"""Results storage and persistence service."""
@@ -0,0 +1,79 @@
+"""
+Content-addressed blob store for large, frequently repeated result fields.
+
+Blobs are keyed by the SHA-256 of their uncompressed bytes, so storing the same
+article body for many screenings keeps a single copy on disk.
+"""
+
+import hashlib
+import os
+import re
+import uuid
+from pathlib import Path
+
+from app.utils.compression import Compression, compress, decompress
+
+_BLOB_REF = re.compile(r"blob:sha256:([0-9a-f]{64})")
+
+
+def blob_ref(digest: str) -> str:
+    """Reference string stored in place of a blob's content."""
+    return f"blob:sha256:{digest}"
+
+
+def blob_digest(value: object) -> str | None:
+    """The digest a blob reference points at, or None for any other value."""
+    if isinstance(value, str) and (match := _BLOB_REF.fullmatch(value)):
+        return match.group(1)
+    return None
+
+
+class BlobStore:
+    """
+    Write-once blob files under <root>/<hash[:2]>/<hash>.
+
+    Example:
+        >>> blobs = BlobStore(Path("results/blobs"), Compression.GZIP)
+        >>> digest = blobs.put(b'"article text"')
+        >>> blobs.get(digest)
+        b'"article text"'
+    """
+
+    def __init__(self, root: Path, compression: Compression) -> None:
+        """
+        Initialise blob store.
+
+        Args:
+            root: Directory for blob files (created if missing)
+            compression: Method used for newly written blobs
+        """
+        self.root = root
+        self.compression = compression
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def put(self, data: bytes) -> str:
+        """Store bytes (if not already present) and return their SHA-256."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            return digest
+
+        # Write to a unique temp file then rename, so concurrent writers of the
+        # same blob never expose a partial file
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(compress(data, self.compression))
+        os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """
+        Load a blob's uncompressed bytes.
+
+        Raises:
+            FileNotFoundError: If no blob has this digest
+        """
+        return decompress(self._path(digest).read_bytes())
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
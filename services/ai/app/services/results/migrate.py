@@ -0,0 +1,34 @@
+"""
+Move result files from the flat results/data/ layout into ID-prefix shards.
+
+Usage (from services/ai, or /app in the container):
+    python -m app.services.results.migrate [RESULTS_DIR]
+
+RESULTS_DIR defaults to the configured <project_root>/results. Safe to run
+while the service is up, and to re-run.
+"""
+
+import sys
+from pathlib import Path
+
+from app.config import APP_VERSION, Settings
+from app.services.results.storage import ResultsStorage
+from app.utils.logger import configure_logger, get_logger
+
+
+def main(argv: list[str]) -> int:
+    configure_logger()
+    settings = Settings()
+    results_dir = Path(argv[0]) if argv else settings.project_root / "results"
+    storage = ResultsStorage(
+        results_dir=results_dir,
+        schema_version=APP_VERSION,
+        logger=get_logger(service="results"),
+        compression=settings.results_compression,
+    )
+    storage.shard_flat_files()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
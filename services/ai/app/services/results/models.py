@@ -0,0 +1,103 @@
+"""
+Data models for screening results persistence.
+
+Defines metadata and index models for tracking saved screening results.
+"""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from app.services.matching.models import MatchDecision
+
+
+class ResultMetadata(BaseModel):
+    """
+    Metadata for a saved screening result.
+
+    Used in the index to provide quick access to result information
+    without loading the full result data.
+    """
+
+    id: str
+    display_name: str
+    person_name: str
+    article_url: str
+    article_title: str
+    created_at: str  # ISO format timestamp
+    schema_version: str
+    # Filter columns (None until backfilled for results indexed before them)
+    article_domain: str | None = None
+    match_decision: MatchDecision | None = None  # Primary match, or no_match
+    risk_category: str | None = None  # Highest-risk sentiment assessment
+
+
+class ResultIndex(BaseModel):
+    """
+    Legacy JSON index of saved screening results.
+
+    Stored as index.json in the results directory before the SQLite index;
+    only read when importing it.
+    """
+
+    version: str  # Index file format version
+    results: list[ResultMetadata]
+
+
+class ResultSort(str, Enum):
+    """Sort orders for listing results."""
+
+    NEWEST = "newest"
+    OLDEST = "oldest"
+    PERSON_NAME = "person_name"
+
+
+class ResultQuery(BaseModel):
+    """
+    Filters, sort order and page position for listing results.
+
+    Attributes:
+        person_name: Words of the screened person's name (any case and accents;
+            the last may be partial)
+        url: Exact article URL
+        domain: Article domain; also matches its subdomains
+        created_from / created_to: Inclusive creation time bounds (naive = UTC)
+        match_decision: Decision of the primary match (no_match if none)
+        risk_category: Highest sentiment risk category
+        sort: Sort order
+        limit: Page size
+        cursor: next_cursor from the previous page (same filters and sort)
+    """
+
+    person_name: str | None = None
+    url: str | None = None
+    domain: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    match_decision: MatchDecision | None = None
+    risk_category: str | None = None
+    sort: ResultSort = ResultSort.NEWEST
+    limit: int = Field(default=50, ge=1, le=200)
+    cursor: str | None = None
+
+
+class ResultsPage(BaseModel):
+    """One page of result metadata; next_cursor is None on the last page."""
+
+    items: list[ResultMetadata]
+    next_cursor: str | None = None
+
+
+class ResultSearchHit(ResultMetadata):
+    """A full-text search match: result metadata plus relevance details."""
+
+    score: float  # bm25 score (lower is more relevant)
+    snippet: str  # Best-matching text with hits marked as [term]
+
+
+class ResultSearchPage(BaseModel):
+    """One page of search hits, best first; next_offset is None on the last page."""
+
+    items: list[ResultSearchHit]
+    next_offset: int | None = None
@@ -0,0 +1,176 @@
+"""
+Write-behind persistence for screening results.
+
+Screening responses no longer wait for the result file and index writes: the
+pipeline hands finished results to a ResultPersister, which saves them in
+batches on a background task. Results stay readable from memory until they
+are on disk, and everything queued is flushed on shutdown.
+"""
+
+import asyncio
+
+from pydantic import BaseModel
+
+from app.services.screening.models import ScreeningResult
+from app.utils.logger import get_logger
+
+from .storage import ResultsStorage
+
+# Save errors kept for wait_written() callers that have not asked yet
+MAX_REMEMBERED_FAILURES = 1000
+
+
+class PersisterStats(BaseModel):
+    """Counters for a persister instance (since process start)."""
+
+    submitted: int = 0
+    written: int = 0
+    batches: int = 0
+    failures: int = 0  # Results that could not be saved (logged with their IDs)
+    sync_fallbacks: int = 0  # Saved inline because the queue was full
+    pending: int = 0  # Submitted but not yet written
+
+
+class ResultPersister:
+    """
+    Saves results through ResultsStorage off the request path.
+
+    The queue is bounded: when it is full, submit() saves the result itself
+    (in a worker thread) rather than dropping it, so a slow disk degrades
+    latency instead of losing results.
+
+    Example:
+        >>> persister = ResultPersister(storage)
+        >>> await persister.start()
+        >>> await persister.submit(result)  # returns once queued
+        >>> await persister.stop()  # flushes everything queued
+    """
+
+    def __init__(
+        self,
+        storage: ResultsStorage,
+        max_queue_size: int = 1000,
+        batch_size: int = 32,
+        logger=None,
+    ) -> None:
+        """
+        Initialise persister.
+
+        Args:
+            storage: Results storage to write to
+            max_queue_size: Results held in memory before submit() saves inline
+            batch_size: Maximum results saved per storage call
+            logger: Optional logger instance
+        """
+        self.storage = storage
+        self.batch_size = batch_size
+        self.logger = logger or get_logger(service="results")
+        self._queue: asyncio.Queue[ScreeningResult] = asyncio.Queue(max_queue_size)
+        self._pending: dict[str, ScreeningResult] = {}
+        self._written: dict[str, asyncio.Event] = {}
+        self._errors: dict[str, Exception] = {}
+        self._stats = PersisterStats()
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the background writer task."""
+        self._task = asyncio.create_task(self._run(), name="result-persister")
+
+    async def stop(self) -> None:
+        """Write everything still queued, then stop the writer task."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self.logger.info("Result persister stopped: {}", self.stats())
+
+    async def submit(self, result: ScreeningResult) -> None:
+        """
+        Queue a result (which must already have its id) for saving.
+
+        Falls back to saving inline when the queue is full or the writer is
+        not running.
+        """
+        self._stats.submitted += 1
+        self._pending[result.id] = result
+        self._written[result.id] = asyncio.Event()
+        if self._task is None or self._queue.full():
+            self._stats.sync_fallbacks += 1
+            await self._write([result])
+            return
+        self._queue.put_nowait(result)
+
+    def get_pending(self, result_id: str) -> ScreeningResult | None:
+        """A submitted result that has not been written yet, if any."""
+        return self._pending.get(result_id)
+
+    async def wait_written(self, result_id: str) -> None:
+        """
+        Wait until a submitted result is saved.
+
+        Raises:
+            Exception: The error that stopped the result being saved
+        """
+        event = self._written.get(result_id)
+        if event is not None:
+            await event.wait()
+        error = self._errors.pop(result_id, None)
+        if error is not None:
+            raise error
+
+    def stats(self) -> PersisterStats:
+        return self._stats.model_copy(update={"pending": len(self._pending)})
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: list[ScreeningResult]) -> None:
+        """
+        Save a batch of results.
+
+        If the batch fails, results are retried one by one so a single bad
+        result cannot lose the others.
+        """
+        try:
+            await asyncio.to_thread(self.storage.save_results, batch)
+            self._stats.batches += 1
+            self._finish(batch)
+            return
+        except Exception as e:
+            self.logger.warning("Batch save of {} results failed: {}", len(batch), e)
+
+        for result in batch:
+            try:
+                await asyncio.to_thread(self.storage.save_results, [result])
+                self._finish([result])
+            except Exception as e:
+                self.logger.error(
+                    "Failed to save screening result {}: {}", result.id, e
+                )
+                self._finish([result], error=e)
+
+    def _finish(
+        self, results: list[ScreeningResult], error: Exception | None = None
+    ) -> None:
+        for result in results:
+            if error is None:
+                self._stats.written += 1
+            else:
+                self._stats.failures += 1
+                if len(self._errors) >= MAX_REMEMBERED_FAILURES:
+                    self._errors.pop(next(iter(self._errors)))
+                self._errors[result.id] = error
+            self._pending.pop(result.id, None)
+            event = self._written.pop(result.id, None)
+            if event is not None:
+                event.set()
@@ -0,0 +1,91 @@
+"""
+Full-text search support for saved screening results.
+
+Builds the per-result search document indexed in the results_fts FTS5 table
+and turns free-text user input into a safe FTS5 MATCH expression.
+"""
+
+import re
+
+from app.services.screening.models import ScreeningResult
+
+# FTS5 columns (after the unindexed result_id) and their bm25 weights: a hit on
+# the screened person or an entity name outranks one in a mention sentence
+SEARCH_COLUMNS = {
+    "person_name": 10.0,
+    "entity_names": 6.0,
+    "article_title": 4.0,
+    "organisations": 3.0,
+    "allegations": 3.0,
+    "mentions": 1.0,
+}
+
+SEARCH_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+    result_id UNINDEXED,
+    {", ".join(SEARCH_COLUMNS)},
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Quoted phrases or bare words
+_QUERY_TERMS = re.compile(r'"([^"]+)"|(\S+)')
+# Terms without any word character produce no tokens, so they are dropped
+_WORD_CHAR = re.compile(r"\w")
+
+
+def search_document(result: ScreeningResult) -> tuple[str, ...]:
+    """Text for each search column of a result, in SEARCH_COLUMNS order."""
+    entities = result.entities
+    allegations = (
+        [
+            a
+            for assessment in result.sentiment.assessments
+            for a in assessment.allegations
+        ]
+        if result.sentiment is not None
+        else []
+    )
+    columns = {
+        "person_name": [result.query_person.name],
+        "entity_names": [n for e in entities for n in (e.name, *e.aliases)],
+        "article_title": [result.article.title],
+        "organisations": [
+            job.organization
+            for e in entities
+            for job in e.employments
+            if job.organization
+        ],
+        "allegations": [f"{a.category} {a.description}" for a in allegations],
+        "mentions": [s for e in entities for s in e.mention_sentences],
+    }
+    return tuple("\n".join(columns[name]) for name in SEARCH_COLUMNS)
+
+
+def fts_query(text: str) -> str:
+    """
+    Convert user input into an FTS5 expression matching all terms.
+
+    Every term is quoted, so FTS5 operators and punctuation in the input are
+    treated as text. "Quoted phrases" must match as phrases, and the final bare
+    word also matches as a prefix (so partially typed names still find hits).
+
+    Example:
+        >>> fts_query('"John Smith" fraud acq')
+        '"John Smith" "fraud" "acq"*'
+
+    Raises:
+        ValueError: If the input contains no searchable terms
+    """
+    terms = []
+    for phrase, word in _QUERY_TERMS.findall(text):
+        term = (phrase or word).replace('"', '""').strip()
+        if _WORD_CHAR.search(term):
+            terms.append((f'"{term}"', bool(word)))
+    if not terms:
+        raise ValueError("Search query is empty")
+
+    last, is_word = terms[-1]
+    if is_word:
+        terms[-1] = (f"{last}*", is_word)
+    return " ".join(term for term, _ in terms)
@@ -0,0 +1,73 @@
+"""
+Sectioned on-disk format for saved screening results.
+
+Each top-level ScreeningResult field is stored as its own independently
+compressed JSON section, behind a small header of section offsets, so a reader
+can load e.g. matching and sentiment without touching the article body:
+
+    MAGIC | header length (uint32, big-endian) | header JSON | section bytes...
+
+The header maps section name to [offset, length] relative to the end of the
+header. Files without the magic prefix are whole JSON documents (the format
+used before sections), optionally compressed.
+"""
+
+import json
+import struct
+from pathlib import Path
+
+from app.utils.compression import Compression, compress, decompress
+
+MAGIC = b"AMSR\x01"
+_HEADER_LENGTH = struct.Struct(">I")
+
+
+def encode_sections(sections: dict[str, bytes], compression: Compression) -> bytes:
+    """Build a sectioned file from raw JSON bytes per section (in field order)."""
+    bodies = [compress(body, compression) for body in sections.values()]
+    offsets, position = {}, 0
+    for name, body in zip(sections, bodies):
+        offsets[name] = [position, len(body)]
+        position += len(body)
+
+    header = json.dumps({"sections": offsets}, separators=(",", ":")).encode("utf-8")
+    return b"".join([MAGIC, _HEADER_LENGTH.pack(len(header)), header, *bodies])
+
+
+def is_sectioned(path: Path) -> bool:
+    """Whether a data file uses the sectioned format."""
+    with path.open("rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def read_sections(path: Path, names: list[str] | None = None) -> dict[str, bytes]:
+    """
+    Read sections (all, or only the named ones) from a sectioned file.
+
+    Only the header and requested sections are read from disk. Returns
+    decompressed JSON bytes per section, in file order; names that the file
+    does not contain are skipped.
+    """
+    with path.open("rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a sectioned result file: {path}")
+        (header_length,) = _HEADER_LENGTH.unpack(f.read(_HEADER_LENGTH.size))
+        offsets: dict[str, list[int]] = json.loads(f.read(header_length))["sections"]
+        data_start = f.tell()
+
+        sections = {}
+        for name, (offset, length) in offsets.items():
+            if names is not None and name not in names:
+                continue
+            f.seek(data_start + offset)
+            sections[name] = decompress(f.read(length))
+        return sections
+
+
+def join_sections(sections: dict[str, bytes]) -> bytes:
+    """Assemble section bytes into one JSON object, without parsing them."""
+    members = (
+        json.dumps(name).encode("utf-8") + b":" + body
+        for name, body in sections.items()
+    )
+    return b"{" + b",".join(members) + b"}"
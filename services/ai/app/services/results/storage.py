@@ -0,0 +1,801 @@
+"""
+Storage service for persisting screening results to the file system.
+
+Result payloads are stored in a sectioned format (one independently
+compressed JSON section per top-level field, see sections.py) so views can
+load only the fields they need, with article bodies moved into a
+content-addressed blob store so an article screened many times is stored
+once. Data files are sharded by ID prefix (data/ab/cd/<id>.res) so no
+directory grows unbounded, and the index records each file's path so lookups
+never scan. Metadata is indexed in SQLite
+so saves are O(1) and listing is an indexed query rather than a full scan.
+"""
+
+import base64
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from logging import Logger
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from app.services.matching.models import MatchDecision
+from app.services.results.blobs import BlobStore, blob_digest, blob_ref
+from app.services.results.models import (
+    ResultIndex,
+    ResultMetadata,
+    ResultQuery,
+    ResultSearchHit,
+    ResultSearchPage,
+    ResultSort,
+    ResultsPage,
+)
+from app.services.results.search import (
+    SEARCH_COLUMNS,
+    SEARCH_SCHEMA,
+    fts_query,
+    search_document,
+)
+from app.services.results.sections import (
+    encode_sections,
+    is_sectioned,
+    join_sections,
+    read_sections,
+)
+from app.services.screening.models import ScreeningResult
+from app.utils.compression import Compression, decompress, ensure_available
+from app.utils.sqlite import ThreadLocalConnection, migrate
+from app.utils.urls import url_domain
+
+# Index schema migrations, applied in order; PRAGMA user_version records how
+# many have run. Append new steps, never edit existing ones.
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        id TEXT PRIMARY KEY,
+        display_name TEXT NOT NULL,
+        person_name TEXT NOT NULL,
+        article_url TEXT NOT NULL,
+        article_title TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        schema_version TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_results_version_created
+        ON results (schema_version, created_at);
+    CREATE INDEX IF NOT EXISTS idx_results_person_name ON results (person_name);
+    CREATE INDEX IF NOT EXISTS idx_results_article_url ON results (article_url);
+    """,
+    # Filter and keyset pagination support (rows are backfilled from data files)
+    """
+    ALTER TABLE results ADD COLUMN article_domain TEXT;
+    ALTER TABLE results ADD COLUMN match_decision TEXT;
+    ALTER TABLE results ADD COLUMN risk_category TEXT;
+    DROP INDEX IF EXISTS idx_results_version_created;
+    CREATE INDEX idx_results_version_created
+        ON results (schema_version, created_at, id);
+    CREATE INDEX idx_results_version_person
+        ON results (schema_version, person_name COLLATE NOCASE, id);
+    CREATE INDEX idx_results_version_domain
+        ON results (schema_version, article_domain);
+    CREATE INDEX idx_results_version_decision
+        ON results (schema_version, match_decision, created_at);
+    CREATE INDEX idx_results_version_risk
+        ON results (schema_version, risk_category, created_at);
+    """,
+    # Data file name relative to data/ (NULL = legacy "<id>.json")
+    """
+    ALTER TABLE results ADD COLUMN data_path TEXT;
+    """,
+    # Full-text search (rows are backfilled from data files)
+    SEARCH_SCHEMA,
+    # Data backfills that have run to completion (see ResultsStorage.backfill)
+    """
+    CREATE TABLE backfills (name TEXT PRIMARY KEY, completed_at TEXT NOT NULL);
+    """,
+]
+
+METADATA_COLUMNS = (
+    "id",
+    "display_name",
+    "person_name",
+    "article_url",
+    "article_title",
+    "created_at",
+    "schema_version",
+    "article_domain",
+    "match_decision",
+    "risk_category",
+)
+
+# Top-level ScreeningResult fields; each is a section of a stored result
+RESULT_SECTIONS = tuple(ScreeningResult.model_fields)
+
+# Sort column and direction per sort order; ties are broken by id
+SORT_KEYS = {
+    ResultSort.NEWEST: ("created_at", "DESC"),
+    ResultSort.OLDEST: ("created_at", "ASC"),
+    ResultSort.PERSON_NAME: ("person_name COLLATE NOCASE", "ASC"),
+}
+
+
+class ResultsStorage:
+    """
+    File-based storage for screening results with a SQLite index.
+
+    Stores individual results as JSON files in a data directory and indexes
+    their metadata in results/index.sqlite3 for efficient listing and
+    filtering by schema version. Safe for concurrent writers (threads or
+    processes); SQLite serialises index inserts.
+    """
+
+    def __init__(
+        self,
+        results_dir: Path,
+        schema_version: str,
+        logger: Logger,
+        compression: Compression = Compression.NONE,
+    ) -> None:
+        """
+        Initialize results storage.
+
+        Args:
+            results_dir: Root directory for storing results
+            schema_version: Current application version for filtering
+            logger: Logger instance
+            compression: Method for newly written data files and blobs (files
+                written with any method remain readable)
+        """
+        ensure_available(compression)
+        self.results_dir = results_dir
+        self.data_dir = results_dir / "data"
+        self.index_db = results_dir / "index.sqlite3"
+        self.legacy_index_file = results_dir / "index.json"
+        self.schema_version = schema_version
+        self.logger = logger
+        self.compression = compression
+        self.blobs = BlobStore(results_dir / "blobs", compression)
+
+        # Create directories if they don't exist
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        self._db = ThreadLocalConnection(self.index_db)
+        migrate(self._db.get(), MIGRATIONS)
+
+        # One-time import of the pre-SQLite JSON index
+        if self.legacy_index_file.exists():
+            self.import_legacy_index()
+
+    def save_result(self, result: ScreeningResult) -> str:
+        """
+        Save a screening result to storage and index it.
+
+        Args:
+            result: Screening result to save (its id is kept if already set)
+
+        Returns:
+            UUID of the saved result
+        """
+        return self.save_results([result])[0]
+
+    def save_results(self, results: list[ScreeningResult]) -> list[str]:
+        """
+        Save several screening results, indexing them in one transaction.
+
+        Results without an id are assigned a new UUID.
+
+        Args:
+            results: Screening results to save
+
+        Returns:
+            UUIDs of the saved results, in input order
+        """
+        rows = []
+        for result in results:
+            if result.id is None:
+                result.id = str(uuid.uuid4())
+
+            # Save result data (article body deduplicated into the blob store)
+            data_path = shard_path(f"{result.id}.res")
+            self._write_sections(self.data_dir / data_path, result)
+
+            # Create metadata for the index
+            metadata = self._build_metadata(
+                result, created_at=datetime.now(timezone.utc).isoformat()
+            )
+            rows.append((result, metadata, data_path))
+
+        conn = self._db.get()
+        with conn:
+            for result, metadata, data_path in rows:
+                # An id that is already indexed already has its search row
+                if self._insert(conn, metadata, data_path=data_path):
+                    self._index_search(conn, result)
+
+        for result in results:
+            self.logger.info(f"Saved screening result with ID: {result.id}")
+        return [result.id for result in results]
+
+    def get_result(self, result_id: str) -> ScreeningResult:
+        """
+        Load a screening result by ID.
+
+        Args:
+            result_id: UUID of the result to load
+
+        Returns:
+            Screening result
+
+        Raises:
+            FileNotFoundError: If result doesn't exist
+        """
+        row = self._index_row(result_id)
+        document = self._read_document(result_id, row["data_path"] if row else None)
+        return ScreeningResult.model_validate_json(document)
+
+    def get_result_etag(
+        self, result_id: str, fields: list[str] | None = None
+    ) -> str | None:
+        """
+        Strong ETag for a result's JSON representation, or None if not indexed.
+
+        Saved results are immutable, so the ID, the schema version the JSON is
+        served at and the projected fields identify the bytes; answering a
+        conditional request needs only this index lookup, not the data file.
+
+        Raises:
+            ValueError: If a field is not a top-level ScreeningResult field
+        """
+        row = self._index_row(result_id)
+        if row is None:
+            return None
+        tag = f"{result_id}.{self._served_version(row['schema_version'])}"
+        if fields:
+            tag += "." + "+".join(self.resolve_fields(fields))
+        return f'"{tag}"'
+
+    def get_result_json(self, result_id: str, fields: list[str] | None = None) -> bytes:
+        """
+        Load a result's JSON representation (or a projection of it) as bytes.
+
+        Results saved under the current schema version are returned as stored,
+        with no parsing beyond the (small) article section: only the requested
+        sections are read and decompressed, and the article body is spliced
+        back in from the blob store. Older results go
+        through ScreeningResult validation so they are upgraded to the current
+        schema.
+
+        Args:
+            result_id: UUID of the result to load
+            fields: Top-level fields to include (default: all)
+
+        Raises:
+            FileNotFoundError: If result doesn't exist
+            ValueError: If a field is not a top-level ScreeningResult field
+        """
+        sections = self.resolve_fields(fields) if fields else None
+        row = self._index_row(result_id)
+        if row is None:
+            raise FileNotFoundError(f"Result not found: {result_id}")
+        if row["schema_version"] != self.schema_version:
+            result = self.get_result(result_id)
+            include = set(sections) if sections else None
+            return result.model_dump_json(include=include).encode("utf-8")
+        return self._read_document(result_id, row["data_path"], sections)
+
+    def resolve_fields(self, fields: list[str]) -> list[str]:
+        """
+        Validate a field projection; returns the fields deduplicated, in the
+        order they are stored.
+
+        Raises:
+            ValueError: If a field is not a top-level ScreeningResult field
+        """
+        unknown = set(fields) - set(RESULT_SECTIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(sorted(unknown))} "
+                f"(available: {', '.join(RESULT_SECTIONS)})"
+            )
+        return [name for name in RESULT_SECTIONS if name in fields]
+
+    def list_results(self, query: ResultQuery | None = None) -> ResultsPage:
+        """
+        List saved results for the current schema version, one page at a time.
+
+        Pages are keyset-paginated on the sort column and id, so each page is
+        an indexed range query regardless of how many results exist.
+
+        Args:
+            query: Filters, sort order, page size and cursor (defaults: newest
+                first, first page of 50)
+
+        Returns:
+            Page of result metadata with the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another
+                sort, or person_name has no searchable terms
+        """
+        query = query or ResultQuery()
+        column, direction = SORT_KEYS[query.sort]
+        where, params = self._build_filters(query)
+
+        if query.cursor is not None:
+            value, last_id = self._decode_cursor(query.cursor, query.sort)
+            operator = "<" if direction == "DESC" else ">"
+            where.append(f"({column}, id) {operator} (?, ?)")
+            params.extend([value, last_id])
+
+        rows = (
+            self._db.get()
+            .execute(
+                f"SELECT {', '.join(METADATA_COLUMNS)} FROM results "
+                f"WHERE {' AND '.join(where)} "
+                f"ORDER BY {column} {direction}, id {direction} LIMIT ?",
+                (*params, query.limit + 1),
+            )
+            .fetchall()
+        )
+
+        items = [ResultMetadata(**dict(row)) for row in rows[: query.limit]]
+        next_cursor = None
+        if len(rows) > query.limit:
+            next_cursor = self._encode_cursor(items[-1], query.sort)
+        return ResultsPage(items=items, next_cursor=next_cursor)
+
+    def search_results(
+        self, text: str, limit: int = 20, offset: int = 0
+    ) -> ResultSearchPage:
+        """
+        Full-text search over saved results for the current schema version.
+
+        Searches the screened person, entity names and aliases, organisations,
+        allegation categories and descriptions, the article title and entity
+        mention sentences, ranked by bm25 (name hits weigh most).
+
+        Args:
+            text: Words to match (all must match); "quoted phrases" supported
+            limit: Page size
+            offset: Number of hits to skip
+
+        Returns:
+            Page of hits, most relevant first
+
+        Raises:
+            ValueError: If the query has no searchable terms
+        """
+        weights = ", ".join(str(w) for w in SEARCH_COLUMNS.values())
+        columns = ", ".join(f"r.{column}" for column in METADATA_COLUMNS)
+        rows = (
+            self._db.get()
+            .execute(
+                f"SELECT {columns}, bm25(results_fts, 0, {weights}) AS score, "
+                "snippet(results_fts, -1, '[', ']', '…', 12) AS snippet "
+                "FROM results_fts JOIN results r ON r.id = results_fts.result_id "
+                "WHERE results_fts MATCH ? AND r.schema_version = ? "
+                "ORDER BY score LIMIT ? OFFSET ?",
+                (fts_query(text), self.schema_version, limit + 1, offset),
+            )
+            .fetchall()
+        )
+        items = [ResultSearchHit(**dict(row)) for row in rows[:limit]]
+        next_offset = offset + limit if len(rows) > limit else None
+        return ResultSearchPage(items=items, next_offset=next_offset)
+
+    def import_legacy_index(self) -> int:
+        """
+        Import the legacy index.json (and any unindexed data files) into SQLite.
+
+        Index entries are copied as-is. Data files with no index entry are
+        indexed from their content if they still validate against the current
+        ScreeningResult model, using the file's modification time as created_at.
+        Afterwards index.json is renamed to index.json.imported so the import
+        runs once; re-running it is harmless (existing IDs are skipped).
+
+        Returns:
+            Number of results added to the index
+        """
+        entries: list[ResultMetadata] = []
+        if self.legacy_index_file.exists():
+            legacy = ResultIndex(**json.loads(self.legacy_index_file.read_text()))
+            entries.extend(legacy.results)
+
+        known = {entry.id for entry in entries}
+        for result_file in self.data_dir.glob("*.json"):
+            if result_file.stem in known:
+                continue
+            try:
+                result = ScreeningResult.model_validate_json(result_file.read_text())
+            except (ValidationError, ValueError) as e:
+                self.logger.warning(f"Skipping unreadable result {result_file}: {e}")
+                continue
+            result.id = result_file.stem
+            created_at = datetime.fromtimestamp(
+                result_file.stat().st_mtime, tz=timezone.utc
+            ).isoformat()
+            entries.append(self._build_metadata(result, created_at=created_at))
+
+        conn = self._db.get()
+        with conn:
+            imported = sum(self._insert(conn, entry) for entry in entries)
+
+        if self.legacy_index_file.exists():
+            self.legacy_index_file.rename(
+                self.legacy_index_file.with_name("index.json.imported")
+            )
+        self.logger.info(f"Imported {imported} results into the SQLite index")
+        return imported
+
+    def backfill(self) -> None:
+        """
+        Fill index data for rows saved before it existed, from data files.
+
+        Each backfill runs until it has been through every row once and is
+        then recorded as done, so later startups skip it; rows it could not
+        read are logged that one time and left as they are. An interrupted
+        backfill resumes where it stopped.
+        """
+        conn = self._db.get()
+        done = {row["name"] for row in conn.execute("SELECT name FROM backfills")}
+        for name, run in (
+            ("filter_columns", self._backfill_filter_columns),
+            ("search_index", self._backfill_search_index),
+        ):
+            if name in done:
+                continue
+            run()
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO backfills (name, completed_at) "
+                    "VALUES (?, ?)",
+                    (name, datetime.now(timezone.utc).isoformat()),
+                )
+
+    def start_backfill(self) -> threading.Thread:
+        """
+        Run backfill() in a daemon thread, so startup does not wait for it.
+
+        Until it finishes, older results may be missing from filtered lists
+        and search.
+        """
+
+        def run() -> None:
+            try:
+                self.backfill()
+            except Exception as e:
+                self.logger.exception(f"Results backfill failed: {e}")
+
+        thread = threading.Thread(target=run, name="results-backfill", daemon=True)
+        thread.start()
+        return thread
+
+    def shard_flat_files(self) -> int:
+        """
+        Move indexed result files from the flat data/ directory into shards.
+
+        Safe to run while the service is serving: each file is hard-linked
+        into its shard, the index is pointed at it, and only then is the flat
+        name removed, so readers always find the file the index names.
+        Re-running it skips results that are already sharded.
+
+        Returns:
+            Number of files moved
+        """
+        conn = self._db.get()
+        rows = conn.execute("SELECT id, data_path FROM results").fetchall()
+        moved = 0
+        for row in rows:
+            flat_path = row["data_path"] or f"{row['id']}.json"
+            if "/" in flat_path:
+                continue
+            source = self.data_dir / flat_path
+            if not source.exists():
+                continue
+
+            target_path = shard_path(source.name)
+            target = self.data_dir / target_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if not target.exists():
+                os.link(source, target)
+            with conn:
+                conn.execute(
+                    "UPDATE results SET data_path = ? WHERE id = ?",
+                    (target_path, row["id"]),
+                )
+            source.unlink()
+            moved += 1
+            if moved % 10_000 == 0:
+                self.logger.info(f"Sharded {moved} result files")
+
+        self.logger.info(f"Sharded {moved} result files into {self.data_dir}")
+        return moved
+
+    def _index_row(self, result_id: str):
+        return (
+            self._db.get()
+            .execute(
+                "SELECT schema_version, data_path FROM results WHERE id = ?",
+                (result_id,),
+            )
+            .fetchone()
+        )
+
+    def _read_document(
+        self,
+        result_id: str,
+        data_path: str | None,
+        sections: list[str] | None = None,
+    ) -> bytes:
+        """
+        Stored JSON for a result (all sections or the given ones), decompressed
+        and with the article body loaded from the blob store.
+        """
+        result_file = self.data_dir / (data_path or f"{result_id}.json")
+        if not result_file.exists():
+            raise FileNotFoundError(f"Result not found: {result_id}")
+
+        if is_sectioned(result_file):
+            found = read_sections(result_file, sections)
+            if "article" in found:
+                article = json.loads(found["article"])
+                found["article"] = json.dumps(
+                    self._hydrate_article(article), ensure_ascii=False
+                ).encode("utf-8")
+            return join_sections(found)
+
+        # Whole-document files (saved before sections): project after parsing
+        data = json.loads(decompress(result_file.read_bytes()))
+        if isinstance(data.get("article"), dict):
+            data["article"] = self._hydrate_article(data["article"])
+        if sections is not None:
+            data = {name: data[name] for name in sections if name in data}
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def _write_sections(self, result_file: Path, result: ScreeningResult) -> None:
+        """Write a result in the sectioned format, one section per field."""
+        result_file.parent.mkdir(parents=True, exist_ok=True)
+        sections = self._dehydrate(result).model_dump(mode="json")
+        result_file.write_bytes(
+            encode_sections(
+                {
+                    name: json.dumps(value, ensure_ascii=False).encode("utf-8")
+                    for name, value in sections.items()
+                },
+                self.compression,
+            )
+        )
+
+    def _dehydrate(self, result: ScreeningResult) -> ScreeningResult:
+        """Copy of a result with the article body replaced by a blob reference."""
+        content = result.article.content
+        if not content:
+            return result
+        digest = self.blobs.put(json.dumps(content, ensure_ascii=False).encode("utf-8"))
+        article = result.article.model_copy(update={"content": blob_ref(digest)})
+        return result.model_copy(update={"article": article})
+
+    def _hydrate_article(self, article: dict) -> dict:
+        """
+        Stored article data with its body loaded back from the blob store.
+
+        Only the content field _dehydrate() replaced is resolved; other
+        strings that look like blob references (user input, say) are kept.
+        """
+        digest = blob_digest(article.get("content"))
+        if digest is None:
+            return article
+        return {**article, "content": json.loads(self.blobs.get(digest))}
+
+    def _served_version(self, stored_version: str) -> str:
+        """Schema version a stored result is served at (older ones are upgraded)."""
+        if stored_version == self.schema_version:
+            return stored_version
+        return f"{stored_version}-{self.schema_version}"
+
+    def _backfill_filter_columns(self) -> None:
+        """
+        Fill filter columns for rows indexed before they existed.
+
+        Reads each such result's data file once; rows whose file is missing or
+        unreadable get only the domain (derived from the indexed URL).
+        """
+        conn = self._db.get()
+        rows = conn.execute(
+            "SELECT id, article_url FROM results WHERE article_domain IS NULL"
+        ).fetchall()
+        if not rows:
+            return
+
+        updates = []
+        for row in rows:
+            decision = risk = None
+            try:
+                result = self.get_result(row["id"])
+                decision, risk = _match_decision(result), _risk_category(result)
+            except (FileNotFoundError, ValidationError, ValueError) as e:
+                self.logger.warning(f"Cannot backfill result {row['id']}: {e}")
+            updates.append((url_domain(row["article_url"]), decision, risk, row["id"]))
+
+        with conn:
+            conn.executemany(
+                "UPDATE results SET article_domain = ?, match_decision = ?, "
+                "risk_category = ? WHERE id = ?",
+                updates,
+            )
+        self.logger.info(f"Backfilled filter columns for {len(updates)} results")
+
+    def _backfill_search_index(self) -> None:
+        """Add results indexed before full-text search existed to results_fts."""
+        conn = self._db.get()
+        rows = conn.execute(
+            "SELECT id FROM results "
+            "WHERE id NOT IN (SELECT result_id FROM results_fts)"
+        ).fetchall()
+        if not rows:
+            return
+
+        indexed = 0
+        for row in rows:
+            try:
+                result = self.get_result(row["id"])
+            except (FileNotFoundError, ValidationError, ValueError) as e:
+                self.logger.warning(f"Cannot index result {row['id']} for search: {e}")
+                continue
+            result.id = row["id"]
+            with conn:
+                self._index_search(conn, result)
+            indexed += 1
+        self.logger.info(f"Added {indexed} results to the search index")
+
+    def _index_search(self, conn, result: ScreeningResult) -> None:
+        """Insert a result's search document (inside the caller's transaction)."""
+        conn.execute(
+            f"INSERT INTO results_fts (result_id, {', '.join(SEARCH_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' * len(SEARCH_COLUMNS))})",
+            (result.id, *search_document(result)),
+        )
+
+    def _build_filters(self, query: ResultQuery) -> tuple[list[str], list]:
+        """WHERE clauses and parameters for a query's filters."""
+        where, params = ["schema_version = ?"], [self.schema_version]
+        if query.person_name:
+            # Through the full-text index: a LIKE '%...%' would scan every row
+            where.append(
+                "id IN (SELECT result_id FROM results_fts WHERE results_fts MATCH ?)"
+            )
+            params.append(f"person_name : ({fts_query(query.person_name)})")
+        if query.url:
+            where.append("article_url = ?")
+            params.append(query.url)
+        if query.domain:
+            domain = query.domain.strip().lower().removeprefix("www.")
+            where.append("(article_domain = ? OR article_domain LIKE ? ESCAPE '\\')")
+            params.extend([domain, f"%.{_escape_like(domain)}"])
+        if query.created_from:
+            where.append("created_at >= ?")
+            params.append(_as_utc(query.created_from))
+        if query.created_to:
+            where.append("created_at <= ?")
+            params.append(_as_utc(query.created_to))
+        if query.match_decision:
+            where.append("match_decision = ?")
+            params.append(query.match_decision.value)
+        if query.risk_category:
+            where.append("risk_category = ?")
+            params.append(query.risk_category)
+        return where, params
+
+    def _encode_cursor(self, last: ResultMetadata, sort: ResultSort) -> str:
+        """Opaque cursor pointing just past the given row."""
+        value = last.person_name if sort == ResultSort.PERSON_NAME else last.created_at
+        payload = json.dumps([sort.value, value, last.id]).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii")
+
+    def _decode_cursor(self, cursor: str, sort: ResultSort) -> tuple[str, str]:
+        """Sort value and id encoded in a cursor."""
+        try:
+            cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(cursor))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+        if cursor_sort != sort.value:
+            raise ValueError("Cursor was issued for a different sort order")
+        return value, last_id
+
+    def _insert(
+        self, conn, metadata: ResultMetadata, data_path: str | None = None
+    ) -> int:
+        """Insert one index row (skipping existing IDs); returns rows added."""
+        columns = (*METADATA_COLUMNS, "data_path")
+        return conn.execute(
+            f"INSERT OR IGNORE INTO results ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            (
+                *(_column_value(metadata, column) for column in METADATA_COLUMNS),
+                data_path,
+            ),
+        ).rowcount
+
+    def _build_metadata(
+        self, result: ScreeningResult, created_at: str
+    ) -> ResultMetadata:
+        """Index metadata for a result that has been assigned an ID."""
+        return ResultMetadata(
+            id=result.id,
+            display_name=self._build_display_name(
+                result.query_person.name, result.article.title
+            ),
+            person_name=result.query_person.name,
+            article_url=result.article.url,
+            article_title=result.article.title,
+            created_at=created_at,
+            schema_version=self.schema_version,
+            article_domain=url_domain(result.article.url),
+            match_decision=_match_decision(result),
+            risk_category=_risk_category(result),
+        )
+
+    def _build_display_name(self, person_name: str, article_title: str) -> str:
+        """
+        Build a human-friendly display name.
+
+        Args:
+            person_name: Full name of the person
+            article_title: Article title
+
+        Returns:
+            Display name in format "Person Name - Article Title"
+        """
+        truncated_title = self._truncate_title(article_title)
+        return f"{person_name} - {truncated_title}"
+
+    def _truncate_title(self, title: str, max_len: int = 50) -> str:
+        """
+        Truncate long titles with ellipsis.
+
+        Args:
+            title: Title to truncate
+            max_len: Maximum length before truncation
+
+        Returns:
+            Truncated title
+        """
+        if len(title) <= max_len:
+            return title
+        return title[: max_len - 3] + "..."
+
+
+def shard_path(file_name: str) -> str:
+    """Data file path (relative to data/) for a result file: "ab/cd/<file_name>"."""
+    return f"{file_name[:2]}/{file_name[2:4]}/{file_name}"
+
+
+def _match_decision(result: ScreeningResult) -> MatchDecision:
+    """Decision of the primary match, or NO_MATCH when nothing matched."""
+    primary = result.matching.primary_match
+    return primary.decision if primary is not None else MatchDecision.NO_MATCH
+
+
+def _risk_category(result: ScreeningResult) -> str | None:
+    """Risk category of the highest-scoring sentiment assessment, if any."""
+    if result.sentiment is None or not result.sentiment.assessments:
+        return None
+    return max(result.sentiment.assessments, key=lambda a: a.risk_score).risk_category
+
+
+def _column_value(metadata: ResultMetadata, column: str):
+    value = getattr(metadata, column)
+    return value.value if isinstance(value, MatchDecision) else value
+
+
+def _as_utc(value: datetime) -> str:
+    """ISO timestamp comparable with stored created_at values (naive = UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
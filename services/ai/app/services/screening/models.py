@@ -22,6 +22,7 @@ class ScreeningResult(BaseModel):
     and matching results. Future versions will include sentiment analysis.
 
     Attributes:
+        id: Result UUID (also the ID it is saved under)
         query_person: The person being screened (with normalised fields)
         article: Full article content (single source of truth, not duplicated)
         entities: All extracted entities (needed for allegations/sentiment later)
@@ -35,6 +36,7 @@ class ScreeningResult(BaseModel):
 
     """
 
+    id: str | None = None  # Assigned when the result is built
     article: Article  # Full article at top level (url, title, content)
     article_credibility: CredibilityResult | None = None
     query_person: QueryPerson
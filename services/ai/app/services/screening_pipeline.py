@@ -4,19 +4,30 @@ Screening pipeline for adverse media analysis.
 Orchestrates the complete workflow: scrape → extract → match → (future: sentiment).
 """
 
+import asyncio
+import time
+import uuid
+
 from app.config import Settings
 from app.models.articles import Article
+from app.services.artifacts import (
+    ArticleArtifacts,
+    ArticleArtifactStore,
+    article_content_hash,
+)
 from app.services.credibility.analyser import CredibilityAnalyser
 from app.services.credibility.models import CredibilityResult
 from app.services.extraction.llm import EntityExtractor
 from app.services.extraction.models import ExtractionResult
 from app.services.matching.matcher import PersonMatcher
 from app.services.matching.models import MatchingResult, QueryPerson
+from app.services.results.persister import ResultPersister
 from app.services.results.storage import ResultsStorage
 from app.services.screening.models import ScreeningResult
 from app.services.sentiment.analyser import SentimentAnalyser
 from app.services.sentiment.models import SentimentResult
 from app.utils.scraping import ArticleScraper
+from app.utils.urls import canonical_url, url_domain
 
 
 class ScreeningPipeline:
@@ -25,6 +36,11 @@ class ScreeningPipeline:
 
     Coordinates scraping, entity extraction, and person matching to produce
     comprehensive screening results.
+
+    With an artifact store configured, the scraped article, credibility and
+    extraction are reused across screenings of the same article, so repeat
+    screenings only run matching and sentiment. Near-duplicates of an analysed
+    article (syndicated copies on other domains) reuse its extraction too.
     """
 
     def __init__(
@@ -36,6 +52,8 @@ class ScreeningPipeline:
         analyser: CredibilityAnalyser | None = None,
         sentiment_analyser: SentimentAnalyser | None = None,
         storage: ResultsStorage | None = None,
+        artifact_store: ArticleArtifactStore | None = None,
+        persister: ResultPersister | None = None,
     ):
         """
         Initialize screening pipeline with required services.
@@ -48,6 +66,10 @@ class ScreeningPipeline:
             analyser: Credibility analyser (optional)
             sentiment_analyser: Sentiment analyser (optional)
             storage: Results storage for auto-saving (optional)
+            artifact_store: Per-article store for reusing the scraped article,
+                credibility and extraction across screenings (optional)
+            persister: Write-behind saver used by the async paths instead of
+                saving inline (optional; falls back to storage)
         """
         self.scraper = scraper
         self.extractor = extractor
@@ -56,6 +78,8 @@ class ScreeningPipeline:
         self.analyser = analyser
         self.sentiment_analyser = sentiment_analyser
         self.storage = storage
+        self.artifact_store = artifact_store
+        self.persister = persister
 
     def screen(self, url: str, query_person: QueryPerson) -> ScreeningResult:
         """
@@ -81,16 +105,26 @@ class ScreeningPipeline:
             >>> if result.matching.has_definite_match:
             ...     print(f"Match found: {result.matching.summary}")
         """
-        # Step 1: Scrape article
-        article: Article = self.scraper.extract_article(url)
+        # Step 1: Scrape article (or reuse a recent scrape of the same URL)
+        url_key = canonical_url(url)
+        cached = self._lookup_by_url(url_key, url)
+        if cached is not None:
+            article: Article = cached.article
+        else:
+            article = self.scraper.extract_article(url)
+            cached = self._lookup_by_content(url_key, article)
 
-        # Optional step: Credibility assessment first
-        credibility: CredibilityResult | None = None
-        if self.analyser is not None:
+        # Optional step: Credibility assessment first (reused if current)
+        credibility = self._reusable_credibility(cached)
+        if self.analyser is not None and credibility is None:
             credibility = self.analyser.assess(article)
 
-        # Step 2: Extract entities
-        extraction_result: ExtractionResult = self.extractor.extract(article)
+        # Step 2: Extract entities (reused if current)
+        extraction_result = self._reusable_extraction(cached)
+        if extraction_result is None:
+            extraction_result = self.extractor.extract(article)
+
+        self._store_artifacts(url_key, article, credibility, extraction_result, cached)
 
         # Step 3: Match query person against entities
         matching_result: MatchingResult = self.matcher.match(
@@ -105,8 +139,190 @@ class ScreeningPipeline:
                 targets, extraction_result, article
             )
 
-        # Build comprehensive result
-        result = ScreeningResult(
+        result = self._build_result(
+            article,
+            credibility,
+            query_person,
+            extraction_result,
+            matching_result,
+            sentiment_result,
+        )
+
+        # Auto-save result if storage is configured
+        if self.storage is not None:
+            self.storage.save_result(result)
+        return result
+
+    async def ascreen(self, url: str, query_person: QueryPerson) -> ScreeningResult:
+        """
+        Execute the screening workflow asynchronously.
+
+        Same stages as screen(), but LLM calls use ainvoke and the credibility
+        assessment runs concurrently with entity extraction, since both only
+        need the scraped article.
+
+        Args:
+            url: Article URL to screen
+            query_person: Person to match against article entities
+
+        Returns:
+            ScreeningResult with article, entities, and matching data
+        """
+        # Steps 1-2: Scrape, assess credibility and extract entities (or reuse)
+        article, credibility, extraction_result = await self._aprepare_article(url)
+
+        # Step 3: Match query person against entities
+        matching_result: MatchingResult = await self.matcher.amatch(
+            query_person, extraction_result
+        )
+
+        # Step 4: Sentiment analysis on selected targets
+        sentiment_result: SentimentResult | None = None
+        if self.sentiment_analyser is not None:
+            targets = matching_result.get_sentiment_targets()
+            sentiment_result = await self.sentiment_analyser.aanalyse_batch(
+                targets, extraction_result, article
+            )
+
+        result = self._build_result(
+            article,
+            credibility,
+            query_person,
+            extraction_result,
+            matching_result,
+            sentiment_result,
+        )
+        await self._asave(result)
+        return result
+
+    async def ascreen_batch(
+        self, url: str, query_persons: list[QueryPerson]
+    ) -> list[ScreeningResult]:
+        """
+        Screen many persons against one article.
+
+        The article is scraped, assessed and extracted once. All persons are
+        matched concurrently (sharing the matcher's concurrency limit), and
+        sentiment runs once per unique matched entity; each person's result
+        gets the assessments for their own sentiment targets.
+
+        Args:
+            url: Article URL to screen
+            query_persons: Persons to match against article entities
+
+        Returns:
+            One ScreeningResult per person, in input order
+        """
+        article, credibility, extraction_result = await self._aprepare_article(url)
+
+        # Match every person against the same entities, bounded as one workload
+        semaphore = asyncio.Semaphore(self.matcher.max_concurrency)
+        matching_results: list[MatchingResult] = list(
+            await asyncio.gather(
+                *(
+                    self.matcher.amatch(person, extraction_result, semaphore=semaphore)
+                    for person in query_persons
+                )
+            )
+        )
+
+        # Sentiment once per unique target entity across all persons
+        shared_sentiment: SentimentResult | None = None
+        if self.sentiment_analyser is not None:
+            targets = list(
+                dict.fromkeys(
+                    entity_id
+                    for matching in matching_results
+                    for entity_id in matching.get_sentiment_targets()
+                )
+            )
+            shared_sentiment = await self.sentiment_analyser.aanalyse_batch(
+                targets, extraction_result, article
+            )
+
+        results: list[ScreeningResult] = []
+        for person, matching in zip(query_persons, matching_results):
+            sentiment = self._select_sentiment(
+                shared_sentiment, matching.get_sentiment_targets()
+            )
+            result = self._build_result(
+                article, credibility, person, extraction_result, matching, sentiment
+            )
+            await self._asave(result)
+            results.append(result)
+        return results
+
+    async def _aprepare_article(
+        self, url: str
+    ) -> tuple[Article, CredibilityResult | None, ExtractionResult]:
+        """
+        Scrape the article, assess credibility and extract entities.
+
+        Each step is skipped when the artifact store already holds a current
+        result for this article. Credibility and extraction run concurrently.
+        """
+        # Step 1: Scrape article (or reuse a recent scrape of the same URL)
+        url_key = canonical_url(url)
+        cached = await asyncio.to_thread(self._lookup_by_url, url_key, url)
+        if cached is not None:
+            article: Article = cached.article
+        else:
+            article = await self.scraper.aextract_article(url)
+            cached = await asyncio.to_thread(self._lookup_by_content, url_key, article)
+
+        # Steps 2a/2b: Credibility assessment and entity extraction in parallel,
+        # skipping whichever is already available for this article
+        credibility = self._reusable_credibility(cached)
+        extraction_result = self._reusable_extraction(cached)
+        pending = {}
+        if self.analyser is not None and credibility is None:
+            pending["credibility"] = self.analyser.aassess(article)
+        if extraction_result is None:
+            pending["extraction"] = self.extractor.aextract(article)
+        if pending:
+            outputs = dict(zip(pending, await asyncio.gather(*pending.values())))
+            credibility = outputs.get("credibility", credibility)
+            extraction_result = outputs.get("extraction", extraction_result)
+
+        await asyncio.to_thread(
+            self._store_artifacts,
+            url_key,
+            article,
+            credibility,
+            extraction_result,
+            cached,
+        )
+        return article, credibility, extraction_result
+
+    def _select_sentiment(
+        self, shared: SentimentResult | None, entity_ids: list[str]
+    ) -> SentimentResult | None:
+        """Subset of a shared sentiment result covering the given entities."""
+        if shared is None:
+            return None
+        assessments = [
+            a.model_copy(deep=True)
+            for a in shared.assessments
+            if a.entity_id in entity_ids
+        ]
+        if not assessments:
+            return None
+        return SentimentResult(
+            assessments=assessments, metadata=shared.metadata.model_copy()
+        )
+
+    def _build_result(
+        self,
+        article: Article,
+        credibility: CredibilityResult | None,
+        query_person: QueryPerson,
+        extraction_result: ExtractionResult,
+        matching_result: MatchingResult,
+        sentiment_result: SentimentResult | None,
+    ) -> ScreeningResult:
+        """Build the comprehensive result, with its ID assigned up front."""
+        return ScreeningResult(
+            id=str(uuid.uuid4()),
             article=article,
             article_credibility=credibility,
             query_person=query_person,
@@ -115,10 +331,147 @@ class ScreeningPipeline:
             sentiment=sentiment_result,
         )
 
-        # Auto-save result if storage is configured
-        if self.storage is not None:
-            _ = self.storage.save_result(result)
-            # Logger should be available through storage, but we can't access it here
-            # The storage will handle logging
+    async def _asave(self, result: ScreeningResult) -> None:
+        """Hand the result to the write-behind persister, or save it directly."""
+        if self.persister is not None:
+            await self.persister.submit(result)
+        elif self.storage is not None:
+            # Storage does blocking file I/O, so keep it off the event loop
+            await asyncio.to_thread(self.storage.save_result, result)
 
-        return result
+    def _lookup_by_url(self, url_key: str, url: str) -> ArticleArtifacts | None:
+        """Fresh artifacts for this URL, with the article URL set as requested."""
+        if self.artifact_store is None:
+            return None
+        cached = self.artifact_store.get_latest(url_key)
+        if cached is None:
+            return None
+        cached.article = cached.article.model_copy(update={"url": url})
+        return cached
+
+    def _lookup_by_content(
+        self, url_key: str, article: Article
+    ) -> ArticleArtifacts | None:
+        """
+        Fresh artifacts for this exact scraped content, under this URL or the
+        page's declared canonical URL; failing that, those of a near-duplicate
+        article.
+        """
+        if self.artifact_store is None:
+            return None
+        content_hash = article_content_hash(article)
+        for key in _artifact_keys(url_key, article):
+            cached = self.artifact_store.get(key, content_hash)
+            if cached is not None:
+                return cached
+        return self._lookup_near_duplicate(url_key, article)
+
+    def _lookup_near_duplicate(
+        self, url_key: str, article: Article
+    ) -> ArticleArtifacts | None:
+        """
+        Artifacts of a near-duplicate article, for reusing its extraction.
+
+        Only copies of other pages qualify: an earlier version of this page
+        (same URL or declared canonical URL) may lack people named in an
+        update, and re-anchoring cannot add them. The extraction's sentence
+        ids and offsets refer to the other article's text, so it is
+        re-anchored to this one. Credibility depends on the
+        publishing domain, so a copy found on another domain is reassessed
+        unless configured otherwise.
+        """
+        if not self.settings.near_duplicate_enabled:
+            return None
+        cached = self.artifact_store.find_near_duplicate(
+            article,
+            min_similarity=self.settings.near_duplicate_min_similarity,
+            exclude_url_keys=frozenset(_artifact_keys(url_key, article)),
+        )
+        if cached is None:
+            return None
+        if cached.extraction is not None:
+            cached = cached.model_copy(
+                update={
+                    "extraction": self.extractor.reanchor(cached.extraction, article)
+                }
+            )
+        if self.settings.near_duplicate_fresh_credibility and url_domain(
+            cached.url_key
+        ) != url_domain(url_key):
+            cached = cached.model_copy(
+                update={"credibility": None, "credibility_stamp": None}
+            )
+        return cached
+
+    def _reusable_credibility(
+        self, cached: ArticleArtifacts | None
+    ) -> CredibilityResult | None:
+        """Cached credibility, if produced by the current analyser version."""
+        if cached is None or self.analyser is None:
+            return None
+        if cached.credibility_stamp != self.analyser.version_stamp:
+            return None
+        return cached.credibility
+
+    def _reusable_extraction(
+        self, cached: ArticleArtifacts | None
+    ) -> ExtractionResult | None:
+        """Cached extraction, if produced by the current extractor version."""
+        if cached is None or cached.extraction_stamp != self.extractor.version_stamp:
+            return None
+        return cached.extraction
+
+    def _store_artifacts(
+        self,
+        url_key: str,
+        article: Article,
+        credibility: CredibilityResult | None,
+        extraction_result: ExtractionResult,
+        cached: ArticleArtifacts | None,
+    ) -> None:
+        """Record the article-level artifacts unless they were all reused."""
+        if self.artifact_store is None:
+            return
+        content_hash = article_content_hash(article)
+        if (
+            cached is not None
+            and cached.content_hash == content_hash
+            and cached.extraction is extraction_result
+            and cached.credibility is credibility
+        ):
+            return
+
+        artifacts = ArticleArtifacts(
+            url_key=url_key,
+            content_hash=content_hash,
+            article=article,
+            credibility=credibility,
+            credibility_stamp=(
+                self.analyser.version_stamp
+                if credibility is not None and self.analyser is not None
+                else None
+            ),
+            extraction=extraction_result,
+            extraction_stamp=self.extractor.version_stamp,
+            # Same content: keep its original age, so re-saving it does not
+            # extend its TTL. A near-duplicate's age is not this entry's.
+            created_at=(
+                cached.created_at
+                if cached is not None and cached.content_hash == content_hash
+                else time.time()
+            ),
+        )
+        # Also under the declared canonical URL, so other variants of the page
+        # (AMP, mobile, syndicated copies) reuse them
+        for key in _artifact_keys(url_key, article):
+            self.artifact_store.put(artifacts.model_copy(update={"url_key": key}))
+
+
+def _artifact_keys(url_key: str, article: Article) -> list[str]:
+    """The requested URL key, plus the page's declared canonical URL if different."""
+    keys = [url_key]
+    if article.canonical_url:
+        declared = canonical_url(article.canonical_url)
+        if declared != url_key:
+            keys.append(declared)
+    return keys
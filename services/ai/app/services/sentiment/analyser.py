@@ -2,6 +2,7 @@
 LLM-based adverse media sentiment analyser for matched persons.
 """
 
+import asyncio
 import time
 from datetime import datetime
 
@@ -12,7 +13,9 @@ from langchain_core.prompts import ChatPromptTemplate
 from app.models.articles import Article
 from app.models.llm_metadata import AnalyserMetadata
 from app.services.extraction.models import Entity, ExtractionResult
+from app.services.llm_cache import LLMResponseCache, build_chain
 from app.utils.logger import get_logger
+from app.utils.sentences import SentenceIndex
 
 from .models import SentimentAssessment, SentimentResult
 from .prompt import PROMPT_VERSION, SENTIMENT_PROMPT
@@ -33,9 +36,10 @@ class SentimentAnalyser:
         provider,
         model_name: str,
         logger=get_logger(service="sentiment"),
+        cache: LLMResponseCache | None = None,
     ):
         """
-        Initialise sentiment analyser with LLM.
+        Initialise sentiment analyser with LLM and optional response cache.
         """
         self.llm = llm
         self.provider = provider
@@ -45,7 +49,15 @@ class SentimentAnalyser:
         # Setup parser and prompt template
         self.parser = PydanticOutputParser(pydantic_object=SentimentAssessment)
         self.prompt_template = ChatPromptTemplate.from_template(SENTIMENT_PROMPT)
-        self.chain = self.prompt_template | self.llm | self.parser
+        self.chain = build_chain(
+            self.prompt_template,
+            self.llm,
+            self.parser,
+            cache=cache,
+            provider=self.provider,
+            model_name=self.model_name,
+            prompt_version=PROMPT_VERSION,
+        )
 
     def preprocess(self, entity: Entity, article: Article) -> dict:
         """
@@ -59,20 +71,32 @@ class SentimentAnalyser:
                 "employments",
                 "relationships",
                 "mention_sentences",
-            }
+            },
+            # Offsets are for auditing, not for the model
+            exclude={
+                "employments": {"__all__": {"evidence"}},
+                "relationships": {"__all__": {"evidence"}},
+            },
         )
 
-        # Provide both mention sentences and full article for context
-        mention_text = (
-            "\n".join(entity.mention_sentences)
-            if entity.mention_sentences
-            else "No specific mentions extracted"
-        )
+        # Provide both mention sentences and full article for context, with
+        # sentence ids for citing evidence
+        index = SentenceIndex.for_article(article)
+        if entity.mention_sentence_ids:
+            mention_text = "\n".join(
+                f"[{sentence.id}] {sentence.text}"
+                for sentence_id in entity.mention_sentence_ids
+                if (sentence := index.get(sentence_id)) is not None
+            )
+        elif entity.mention_sentences:
+            mention_text = "\n".join(entity.mention_sentences)
+        else:
+            mention_text = "No specific mentions extracted"
 
         return {
             **entity_data,
             "mention_sentences_text": mention_text,
-            "full_article": article.content,
+            "full_article": index.render(),
         }
 
     def compose_prompt(self, context: dict) -> dict:
@@ -91,16 +115,33 @@ class SentimentAnalyser:
         """
         return self.chain.invoke(prompt_data)
 
+    async def ainvoke_model(self, prompt_data: dict) -> SentimentAssessment:
+        """
+        Invoke LLM chain asynchronously and return parsed assessment.
+        """
+        return await self.chain.ainvoke(prompt_data)
+
     def postprocess(
-        self, assessment: SentimentAssessment, entity: Entity
+        self, assessment: SentimentAssessment, entity: Entity, article: Article
     ) -> SentimentAssessment:
         """
-        Post-process assessment and ensure entity IDs are set.
+        Post-process assessment: set entity IDs and resolve evidence spans.
 
+        Cited sentence ids and quotes are resolved to exact article text and
+        offsets. A quote that cannot be found is kept without offsets (for
+        manual review); a span citing an unknown id and no quote is dropped.
         """
         # Ensure entity identification is set
         assessment.entity_id = entity.id
         assessment.entity_name = entity.name
+
+        index = SentenceIndex.for_article(article)
+        for allegation in assessment.allegations:
+            allegation.evidence_spans = [
+                index.resolve(span) or span
+                for span in allegation.evidence_spans
+                if span.quote or index.get(span.sentence_id) is not None
+            ]
         return assessment
 
     def analyse(self, entity: Entity, article: Article) -> SentimentAssessment:
@@ -123,7 +164,35 @@ class SentimentAnalyser:
             prompt_data = self.compose_prompt(context)
             assessment = self.invoke_model(prompt_data)
             processing_time = time.time() - start_time
-            final_assessment = self.postprocess(assessment, entity)
+            final_assessment = self.postprocess(assessment, entity, article)
+
+            self.logger.info(
+                "Sentiment analysed in {:.2f}s: {} allegations, risk={}",
+                processing_time,
+                len(final_assessment.allegations),
+                final_assessment.risk_category,
+            )
+            return final_assessment
+
+        except Exception as e:
+            self.logger.exception(
+                "Sentiment analysis failed for {}: {}", entity.name, e
+            )
+            raise RuntimeError(f"Failed to analyse sentiment: {e}")
+
+    async def aanalyse(self, entity: Entity, article: Article) -> SentimentAssessment:
+        """
+        Async variant of analyse() using the chain's ainvoke.
+        """
+        self.logger.info("Analysing sentiment for entity: {}", entity.name)
+        start_time = time.time()
+
+        try:
+            context = self.preprocess(entity, article)
+            prompt_data = self.compose_prompt(context)
+            assessment = await self.ainvoke_model(prompt_data)
+            processing_time = time.time() - start_time
+            final_assessment = self.postprocess(assessment, entity, article)
 
             self.logger.info(
                 "Sentiment analysed in {:.2f}s: {} allegations, risk={}",
@@ -191,3 +260,47 @@ class SentimentAnalyser:
 
         processing_time = time.time() - start_time
         return self.build_result(assessments, processing_time)
+
+    async def aanalyse_batch(
+        self,
+        entity_ids: list[str],
+        extraction_result: ExtractionResult,
+        article: Article,
+    ) -> SentimentResult | None:
+        """
+        Async variant of analyse_batch(); entities are analysed concurrently.
+        """
+        if not entity_ids:
+            return None
+
+        start_time = time.time()
+        entities: list[Entity] = []
+        for entity_id in entity_ids:
+            entity = extraction_result.get_entity_by_id(entity_id)
+            if not entity:
+                self.logger.warning("Entity not found: {}", entity_id)
+                continue
+            entities.append(entity)
+
+        outcomes = await asyncio.gather(
+            *(self.aanalyse(entity, article) for entity in entities),
+            return_exceptions=True,
+        )
+
+        assessments: list[SentimentAssessment] = []
+        for entity, outcome in zip(entities, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.error(
+                    "Failed to analyse sentiment for entity {}: {}",
+                    entity.name,
+                    outcome,
+                )
+                # Continue with other entities
+                continue
+            assessments.append(outcome)
+
+        if not assessments:
+            return None
+
+        processing_time = time.time() - start_time
+        return self.build_result(assessments, processing_time)
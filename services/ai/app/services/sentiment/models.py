@@ -4,17 +4,10 @@ Pydantic data models for adverse media sentiment analysis.
 
 from pydantic import BaseModel, Field
 
+from app.models.evidence import EvidenceSpan
 from app.models.llm_metadata import AnalyserMetadata
 
 
-class EvidenceSpan(BaseModel):
-    """Sentence-level evidence with indices for auditability."""
-
-    quote: str
-    start_index: int | None = None
-    end_index: int | None = None
-
-
 class Allegation(BaseModel):
     """
     Individual allegation extracted from article.
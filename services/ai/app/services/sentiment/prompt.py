@@ -1,4 +1,4 @@
-PROMPT_VERSION = "0.1.1"
+PROMPT_VERSION = "0.2.0"
 
 SENTIMENT_PROMPT = """You are an adverse media sentiment analyst for a regulated financial institution.
 
@@ -12,10 +12,10 @@ SENTIMENT_PROMPT = """You are an adverse media sentiment analyst for a regulated
   - Aliases: {aliases}
   - Roles/employments: {employments}
   - Relationships: {relationships}
-**Article snippets** (sentences where {name} is mentioned):
+**Article snippets** (sentences where {name} is mentioned, with their [id]):
 {mention_sentences_text}
 
-**Full article** (for additional context if needed):
+**Full article** (for additional context if needed; each sentence starts with its [id]):
 {full_article}
 
 **What you must NOT do**:
@@ -95,7 +95,7 @@ For each identified adverse mention, extract:
 - **monetary_amount**: if mentioned (e.g., "$13bn", "millions")
 - **timeframe**: when it occurred (e.g., "in the 1990s", "March 2022", "recent")
 - **jurisdiction**: where (e.g., "Jersey", "Spain", "UK")
-- **evidence_spans**: exact sentences with start/end character indices (if available)
+- **evidence_spans**: one per supporting sentence, citing its sentence_id; add a quote only when the evidence is part of a sentence (copy that part exactly). Never copy whole sentences
 - **subject_response**: entity's response to THIS allegation, if stated
 
 **Severity guidelines**:
@@ -154,7 +154,7 @@ Provide **rationale** summarising:
 1. Conservative bias: when uncertain, flag for review
 2. Only analyse content explicitly about {name}
 3. Distinguish allegations from facts (use status + tone signals)
-4. Cite evidence spans for every allegation
+4. Cite evidence spans for every allegation (by sentence id)
 5. Do not infer beyond text (no speculation)
 
 {format_instructions}
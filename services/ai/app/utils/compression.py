@@ -0,0 +1,58 @@
+"""
+Byte compression helpers for on-disk storage.
+
+Compressed payloads are recognised by their magic bytes on read, so data
+written with any method (or none) stays readable whatever is configured now.
+zstd needs the optional `zstandard` package; gzip is always available.
+"""
+
+import gzip
+from enum import Enum
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+class Compression(str, Enum):
+    """Supported compression methods."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+def ensure_available(method: Compression) -> None:
+    """
+    Raise if a compression method cannot be used in this environment.
+
+    Raises:
+        RuntimeError: If zstd is requested but `zstandard` is not installed
+    """
+    if method == Compression.ZSTD and zstandard is None:
+        raise RuntimeError("zstd compression requires the 'zstandard' package")
+
+
+def compress(data: bytes, method: Compression) -> bytes:
+    """Compress bytes with the given method."""
+    if method == Compression.GZIP:
+        # mtime=0 keeps output deterministic for identical input
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if method == Compression.ZSTD:
+        ensure_available(method)
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress bytes written by compress(), detecting the method."""
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(ZSTD_MAGIC):
+        ensure_available(Compression.ZSTD)
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
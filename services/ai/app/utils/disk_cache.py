@@ -0,0 +1,220 @@
+"""
+Size-bounded on-disk key/value cache backed by SQLite.
+
+Entries expire after a TTL and the least recently used entries are evicted
+once the total stored size exceeds a byte budget. The total is kept in a
+metadata row by triggers, so it changes in the same transaction as the
+entries; recency is recorded to ACCESS_RESOLUTION_SECONDS, so most hits are
+read-only. Hit/miss counters are kept per process for monitoring.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from app.utils.logger import get_logger
+from app.utils.sqlite import ThreadLocalConnection, migrate
+
+# Schema migrations, applied in order; PRAGMA user_version records how many
+# have run. Append new steps, never edit existing ones.
+MIGRATIONS = [
+    # meta holds the running size total, kept current by the triggers
+    """
+    CREATE TABLE entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    );
+    CREATE INDEX idx_entries_accessed_at ON entries (accessed_at);
+    CREATE INDEX idx_entries_created_at ON entries (created_at);
+    CREATE TABLE meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+    INSERT INTO meta (name, value) VALUES ('total_size', 0);
+    CREATE TRIGGER entries_insert AFTER INSERT ON entries BEGIN
+        UPDATE meta SET value = value + NEW.size WHERE name = 'total_size';
+    END;
+    CREATE TRIGGER entries_delete AFTER DELETE ON entries BEGIN
+        UPDATE meta SET value = value - OLD.size WHERE name = 'total_size';
+    END;
+    CREATE TRIGGER entries_update_size AFTER UPDATE OF size ON entries BEGIN
+        UPDATE meta SET value = value + NEW.size - OLD.size
+            WHERE name = 'total_size';
+    END;
+    """,
+]
+
+# A hit only rewrites accessed_at once it is older than this, so LRU order is
+# this coarse
+ACCESS_RESOLUTION_SECONDS = 60.0
+# Entries deleted per statement when expiring or evicting
+EVICT_BATCH_SIZE = 256
+
+
+class CacheStats(BaseModel):
+    """Counters for a cache instance (since process start)."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskCache:
+    """
+    SQLite key/value cache with TTL expiry and LRU eviction by total size.
+
+    Safe to use from multiple threads and processes: each thread gets its own
+    connection and SQLite serialises writers.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        ttl_seconds: float | None = None,
+        logger=None,
+    ) -> None:
+        """
+        Initialise cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            max_bytes: Total value size above which LRU entries are evicted
+            ttl_seconds: Entry lifetime (None = never expires)
+            logger: Optional logger instance
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger or get_logger(service="cache")
+        self._db = ThreadLocalConnection(path)
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+        migrate(self._db.get(), MIGRATIONS)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the cached value, or None on a miss or expired entry.
+        """
+        conn = self._db.get()
+        row = conn.execute(
+            "SELECT value, created_at, accessed_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+
+        if row is None:
+            self._count("misses")
+            return None
+
+        if self.ttl_seconds is not None and now - row["created_at"] > self.ttl_seconds:
+            with conn:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._count("expirations")
+            self._count("misses")
+            return None
+
+        if now - row["accessed_at"] > ACCESS_RESOLUTION_SECONDS:
+            with conn:
+                conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+        self._count("hits")
+        return bytes(row["value"])
+
+    def set(self, key: str, value: bytes) -> None:
+        """
+        Store a value, then evict least recently used entries over budget.
+        """
+        now = time.time()
+        conn = self._db.get()
+        with conn:
+            # An upsert rather than INSERT OR REPLACE, whose implicit delete
+            # does not fire the size triggers
+            conn.execute(
+                "INSERT INTO entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, size = excluded.size, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at",
+                (key, value, len(value), now, now),
+            )
+        self._count("writes")
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        conn = self._db.get()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def stats(self) -> CacheStats:
+        """Snapshot of this instance's counters."""
+        with self._stats_lock:
+            return self._stats.model_copy()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then LRU entries until under max_bytes."""
+        conn = self._db.get()
+        with conn:
+            if self.ttl_seconds is not None:
+                expired = self._delete_batches(
+                    conn,
+                    "SELECT key FROM entries WHERE created_at < ? LIMIT ?",
+                    (time.time() - self.ttl_seconds,),
+                )
+                self._count("expirations", expired)
+
+            evicted = 0
+            while (total := self._total_size(conn)) > self.max_bytes:
+                rows = conn.execute(
+                    "SELECT key, size FROM entries ORDER BY accessed_at ASC LIMIT ?",
+                    (EVICT_BATCH_SIZE,),
+                ).fetchall()
+                keys = []
+                for row in rows:
+                    if total <= self.max_bytes:
+                        break
+                    keys.append(row["key"])
+                    total -= row["size"]
+                if not keys:
+                    break
+                conn.execute(
+                    f"DELETE FROM entries WHERE key IN ({', '.join('?' * len(keys))})",
+                    keys,
+                )
+                evicted += len(keys)
+
+        if evicted:
+            self._count("evictions", evicted)
+            self.logger.debug("Evicted {} cache entries from {}", evicted, self.path)
+
+    def _delete_batches(self, conn, select: str, params: tuple) -> int:
+        """Delete the entries a keyed SELECT (ending in LIMIT ?) finds, in batches."""
+        deleted = 0
+        while True:
+            count = conn.execute(
+                f"DELETE FROM entries WHERE key IN ({select})",
+                (*params, EVICT_BATCH_SIZE),
+            ).rowcount
+            deleted += count
+            if count < EVICT_BATCH_SIZE:
+                return deleted
+
+    def _total_size(self, conn) -> int:
+        return conn.execute(
+            "SELECT value FROM meta WHERE name = 'total_size'"
+        ).fetchone()[0]
+
+    def _count(self, field: str, amount: int = 1) -> None:
+        if amount:
+            with self._stats_lock:
+                setattr(self._stats, field, getattr(self._stats, field) + amount)
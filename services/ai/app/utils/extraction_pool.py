@@ -0,0 +1,241 @@
+"""
+Process pool for CPU-bound HTML extraction.
+
+Readability and BeautifulSoup parsing hold the GIL for hundreds of
+milliseconds on large pages, stalling every other request in the worker. The
+pool runs the extraction engines (app.utils.html_extraction) in separate
+processes instead, so parsing scales across cores.
+
+Workers are started (and their imports loaded) by warm_up() at startup. At
+most one task per worker is submitted at a time (callers wait for a free
+worker first), so a task's timeout covers its own parsing, not time spent
+queued behind others. A task that exceeds its timeout falls back to
+parse_article_simple in the calling process; a broken pool (e.g. a worker
+killed by the OOM killer) is replaced, and the task is parsed in-process
+meanwhile.
+
+Workers are spawned, not forked, so scripts that create a pool need the usual
+`if __name__ == "__main__":` guard (uvicorn's entry point has one).
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from pydantic import BaseModel
+
+from app.models.articles import Article
+
+from .html_extraction import (
+    ExtractionEngineType,
+    parse_article,
+    parse_article_simple,
+)
+from .logger import get_logger
+
+_WARMUP_HTML = "<html><head><title>warmup</title></head><body><p>ok</p></body></html>"
+
+
+class ExtractionPoolStats(BaseModel):
+    """Counters for an extraction pool (since process start)."""
+
+    tasks: int = 0
+    timeouts: int = 0  # Tasks that fell back to simple extraction
+    restarts: int = 0  # Pools replaced after a worker died
+
+
+def _warm_up() -> None:
+    for engine in ExtractionEngineType:
+        parse_article("https://warmup.invalid/", _WARMUP_HTML, engine)
+
+
+class _Slots:
+    """
+    Counting semaphore that threads and event loops can both wait on.
+
+    Waiters are served in arrival order; async waiters do not hold a thread.
+    """
+
+    def __init__(self, count: int) -> None:
+        self._free = count
+        self._lock = threading.Lock()
+        self._waiters: deque = deque()  # threading.Events and (loop, Future)s
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+
+    async def aacquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._free and not self._waiters:
+                self._free -= 1
+                return
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+            # Granted just before the cancellation: hand the slot on. (A grant
+            # still in flight is handed on by _grant.)
+            if not queued and waiter[1].done() and not waiter[1].cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._free += 1
+                return
+            waiter = self._waiters.popleft()
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+        else:
+            loop, future = waiter
+            loop.call_soon_threadsafe(self._grant, future)
+
+    def _grant(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class ExtractionPool:
+    """
+    Runs article extraction in worker processes.
+
+    A timed-out task cannot be interrupted; it keeps its worker (and its slot)
+    busy until it finishes, but the caller gets the fallback result without
+    waiting for it.
+
+    Example:
+        >>> pool = ExtractionPool(workers=4, task_timeout_seconds=10)
+        >>> pool.warm_up()
+        >>> article = await pool.aparse(url, html, ExtractionEngineType.LXML)
+        >>> pool.close()
+    """
+
+    def __init__(self, workers: int, task_timeout_seconds: float, logger=None) -> None:
+        """
+        Initialise extraction pool (worker processes start on first use).
+
+        Args:
+            workers: Number of worker processes
+            task_timeout_seconds: Time allowed per page before falling back
+            logger: Optional logger instance
+        """
+        self.workers = workers
+        self.task_timeout_seconds = task_timeout_seconds
+        self.logger = logger or get_logger(service="scraper")
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self._slots = _Slots(workers)  # One in-flight task per worker
+        self._stats = ExtractionPoolStats()
+
+    def warm_up(self) -> None:
+        """Start every worker and load its parsing imports."""
+        futures = [self._executor.submit(_warm_up) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+        self.logger.info("Extraction pool ready with {} workers", self.workers)
+
+    def parse(self, url: str, html: str, engine: ExtractionEngineType) -> Article:
+        """Extract an article in a worker process (blocking)."""
+        self._stats.tasks += 1
+        executor = self._executor
+        self._slots.acquire()
+        try:
+            future = self._submit(executor, url, html, engine)
+            return future.result(timeout=self.task_timeout_seconds)
+        except FutureTimeoutError:
+            future.cancel()
+            return self._timed_out(url, html)
+        except BrokenProcessPool:
+            self._restart(executor)
+            return parse_article(url, html, engine)
+
+    async def aparse(
+        self, url: str, html: str, engine: ExtractionEngineType
+    ) -> Article:
+        """Async variant of parse; fallbacks run in a worker thread."""
+        self._stats.tasks += 1
+        executor = self._executor
+        await self._slots.aacquire()
+        try:
+            future = self._submit(executor, url, html, engine)
+            # shield: a timeout must not cancel the task's own future, whose
+            # completion frees the worker's slot
+            return await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=self.task_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            future.cancel()
+            return await asyncio.to_thread(self._timed_out, url, html)
+        except BrokenProcessPool:
+            self._restart(executor)
+            return await asyncio.to_thread(parse_article, url, html, engine)
+
+    def stats(self) -> ExtractionPoolStats:
+        return self._stats.model_copy()
+
+    def close(self) -> None:
+        """Stop the workers, abandoning queued tasks."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that runs threads (the event loop's
+        # executor, DB connections) can copy locks in a held state
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _submit(
+        self,
+        executor: ProcessPoolExecutor,
+        url: str,
+        html: str,
+        engine: ExtractionEngineType,
+    ) -> Future:
+        """Submit a task holding a slot; the slot is freed when the task ends."""
+        try:
+            future = executor.submit(parse_article, url, html, engine)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _timed_out(self, url: str, html: str) -> Article:
+        self._stats.timeouts += 1
+        self.logger.warning(
+            "Extraction of {} took over {}s; using simple extraction",
+            url,
+            self.task_timeout_seconds,
+        )
+        return parse_article_simple(url, html)
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a broken executor (once, however many tasks saw it break)."""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self._new_executor()
+            self._stats.restarts += 1
+        self.logger.warning("Extraction worker died; restarted pool")
+        broken.shutdown(wait=False, cancel_futures=True)
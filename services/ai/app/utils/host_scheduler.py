@@ -0,0 +1,277 @@
+"""
+Per-host politeness scheduling for article fetches.
+
+Bulk screening sends many requests to the same few publishers at once, which
+gets us rate-limited or blocked. HostScheduler runs each fetch through gates
+kept per host:
+
+- a cap on concurrent requests
+- a token bucket limiting the request rate (with a small burst allowance)
+- a pause for the whole host after 429/503 responses, honouring Retry-After
+
+Throttled responses, transient 5xx responses and transport errors are retried
+with jittered exponential backoff. Queue depth and wait times per host are
+exposed through stats().
+"""
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+import httpx
+from pydantic import BaseModel
+
+from .logger import get_logger
+from .urls import url_domain
+
+T = TypeVar("T")
+
+THROTTLE_STATUSES = {429, 503}
+RETRYABLE_STATUSES = THROTTLE_STATUSES | {502, 504}
+# Idle hosts beyond this many are forgotten (their limits start afresh)
+MAX_TRACKED_HOSTS = 1024
+
+
+class HostStats(BaseModel):
+    """Counters for one host (since it was first scheduled)."""
+
+    host: str
+    queued: int = 0  # Requests waiting for a slot
+    in_flight: int = 0
+    requests: int = 0  # Attempts started, including retries
+    retries: int = 0
+    throttled: int = 0  # 429/503 responses
+    wait_seconds_total: float = 0.0  # Time spent queued, over all attempts
+    wait_seconds_max: float = 0.0
+    paused_seconds: float = 0.0  # Time left on a Retry-After pause
+
+
+class SchedulerStats(BaseModel):
+    """Totals across hosts, plus the busiest hosts."""
+
+    hosts_tracked: int = 0
+    queued: int = 0
+    in_flight: int = 0
+    hosts: list[HostStats] = []
+
+
+class TokenBucket:
+    """
+    Request rate limiter: `rate` tokens per second, holding at most `burst`.
+
+    Tokens are reserved up front (the balance may go negative), so waiters
+    are released in arrival order at the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class _HostState:
+    def __init__(self, host: str, max_connections: int, rate: float, burst: int):
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.bucket = TokenBucket(rate, burst)
+        self.paused_until = 0.0  # time.monotonic() deadline
+        self.stats = HostStats(host=host)
+
+    @property
+    def idle(self) -> bool:
+        return self.stats.queued == 0 and self.stats.in_flight == 0
+
+
+class HostScheduler:
+    """
+    Runs fetches under per-host concurrency, rate and backoff limits.
+
+    Example:
+        >>> scheduler = HostScheduler(max_connections_per_host=4, requests_per_second=2)
+        >>> html = await scheduler.run(url, lambda: fetch(url))
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 4,
+        requests_per_second: float = 2.0,
+        burst: int = 4,
+        max_retries: int = 3,
+        backoff_base_seconds: float = 0.5,
+        backoff_max_seconds: float = 30.0,
+        logger=None,
+    ) -> None:
+        """
+        Initialise scheduler.
+
+        Args:
+            max_connections_per_host: Concurrent requests allowed per host
+            requests_per_second: Sustained request rate per host
+            burst: Requests allowed at once before the rate applies
+            max_retries: Retries after a throttled, 5xx or transport failure
+            backoff_base_seconds: Backoff before the first retry (doubles per
+                retry, with full jitter)
+            backoff_max_seconds: Longest backoff; a Retry-After asking for
+                longer fails the request instead of waiting
+            logger: Optional logger instance
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.logger = logger or get_logger(service="scraper")
+        self._hosts: OrderedDict[str, _HostState] = OrderedDict()
+
+    async def run(self, url: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fetch() for a URL once its host allows it, retrying if needed.
+
+        Raises:
+            Whatever the last attempt raised, once retries are exhausted or the
+            failure is not retryable
+        """
+        state = self._host(url_domain(url))
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._slot(state):
+                    return await fetch()
+            except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+                delay = self._retry_delay(state, exc, attempt)
+                if delay is None or attempt == self.max_retries:
+                    raise
+                state.stats.retries += 1
+                self.logger.warning(
+                    "Fetch of {} failed ({}); retry {} in {:.1f}s",
+                    url,
+                    exc,
+                    attempt + 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    def stats(self, limit: int = 20) -> SchedulerStats:
+        """Totals, and the `limit` busiest hosts (by queue depth, then load)."""
+        now = time.monotonic()
+        hosts = [
+            state.stats.model_copy(
+                update={"paused_seconds": max(0.0, state.paused_until - now)}
+            )
+            for state in self._hosts.values()
+        ]
+        hosts.sort(key=lambda h: (h.queued, h.in_flight, h.requests), reverse=True)
+        return SchedulerStats(
+            hosts_tracked=len(hosts),
+            queued=sum(h.queued for h in hosts),
+            in_flight=sum(h.in_flight for h in hosts),
+            hosts=hosts[:limit],
+        )
+
+    def _host(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(
+                host,
+                self.max_connections_per_host,
+                self.requests_per_second,
+                self.burst,
+            )
+            self._hosts[host] = state
+            self._forget_idle_hosts()
+        self._hosts.move_to_end(host)
+        return state
+
+    def _forget_idle_hosts(self) -> None:
+        for host in list(self._hosts):
+            if len(self._hosts) <= MAX_TRACKED_HOSTS:
+                return
+            if self._hosts[host].idle:
+                del self._hosts[host]
+
+    @asynccontextmanager
+    async def _slot(self, state: _HostState):
+        """Wait for the host's pause, a connection slot and a rate token."""
+        stats = state.stats
+        stats.queued += 1
+        started = time.monotonic()
+        try:
+            while (pause := state.paused_until - time.monotonic()) > 0:
+                await asyncio.sleep(pause)
+            await state.semaphore.acquire()
+        finally:
+            stats.queued -= 1
+        try:
+            await state.bucket.acquire()
+            waited = time.monotonic() - started
+            stats.wait_seconds_total += waited
+            stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+            stats.requests += 1
+            stats.in_flight += 1
+            try:
+                yield
+            finally:
+                stats.in_flight -= 1
+        finally:
+            state.semaphore.release()
+
+    def _retry_delay(
+        self, state: _HostState, exc: Exception, attempt: int
+    ) -> float | None:
+        """Seconds to wait before retrying, or None if the error is final."""
+        backoff = random.uniform(
+            0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt)
+        )
+        if isinstance(exc, httpx.TransportError):
+            return backoff
+
+        status = exc.response.status_code
+        if status not in RETRYABLE_STATUSES:
+            return None
+        if status not in THROTTLE_STATUSES:
+            return backoff
+
+        state.stats.throttled += 1
+        retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.backoff_max_seconds:
+            return None
+        delay = max(backoff, retry_after or 0.0)
+        # The whole host is throttled, not just this request
+        state.paused_until = max(state.paused_until, time.monotonic() + delay)
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Seconds to wait from a Retry-After header (delay-seconds or HTTP-date).
+
+    Example:
+        >>> parse_retry_after("120")
+        120.0
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
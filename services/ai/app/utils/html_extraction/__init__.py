@@ -0,0 +1,21 @@
+"""
+Article title and text extraction from HTML.
+
+Engines are plain functions `(url, html) -> Article` without shared state, so
+they can run in the scraper's own thread or in an ExtractionPool worker
+process. EXTRACTION_ENGINES maps each ExtractionEngineType to its function;
+both engines produce the same title and paragraphs (see benchmarks/ for the
+parity and speed comparison).
+"""
+
+from .common import find_canonical_link, html_to_text, parse_article_simple
+from .engines import EXTRACTION_ENGINES, ExtractionEngineType, parse_article
+
+__all__ = [
+    "EXTRACTION_ENGINES",
+    "ExtractionEngineType",
+    "find_canonical_link",
+    "html_to_text",
+    "parse_article",
+    "parse_article_simple",
+]
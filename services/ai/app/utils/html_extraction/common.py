@@ -0,0 +1,65 @@
+"""Helpers shared by the extraction engines."""
+
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.models.articles import Article
+
+
+def usable_canonical_link(url: str, href: str) -> str | None:
+    """
+    Absolute form of a rel=canonical href, if usable.
+
+    Links to another scheme, or to a site root when the article itself is
+    not one (a common CMS misconfiguration), are ignored.
+    """
+    href = urljoin(url, href.strip())
+    parsed = urlparse(href)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        return None
+    if parsed.path.strip("/") == "" and urlparse(url).path.strip("/"):
+        return None
+    return href
+
+
+def find_canonical_link(url: str, html: str) -> str | None:
+    """The page's declared rel=canonical URL, if usable."""
+    try:
+        soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("link"))
+    except Exception:
+        return None
+    for link in soup.find_all("link", href=True):
+        rel = link.get("rel") or []
+        if "canonical" in [r.lower() for r in rel]:
+            return usable_canonical_link(url, link["href"])
+    return None
+
+
+def parse_article_simple(url: str, html: str) -> Article:
+    """
+    Cheap fallback for pages an engine could not finish on: the <title> and
+    every paragraph of the page, without any page simplification.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text().strip() if soup.title else ""
+    return Article(
+        url=url,
+        title=title,
+        content=paragraph_text(soup),
+        canonical_url=find_canonical_link(url, html),
+    )
+
+
+def html_to_text(html_fragment: str) -> str:
+    """Paragraph text of an HTML fragment, separated by blank lines."""
+    return paragraph_text(BeautifulSoup(html_fragment, "html.parser"))
+
+
+def paragraph_text(soup: BeautifulSoup) -> str:
+    paragraphs = [p.get_text().strip() for p in soup.find_all("p")]
+    return join_paragraphs(paragraphs)
+
+
+def join_paragraphs(paragraphs: list[str]) -> str:
+    return "\n\n".join([p for p in paragraphs if p])
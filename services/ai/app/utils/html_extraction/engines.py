@@ -0,0 +1,36 @@
+"""Extraction engine registry."""
+
+from collections.abc import Callable
+from enum import Enum
+
+from app.models.articles import Article
+
+from .lxml_engine import parse_with_lxml
+from .readability import parse_with_readabilipy
+
+
+class ExtractionEngineType(str, Enum):
+    """Available article extraction engines."""
+
+    READABILIPY = "readabilipy"
+    LXML = "lxml"
+
+
+EXTRACTION_ENGINES: dict[ExtractionEngineType, Callable[[str, str], Article]] = {
+    ExtractionEngineType.READABILIPY: parse_with_readabilipy,
+    ExtractionEngineType.LXML: parse_with_lxml,
+}
+
+
+def parse_article(
+    url: str,
+    html: str,
+    engine: ExtractionEngineType = ExtractionEngineType.READABILIPY,
+) -> Article:
+    """
+    Extract an article with the given engine.
+
+    Raises:
+        Exception: Whatever the engine raises for HTML it cannot process
+    """
+    return EXTRACTION_ENGINES[engine](url, html)
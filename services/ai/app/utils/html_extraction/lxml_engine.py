@@ -0,0 +1,221 @@
+"""
+Single-pass lxml extraction engine.
+
+Produces the same title and paragraphs as the readabilipy engine from one
+lxml parse and one walk over the tree, instead of readabilipy's repeated
+html5lib/BeautifulSoup passes. It follows readabilipy's simplification rules
+(its element lists and text normalisation are reused directly, which is why
+pyproject.toml pins readabilipy to the 0.3.0 release these were checked
+against):
+
+- blacklisted elements (scripts, forms, media, nav, ...) are dropped with
+  their content; inline and unknown elements are flattened into their text
+- a paragraph is a <p>'s text, or bare text next to other content in any
+  container; text that is the only content of a whitelisted block (a heading,
+  list item or table cell, say) is not a paragraph
+- two or more consecutive <br>, or an <hr>, split a paragraph; a single <br>
+  is a space
+"""
+
+from itertools import groupby
+
+import lxml.etree
+import lxml.html
+from readabilipy.extractors.extract_title import combine_similar_titles
+from readabilipy.simplifiers import normalise_text, normalise_whitespace
+from readabilipy.simplifiers.html import (
+    block_level_whitelist,
+    elements_to_delete,
+    structural_elements,
+)
+
+from app.models.articles import Article
+
+from .common import join_paragraphs, usable_canonical_link
+
+_DELETED = frozenset(elements_to_delete())
+_WHITELISTED = frozenset(block_level_whitelist())
+# Elements whose text never merges with their parent's
+_CONTAINERS = (
+    _WHITELISTED | frozenset(structural_elements()) | {"title", "meta", "base"}
+)
+# Text added around flattened special elements: (before, after)
+_SPECIAL = {"q": ('"', '"'), "sub": ("_", ""), "sup": ("^", "")}
+
+# Candidate title locations and confidence scores, as used by readabilipy
+TITLE_XPATHS = [
+    ('//header[@class="entry-header"]/h1[@class="entry-title"]//text()', 4),
+    ('//meta[@property="og:title"]/@content', 4),
+    ('//h1[@class="entry-title"]//text()', 3),
+    ('//h1[@itemprop="headline"]//text()', 3),
+    ('//h2[@itemprop="headline"]//text()', 2),
+    ('//meta[contains(@itemprop, "headline")]/@content', 2),
+    ("//body/title//text()", 1),
+    ('//div[@class="postarea"]/h2/a//text()', 1),
+    ('//h1[@class="post__title"]//text()', 1),
+    ('//h1[@class="title"]//text()', 1),
+    ("//head/title//text()", 1),
+    ("//header/h1//text()", 1),
+    ('//meta[@name="dcterms.title"]/@content', 1),
+    ('//meta[@name="fb_title"]/@content', 1),
+    ('//meta[@name="sailthru.title"]/@content', 1),
+    ('//meta[@name="title"]/@content', 1),
+]
+
+_BR, _HR = object(), object()  # Line break markers within a run of text
+_BREAK = "\x00"  # Paragraph break (control characters never survive normalising)
+
+# Forced UTF-8: the input is already decoded, and lxml rejects str input that
+# carries an XML encoding declaration
+_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+
+def parse_with_lxml(url: str, html: str) -> Article:
+    """Extract title and paragraph text from one lxml parse of the page."""
+    try:
+        root = lxml.html.document_fromstring(html.encode("utf-8"), parser=_PARSER)
+    except lxml.etree.ParserError:  # Empty document
+        return Article(url=url, title="", content="")
+    return Article(
+        url=url,
+        title=_extract_title(root),
+        content=join_paragraphs(_extract_paragraphs(root)),
+        canonical_url=_canonical_link(url, root),
+    )
+
+
+def _extract_title(root) -> str:
+    candidates: dict[str, dict] = {}
+    for xpath, score in TITLE_XPATHS:
+        for found in root.xpath(xpath):
+            text = normalise_whitespace(found)
+            if not text:
+                continue
+            entry = candidates.setdefault(text, {"score": 0, "xpaths": []})
+            entry["score"] += score
+            entry["xpaths"].append(xpath)
+    if not candidates:
+        return ""
+    candidates = combine_similar_titles(candidates)
+    return max(candidates, key=lambda title: candidates[title]["score"])
+
+
+def _canonical_link(url: str, root) -> str | None:
+    for link in root.iter("link"):
+        href = link.get("href")
+        if href and "canonical" in link.get("rel", "").lower().split():
+            return usable_canonical_link(url, href)
+    return None
+
+
+class _Container:
+    """Content of one container element, in document order."""
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+        # Each item is a run of text (a list of strings and line break markers)
+        # or the paragraphs of a child container
+        self.items: list[list] = []
+        self.kinds: list[str] = []  # "run" or "block", per item
+        self.run: list = []
+
+    def add_text(self, text: str | None) -> None:
+        if text:
+            self.run.append(text)
+
+    def add_break(self, marker) -> None:
+        self.run.append(marker)
+
+    def end_run(self) -> None:
+        if self.run:
+            self.items.append(self.run)
+            self.kinds.append("run")
+            self.run = []
+
+    def add_block(self, paragraphs: list[str]) -> None:
+        self.end_run()
+        self.items.append(paragraphs)
+        self.kinds.append("block")
+
+    def paragraphs(self) -> list[str]:
+        """This container's paragraphs, including those of child containers."""
+        self.end_run()
+        children: list[tuple[str, list[str] | str]] = []
+        for kind, item in zip(self.kinds, self.items):
+            if kind == "block":
+                children.append((kind, item))
+            else:
+                children.extend(("text", text) for text in _split_run(item))
+
+        # Bare text is wrapped in a paragraph unless it is the only content of
+        # a whitelisted block; text in a <p> already is one
+        wrap = self.tag == "p" or not (self.tag in _WHITELISTED and len(children) == 1)
+        paragraphs = []
+        for kind, child in children:
+            if kind == "block":
+                paragraphs.extend(child)
+            elif wrap:
+                paragraphs.append(normalise_text(child))
+        return paragraphs
+
+
+def _split_run(run: list) -> list[str]:
+    """
+    Text nodes of a run of text and line breaks.
+
+    Whitespace-only text between line breaks is dropped; a lone <br> becomes a
+    space, longer chains and <hr> split the text into separate nodes.
+    """
+    tokens = []
+    for is_text, group in groupby(run, key=lambda token: isinstance(token, str)):
+        if is_text:
+            text = "".join(group)
+            if text.strip():
+                tokens.append(text)
+        else:
+            tokens.extend(group)
+    if not tokens:
+        return []
+
+    parts = []
+    for is_br, group in groupby(tokens, key=lambda token: token is _BR):
+        group = list(group)
+        if is_br:
+            parts.append(" " if len(group) == 1 else _BREAK)
+        else:
+            parts.extend(_BREAK if token is _HR else token for token in group)
+    text = "".join(parts)
+    if _BREAK not in text:
+        return [text]
+    return [fragment.strip() for fragment in text.split(_BREAK)]
+
+
+def _extract_paragraphs(root) -> list[str]:
+    stack = [_Container("#document")]
+    walker = lxml.etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+    for event, element in walker:
+        if event in ("comment", "pi"):
+            stack[-1].add_text(element.tail)
+            continue
+
+        tag = element.tag if isinstance(element.tag, str) else ""
+        if event == "start":
+            if tag in _DELETED:
+                walker.skip_subtree()
+            elif tag in _CONTAINERS:
+                stack.append(_Container(tag))
+                stack[-1].add_text(element.text)
+            elif tag in ("br", "hr"):
+                stack[-1].add_break(_BR if tag == "br" else _HR)
+            else:
+                stack[-1].add_text(_SPECIAL.get(tag, ("", ""))[0])
+                stack[-1].add_text(element.text)
+            continue
+
+        if tag in _CONTAINERS:
+            container = stack.pop()
+            stack[-1].add_block(container.paragraphs())
+        elif tag in _SPECIAL:
+            stack[-1].add_text(_SPECIAL[tag][1])
+        stack[-1].add_text(element.tail)
+    return stack[0].paragraphs()
@@ -0,0 +1,28 @@
+"""readabilipy extraction engine (simplified page tree, then its paragraphs)."""
+
+from readabilipy import simple_json_from_html_string
+
+from app.models.articles import Article
+
+from .common import find_canonical_link, html_to_text
+
+
+def parse_with_readabilipy(url: str, html: str) -> Article:
+    """
+    Extract title and paragraph text with readabilipy.
+
+    The page is parsed several times: by readabilipy (html5lib, plus lxml for
+    the title and date), then the simplified content and the canonical link
+    with html.parser.
+
+    Raises:
+        Exception: Whatever readabilipy raises for HTML it cannot process
+    """
+    obj = simple_json_from_html_string(html) or {}
+    content_html = obj.get("content") or ""
+    return Article(
+        url=url,
+        title=obj.get("title") or "",
+        content=html_to_text(content_html) if content_html else "",
+        canonical_url=find_canonical_link(url, html),
+    )
@@ -0,0 +1,223 @@
+"""
+Incremental decoding and cleanup of streamed HTML responses.
+
+The scraper feeds response chunks to an HTMLBodyReader as they arrive. The
+reader rejects non-HTML content types and oversized bodies before they are
+read in full, decodes with the declared or sniffed charset, and drops blocks
+that never hold article text (scripts, styles, inline SVG, iframes, comments)
+so readability only parses what it needs.
+"""
+
+import codecs
+import re
+
+from pydantic import BaseModel
+
+HTML_CONTENT_TYPES = {"text/html", "application/xhtml+xml"}
+
+# Blocks removed wholesale: opening pattern and the matching closing pattern
+STRIPPED_TAGS = ("script", "style", "noscript", "svg", "iframe", "template", "object")
+_BLOCK_OPEN = re.compile(r"<!--|<(%s)\b" % "|".join(STRIPPED_TAGS), re.IGNORECASE)
+_BLOCK_CLOSE = {
+    tag: re.compile(rf"</{tag}\s*>", re.IGNORECASE) for tag in STRIPPED_TAGS
+}
+_COMMENT_CLOSE = re.compile(r"-->")
+# Longest text that may be a block opener or closer cut off at a chunk boundary
+# (with some slack for whitespace before a closing ">")
+_MAX_MARKER = max(len(tag) for tag in STRIPPED_TAGS) + 8
+
+# Charset in a <meta charset> or <meta http-equiv content="...; charset=..."> tag
+_META_CHARSET = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE
+)
+# Bytes inspected for a <meta> charset (the HTML spec's prescan uses 1024)
+SNIFF_BYTES = 1024
+# Labels browsers decode as windows-1252 (a superset), per the WHATWG Encoding spec
+_WINDOWS_1252_ALIASES = {"latin_1", "iso8859-1", "ascii"}
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+
+class StreamStats(BaseModel):
+    """What one streamed download cost and kept."""
+
+    bytes_read: int = 0
+    chars_kept: int = 0
+    encoding: str | None = None
+
+
+def parse_content_type(header: str | None) -> tuple[str | None, str | None]:
+    """
+    Media type and charset from a Content-Type header.
+
+    Example:
+        >>> parse_content_type("text/html; charset=ISO-8859-1")
+        ("text/html", "iso-8859-1")
+    """
+    if not header:
+        return None, None
+    media_type, *params = (part.strip() for part in header.split(";"))
+    charset = None
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "charset" and value:
+            charset = value.strip().strip("\"'").lower()
+    return media_type.lower() or None, charset
+
+
+def _valid_encoding(name: str | None) -> str | None:
+    if not name:
+        return None
+    try:
+        encoding = codecs.lookup(name).name
+    except LookupError:
+        return None
+    return "cp1252" if encoding in _WINDOWS_1252_ALIASES else encoding
+
+
+class HTMLBlockStripper:
+    """
+    Removes STRIPPED_TAGS blocks and comments from HTML fed in pieces.
+
+    Markers split across chunk boundaries are held back until the next chunk,
+    so output is the same however the document is chunked.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._closer: re.Pattern | None = None  # Set while inside a block
+
+    def feed(self, text: str) -> str:
+        """Add decoded text; returns the cleaned text that is now final."""
+        self._buffer += text
+        out = []
+        while self._buffer:
+            if self._closer is not None:
+                match = self._closer.search(self._buffer)
+                if match is None:
+                    # Drop the block's body, keeping a possible partial closer
+                    self._buffer = self._buffer[-_MAX_MARKER:]
+                    break
+                self._buffer = self._buffer[match.end() :]
+                self._closer = None
+                continue
+
+            match = _BLOCK_OPEN.search(self._buffer)
+            if match is None:
+                keep = self._partial_opener_start()
+                out.append(self._buffer[:keep])
+                self._buffer = self._buffer[keep:]
+                break
+
+            out.append(self._buffer[: match.start()])
+            tag = (match.group(1) or "").lower()
+            if tag == "svg":
+                # Inline SVG may be self-closing; that needs the whole tag
+                tag_end = self._buffer.find(">", match.end())
+                if tag_end == -1:
+                    self._buffer = self._buffer[match.start() :]
+                    break
+                if self._buffer[tag_end - 1] == "/":
+                    self._buffer = self._buffer[tag_end + 1 :]
+                    continue
+            self._closer = _BLOCK_CLOSE[tag] if tag else _COMMENT_CLOSE
+            self._buffer = self._buffer[match.end() :]
+        return "".join(out)
+
+    def finish(self) -> str:
+        """Flush held-back text at the end of the document."""
+        rest = "" if self._closer is not None else self._buffer
+        self._buffer = ""
+        return rest
+
+    def _partial_opener_start(self) -> int:
+        """Index of a trailing "<..." that could still become a block opener."""
+        start = self._buffer.rfind("<", max(0, len(self._buffer) - _MAX_MARKER))
+        if start == -1 or ">" in self._buffer[start:]:
+            return len(self._buffer)
+        return start
+
+
+class HTMLBodyReader:
+    """
+    Decodes and cleans an HTML response body chunk by chunk, within a size limit.
+
+    Example:
+        >>> reader = HTMLBodyReader(resp.headers, max_bytes=8 * 2**20)
+        >>> for chunk in resp.iter_bytes():
+        ...     reader.feed(chunk)
+        >>> html = reader.finish()
+
+    Raises:
+        ValueError: If the content type is not HTML, or the body (declared or
+            read so far) exceeds max_bytes
+    """
+
+    def __init__(self, headers, max_bytes: int) -> None:
+        """
+        Check response headers before any of the body is read.
+
+        Args:
+            headers: Response headers (Content-Type, Content-Length)
+            max_bytes: Largest (decompressed) body accepted
+        """
+        media_type, charset = parse_content_type(headers.get("Content-Type"))
+        if media_type is not None and media_type not in HTML_CONTENT_TYPES:
+            raise ValueError(f"Unsupported content type: {media_type}")
+        length = headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > max_bytes:
+            raise ValueError(f"Response body too large: {length} bytes")
+
+        self.max_bytes = max_bytes
+        self.stats = StreamStats(encoding=_valid_encoding(charset))
+        self._head = b""  # Bytes held until the charset is known
+        self._decoder = None
+        self._stripper = HTMLBlockStripper()
+        self._parts: list[str] = []
+
+    def feed(self, chunk: bytes) -> None:
+        self.stats.bytes_read += len(chunk)
+        if self.stats.bytes_read > self.max_bytes:
+            raise ValueError(f"Response body exceeds {self.max_bytes} bytes")
+        if self._decoder is None:
+            self._head += chunk
+            if len(self._head) < SNIFF_BYTES:
+                return
+            chunk, self._head = self._head, b""
+            self._start_decoder(chunk)
+        self._emit(self._decoder.decode(chunk))
+
+    def finish(self) -> str:
+        """The cleaned document."""
+        if self._decoder is None:
+            chunk, self._head = self._head, b""
+            self._start_decoder(chunk)
+            self._emit(self._decoder.decode(chunk))
+        self._emit(self._decoder.decode(b"", final=True))
+        self._parts.append(self._stripper.finish())
+        html = "".join(self._parts)
+        self.stats.chars_kept = len(html)
+        return html
+
+    def _start_decoder(self, head: bytes) -> None:
+        """Pick the encoding: BOM, then Content-Type, then <meta>, then UTF-8."""
+        encoding = self.stats.encoding
+        for bom, name in _BOMS:
+            if head.startswith(bom):
+                encoding = name
+                break
+        if encoding is None:
+            match = _META_CHARSET.search(head[:SNIFF_BYTES])
+            if match:
+                encoding = _valid_encoding(match.group(1).decode("ascii", "ignore"))
+        self.stats.encoding = encoding or "utf-8"
+        # utf-8-sig drops a BOM; undecodable bytes are replaced, not fatal
+        name = "utf-8-sig" if self.stats.encoding == "utf-8" else self.stats.encoding
+        self._decoder = codecs.getincrementaldecoder(name)(errors="replace")
+
+    def _emit(self, text: str) -> None:
+        if text:
+            self._parts.append(self._stripper.feed(text))
@@ -0,0 +1,105 @@
+"""
+On-disk HTTP response cache for fetched article pages.
+
+Entries are keyed by canonical URL and hold the decoded, cleaned body (see
+app.utils.html_stream) with its ETag and Last-Modified validators. Within the
+freshness window a cached page is used without touching the network; after it,
+the page is revalidated with a conditional GET and a 304 reuses the stored body.
+"""
+
+import time
+
+import httpx
+from pydantic import BaseModel
+
+from app.utils.compression import Compression, compress, decompress
+from app.utils.disk_cache import CacheStats, DiskCache
+from app.utils.urls import canonical_url
+
+
+class CachedPage(BaseModel):
+    """A cached response body and the validators needed to revalidate it."""
+
+    url: str
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float  # When the body was last fetched or revalidated
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that ask the server to confirm this copy is current."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    Page cache on a size-bounded DiskCache (LRU-evicted above its byte budget).
+
+    Example:
+        >>> cache = HTTPCache(DiskCache(path, max_bytes=512 * 2**20), fresh_seconds=900)
+        >>> page = cache.get(url)
+        >>> if page is None or not cache.is_fresh(page):
+        ...     resp = client.get(url, headers=page.conditional_headers() if page else {})
+    """
+
+    def __init__(self, backend: DiskCache, fresh_seconds: float) -> None:
+        """
+        Initialise HTTP cache.
+
+        Args:
+            backend: Disk cache holding the entries (its TTL bounds how long a
+                page is kept for revalidation)
+            fresh_seconds: How long a page is used without revalidation
+        """
+        self.backend = backend
+        self.fresh_seconds = fresh_seconds
+
+    def get(self, url: str) -> CachedPage | None:
+        value = self.backend.get(canonical_url(url))
+        if value is None:
+            return None
+        return CachedPage.model_validate_json(decompress(value))
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self.fresh_seconds
+
+    def store(self, url: str, resp: httpx.Response, body: str) -> None:
+        """Cache a fetched page unless the server forbids storing it."""
+        if "no-store" in resp.headers.get("Cache-Control", "").lower():
+            return
+        self._put(
+            CachedPage(
+                url=url,
+                body=body,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+                fetched_at=time.time(),
+            )
+        )
+
+    def revalidated(self, page: CachedPage, resp: httpx.Response) -> str:
+        """Record a 304 for a cached page and return its (unchanged) body."""
+        self._put(
+            page.model_copy(
+                update={
+                    "etag": resp.headers.get("ETag", page.etag),
+                    "last_modified": resp.headers.get(
+                        "Last-Modified", page.last_modified
+                    ),
+                    "fetched_at": time.time(),
+                }
+            )
+        )
+        return page.body
+
+    def stats(self) -> CacheStats:
+        return self.backend.stats()
+
+    def _put(self, page: CachedPage) -> None:
+        value = compress(page.model_dump_json().encode("utf-8"), Compression.GZIP)
+        self.backend.set(canonical_url(page.url), value)
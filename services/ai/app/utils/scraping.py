@@ -1,31 +1,72 @@
 """
 Article extraction from web URLs.
 
-Fetch and extract main content using httpx + readabilipy.
-Minimal, basic setup with optional logger injection.
+Fetch and extract main content using httpx and an extraction engine
+(readabilipy or lxml, see app.utils.html_extraction).
+Minimal, basic setup with optional logger injection. Fetched pages can be
+cached on disk and revalidated (see app.utils.http_cache), and concurrent
+requests for the same canonical URL share one fetch and parse. Responses are
+streamed within a size limit and cleaned of scripts, styles and similar blocks
+as they arrive (see app.utils.html_stream). Parsing can run in a process pool
+(see app.utils.extraction_pool). Async downloads can go through a per-host
+scheduler that caps concurrency and rate and retries throttled requests (see
+app.utils.host_scheduler).
 """
 
+import asyncio
 import json
 import re
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
-from readabilipy import simple_json_from_html_string
 
 from app.models.articles import Article
 
+from ..utils.extraction_pool import ExtractionPool
+from ..utils.host_scheduler import HostScheduler
+from ..utils.html_extraction import ExtractionEngineType, parse_article
+from ..utils.html_stream import HTMLBodyReader
+from ..utils.http_cache import CachedPage, HTTPCache
 from ..utils.logger import get_logger
+from ..utils.singleflight import AsyncSingleFlight, SingleFlight
+from ..utils.urls import canonical_url
+
+# Used by clients the scraper creates itself (injected clients bring their own)
+DEFAULT_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
 
 
 class ArticleScraper:
     """Minimal article scraper with optional logger and httpx client injection."""
 
-    def __init__(self, logger=None, http_client: httpx.Client | None = None) -> None:
+    def __init__(
+        self,
+        logger=None,
+        http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
+        http_cache: HTTPCache | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        extraction_pool: ExtractionPool | None = None,
+        extraction_engine: ExtractionEngineType = ExtractionEngineType.READABILIPY,
+        host_scheduler: HostScheduler | None = None,
+    ) -> None:
         self._logger = logger or get_logger(service="scraper")
-        self._client = http_client or httpx.Client(follow_redirects=True)
+        self._client = http_client or httpx.Client(
+            follow_redirects=True, timeout=DEFAULT_TIMEOUT
+        )
         self._owns_client = http_client is None
+        self._async_client = async_http_client or httpx.AsyncClient(
+            follow_redirects=True, timeout=DEFAULT_TIMEOUT
+        )
+        self._max_bytes = max_bytes
+        self._owns_async_client = async_http_client is None
+        self._http_cache = http_cache
+        self._flight = SingleFlight()
+        self._async_flight = AsyncSingleFlight()
+        self._extraction_pool = extraction_pool
+        self._extraction_engine = extraction_engine
+        self._host_scheduler = host_scheduler
 
     def close(self) -> None:
         if self._owns_client:
@@ -34,11 +75,30 @@ class ArticleScraper:
             except Exception:
                 self._logger.exception("Failed to close HTTP client")
 
+    async def aclose(self) -> None:
+        self.close()
+        if self._owns_async_client:
+            try:
+                await self._async_client.aclose()
+            except Exception:
+                self._logger.exception("Failed to close async HTTP client")
+
     def extract_article(self, url: str) -> Article:
-        self._logger.info(f"Extracting article from {url}")
-        html = self._fetch_html(url)
-        title, content_text = self._extract_and_convert(html)
-        return Article(url=url, title=title, content=content_text)
+        """
+        Fetch and parse an article.
+
+        Concurrent calls for the same canonical URL (e.g. differing only in
+        tracking parameters) share one fetch and parse.
+        """
+        article = self._flight.do(canonical_url(url), lambda: self._scrape(url))
+        return article.model_copy(update={"url": url})
+
+    async def aextract_article(self, url: str) -> Article:
+        """Async variant of extract_article; HTML parsing runs in a worker thread."""
+        article = await self._async_flight.do(
+            canonical_url(url), lambda: self._ascrape(url)
+        )
+        return article.model_copy(update={"url": url})
 
     def save_article_json(self, article: Article, output_dir: Path) -> Path:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -48,31 +108,98 @@ class ArticleScraper:
         self._logger.info(f"Saved article JSON to {filepath}")
         return filepath
 
+    def _scrape(self, url: str) -> Article:
+        self._logger.info(f"Extracting article from {url}")
+        return self._build_article(url, self._fetch_html(url))
+
+    async def _ascrape(self, url: str) -> Article:
+        self._logger.info(f"Extracting article from {url}")
+        html = await self._afetch_html(url)
+        return await self._abuild_article(url, html)
+
+    def _build_article(self, url: str, html: str) -> Article:
+        try:
+            if self._extraction_pool is not None:
+                return self._extraction_pool.parse(url, html, self._extraction_engine)
+            return parse_article(url, html, self._extraction_engine)
+        except Exception as exc:
+            self._logger.exception(f"Article extraction failed: {exc}")
+            return Article(url=url, title="", content="")
+
+    async def _abuild_article(self, url: str, html: str) -> Article:
+        if self._extraction_pool is None:
+            return await asyncio.to_thread(self._build_article, url, html)
+        try:
+            return await self._extraction_pool.aparse(
+                url, html, self._extraction_engine
+            )
+        except Exception as exc:
+            self._logger.exception(f"Article extraction failed: {exc}")
+            return Article(url=url, title="", content="")
+
     def _fetch_html(self, url: str) -> str:
         try:
-            resp = self._client.get(url)
-            resp.raise_for_status()
-            return resp.text
+            cached = self._http_cache.get(url) if self._http_cache else None
+            if cached is not None and self._http_cache.is_fresh(cached):
+                return cached.body
+            headers = cached.conditional_headers() if cached else None
+            with self._client.stream("GET", url, headers=headers) as resp:
+                if resp.status_code == 304 and cached is not None:
+                    return self._revalidated(url, resp, cached)
+                reader = self._open_body(resp)
+                for chunk in resp.iter_bytes():
+                    reader.feed(chunk)
+            return self._finish_body(url, resp, reader)
         except Exception as exc:
             self._logger.exception(f"Failed to fetch HTML from {url}: {exc}")
             raise
 
-    def _extract_and_convert(self, html: str) -> tuple[str, str]:
-        title = ""
-        content_html = ""
+    async def _afetch_html(self, url: str) -> str:
         try:
-            obj = simple_json_from_html_string(html)
-            title = (obj or {}).get("title") or ""
-            content_html = (obj or {}).get("content") or ""
+            cached = (
+                await asyncio.to_thread(self._http_cache.get, url)
+                if self._http_cache
+                else None
+            )
+            if cached is not None and self._http_cache.is_fresh(cached):
+                return cached.body
+            if self._host_scheduler is None:
+                return await self._adownload(url, cached)
+            return await self._host_scheduler.run(
+                url, lambda: self._adownload(url, cached)
+            )
         except Exception as exc:
-            self._logger.exception(f"Readability extraction failed: {exc}")
-        text = self._html_to_text(content_html) if content_html else ""
-        return title, text
-
-    def _html_to_text(self, html_fragment: str) -> str:
-        soup = BeautifulSoup(html_fragment, "html.parser")
-        paragraphs = [p.get_text().strip() for p in soup.find_all("p")]
-        return "\n\n".join([p for p in paragraphs if p])
+            self._logger.exception(f"Failed to fetch HTML from {url}: {exc}")
+            raise
+
+    async def _adownload(self, url: str, cached: CachedPage | None) -> str:
+        headers = cached.conditional_headers() if cached else None
+        async with self._async_client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and cached is not None:
+                return await asyncio.to_thread(self._revalidated, url, resp, cached)
+            reader = self._open_body(resp)
+            async for chunk in resp.aiter_bytes():
+                reader.feed(chunk)
+        return await asyncio.to_thread(self._finish_body, url, resp, reader)
+
+    def _revalidated(self, url: str, resp: httpx.Response, cached: CachedPage) -> str:
+        self._logger.debug(f"Cached HTML for {url} is still current")
+        return self._http_cache.revalidated(cached, resp)
+
+    def _open_body(self, resp: httpx.Response) -> HTMLBodyReader:
+        """Check status and headers before any of the body is downloaded."""
+        resp.raise_for_status()
+        return HTMLBodyReader(resp.headers, max_bytes=self._max_bytes)
+
+    def _finish_body(
+        self, url: str, resp: httpx.Response, reader: HTMLBodyReader
+    ) -> str:
+        """The cleaned HTML of a completed download, stored in the HTTP cache."""
+        html = reader.finish()
+        self._logger.debug(f"Fetched {url}: {reader.stats}")
+        if self._http_cache is not None:
+            self._http_cache.store(url, resp, html)
+        return html
 
     def _generate_filename(self, url: str, suffix: str = ".txt") -> str:
         parsed = urlparse(url)
@@ -0,0 +1,229 @@
+"""
+Sentence index over article text, for citing evidence by id.
+
+Copying sentences out verbatim is the slowest part of an LLM call. Instead,
+prompts show the article with numbered sentences ("[12] ...") and the LLM
+returns ids, which the index resolves to exact text and character offsets in
+Article.content. Quotes the LLM writes out (parts of sentences, say) are
+located fuzzily.
+"""
+
+import difflib
+import re
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from app.models.articles import Article
+from app.models.evidence import EvidenceSpan
+
+# Words that end with a period without ending a sentence
+# fmt: off
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "st", "jr", "sr", "rev", "gen", "col",
+    "capt", "lt", "sgt", "gov", "sen", "rep", "hon", "no", "vs", "etc", "inc",
+    "ltd", "co", "corp", "plc", "jan", "feb", "mar", "apr", "jun", "jul", "aug",
+    "sep", "sept", "oct", "nov", "dec", "u.s", "u.k", "e.g", "i.e",
+}
+# fmt: on
+# Fuzzy matches must be at least this similar to a sentence
+MIN_FUZZY_RATIO = 0.8
+
+_PARAGRAPH = re.compile(r"(?:[^\n]|\n(?!\s*\n))+")
+# End punctuation (with closing quotes/brackets), whitespace, then a capital,
+# digit or opening quote
+_BOUNDARY = re.compile(r"[.!?]+[\"'”’)\]]*(?=\s+[\"'“‘(\[]?[A-Z0-9])")
+_LAST_WORD = re.compile(r"([\w.]+)\.$")
+_QUOTE_CHARS = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+
+class Sentence(BaseModel):
+    """One sentence of an article, with offsets into Article.content."""
+
+    id: int  # 1-based, in document order
+    paragraph: int  # 0-based
+    start: int
+    end: int
+    text: str
+
+
+class SentenceIndex:
+    """
+    Sentences of one article text, addressable by id.
+
+    Example:
+        >>> index = SentenceIndex.for_article(article)
+        >>> prompt_text = index.render()  # "[1] First sentence. [2] ..."
+        >>> index.resolve(EvidenceSpan(sentence_id=2))
+        EvidenceSpan(sentence_id=2, quote="...", start_index=41, end_index=97)
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.sentences: list[Sentence] = []
+        for paragraph, match in enumerate(_PARAGRAPH.finditer(text)):
+            for start, end in _split_sentences(match.group(), match.start()):
+                self.sentences.append(
+                    Sentence(
+                        id=len(self.sentences) + 1,
+                        paragraph=paragraph,
+                        start=start,
+                        end=end,
+                        text=text[start:end],
+                    )
+                )
+
+    @staticmethod
+    def for_article(article: Article) -> "SentenceIndex":
+        """The index for an article's content (built once per content)."""
+        return _index_for(article.content)
+
+    def get(self, sentence_id: int | None) -> Sentence | None:
+        if sentence_id is None or not 1 <= sentence_id <= len(self.sentences):
+            return None
+        return self.sentences[sentence_id - 1]
+
+    def render(self) -> str:
+        """The text with numbered sentences, paragraphs kept apart."""
+        paragraphs: dict[int, list[str]] = {}
+        for sentence in self.sentences:
+            paragraphs.setdefault(sentence.paragraph, []).append(
+                f"[{sentence.id}] {sentence.text}"
+            )
+        return "\n\n".join(" ".join(parts) for parts in paragraphs.values())
+
+    def span(self, sentence_id: int) -> EvidenceSpan | None:
+        sentence = self.get(sentence_id)
+        if sentence is None:
+            return None
+        return EvidenceSpan(
+            sentence_id=sentence.id,
+            quote=sentence.text,
+            start_index=sentence.start,
+            end_index=sentence.end,
+        )
+
+    def resolve(self, span: EvidenceSpan) -> EvidenceSpan | None:
+        """
+        Fill in a cited span's text and offsets.
+
+        A quote is preferred to the sentence id when it is found (it may be
+        part of a sentence). Returns None if neither can be resolved.
+        """
+        if span.quote:
+            located = self.locate(span.quote)
+            if located is not None:
+                return located
+        return self.span(span.sentence_id) if span.sentence_id else None
+
+    def locate(self, quote: str) -> EvidenceSpan | None:
+        """
+        Find a free-form quote in the text.
+
+        Tries an exact match, then one ignoring case, whitespace and quote
+        styles, then the most similar sentence.
+        """
+        quote = quote.strip().strip("\"'“”‘’").strip()
+        if not quote:
+            return None
+        start = self.text.find(quote)
+        if start == -1:
+            start, end = _find_normalised(self.text, quote)
+        else:
+            end = start + len(quote)
+        if start != -1:
+            return EvidenceSpan(
+                sentence_id=self._sentence_at(start),
+                quote=self.text[start:end],
+                start_index=start,
+                end_index=end,
+            )
+        sentence = self._most_similar(quote)
+        return self.span(sentence.id) if sentence is not None else None
+
+    def _sentence_at(self, offset: int) -> int | None:
+        for sentence in self.sentences:
+            if sentence.start <= offset < sentence.end:
+                return sentence.id
+        return None
+
+    def _most_similar(self, quote: str) -> Sentence | None:
+        matcher = difflib.SequenceMatcher(autojunk=False)
+        matcher.set_seq2(_normalise(quote))
+        best, best_ratio = None, MIN_FUZZY_RATIO
+        for sentence in self.sentences:
+            matcher.set_seq1(_normalise(sentence.text))
+            if matcher.real_quick_ratio() < best_ratio:
+                continue
+            if matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = sentence, ratio
+        return best
+
+
+@lru_cache(maxsize=32)
+def _index_for(text: str) -> SentenceIndex:
+    return SentenceIndex(text)
+
+
+def _split_sentences(paragraph: str, offset: int) -> list[tuple[int, int]]:
+    """(start, end) offsets of a paragraph's sentences, whitespace trimmed."""
+    bounds = []
+    start = 0
+    for match in _BOUNDARY.finditer(paragraph):
+        if match.group().startswith(".") and _is_abbreviation(
+            paragraph[start : match.start() + 1]
+        ):
+            continue
+        bounds.append((start, match.end()))
+        start = match.end()
+    bounds.append((start, len(paragraph)))
+
+    spans = []
+    for begin, end in bounds:
+        piece = paragraph[begin:end]
+        stripped = piece.strip()
+        if stripped:
+            lead = len(piece) - len(piece.lstrip())
+            spans.append((offset + begin + lead, offset + begin + lead + len(stripped)))
+    return spans
+
+
+def _is_abbreviation(text: str) -> bool:
+    """Whether text ends with an abbreviation or an initial ("J.")."""
+    match = _LAST_WORD.search(text)
+    if match is None:
+        return False
+    word = match.group(1).lower()
+    return word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())
+
+
+def _normalise(text: str) -> str:
+    return " ".join(text.translate(_QUOTE_CHARS).casefold().split())
+
+
+def _find_normalised(text: str, quote: str) -> tuple[int, int]:
+    """Offsets of quote in text ignoring case, whitespace and quote styles."""
+    # Normalised text with, for each character, its offset in the original
+    chars: list[str] = []
+    offsets: list[int] = []
+    pending_space = False
+    for i, original in enumerate(text):
+        if original.isspace():
+            pending_space = bool(chars)
+            continue
+        if pending_space:
+            chars.append(" ")
+            offsets.append(i)
+            pending_space = False
+        # Case folding may expand a character ("ß" -> "ss")
+        for char in original.translate(_QUOTE_CHARS).casefold():
+            chars.append(char)
+            offsets.append(i)
+    start = "".join(chars).find(_normalise(quote))
+    if start == -1:
+        return -1, -1
+    end = start + len(_normalise(quote)) - 1
+    return offsets[start], offsets[end] + 1
@@ -0,0 +1,82 @@
+"""
+Single-flight call coalescing.
+
+Concurrent calls for the same key share one execution: the first caller runs
+the work and later callers wait for its result (or exception) instead of
+repeating it. Once the call finishes the key is released, so results are not
+cached here.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing for blocking calls.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> html = flight.do(url_key, lambda: fetch(url))
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run fn, or wait for the call already running for this key."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coalescing for coroutines on one event loop.
+
+    The shared work runs as its own task, so a caller being cancelled does
+    not cancel it for the others.
+
+    Example:
+        >>> flight = AsyncSingleFlight()
+        >>> html = await flight.do(url_key, lambda: afetch(url))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn(), or the call already running for this key."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
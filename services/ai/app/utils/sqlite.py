@@ -0,0 +1,106 @@
+"""
+SQLite connection helpers shared by the local on-disk stores.
+
+Connections are opened per thread (sqlite3 connections must not be shared
+across threads) and configured for concurrent readers with a single writer.
+Schemas are versioned with PRAGMA user_version (see migrate()).
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+# How long a writer waits for a competing writer's lock before failing
+BUSY_TIMEOUT_MS = 30_000
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """
+    Open a SQLite connection tuned for concurrent access.
+
+    WAL journaling lets readers proceed while a write is in progress, and the
+    busy timeout makes concurrent writers queue instead of raising.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    return conn
+
+
+def migrate(conn: sqlite3.Connection, migrations: list[str]) -> None:
+    """
+    Apply the schema migrations a database has not run yet, in order.
+
+    PRAGMA user_version records how many have run. Each step runs in its own
+    write transaction and the version is re-read once the write lock is held,
+    so processes starting together apply every step exactly once.
+
+    Args:
+        conn: Connection to migrate (not inside a transaction)
+        migrations: SQL scripts; append new steps, never edit existing ones
+    """
+    for version, script in enumerate(migrations, start=1):
+        if _user_version(conn) >= version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if _user_version(conn) < version:
+                for statement in _statements(script):
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {version}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def _user_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _statements(script: str) -> list[str]:
+    """
+    Split a script into statements (executescript() would commit the open
+    transaction first).
+    """
+    statements, current = [], ""
+    for part in script.split(";"):
+        current += part + ";"
+        if sqlite3.complete_statement(current):
+            statements.append(current)
+            current = ""
+    statements.append(current)
+    return [statement for statement in statements if statement.strip(" \n;")]
+
+
+class ThreadLocalConnection:
+    """
+    Lazily opens one SQLite connection per thread for a database file.
+
+    Example:
+        >>> db = ThreadLocalConnection(Path("results/index.sqlite3"))
+        >>> with db.get() as conn:
+        ...     conn.execute("INSERT ...")
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def get(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect(self.path)
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection, if open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
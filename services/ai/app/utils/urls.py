@@ -0,0 +1,137 @@
+"""
+URL normalisation helpers.
+
+Used to key per-article caches so cosmetic URL differences (case, default
+ports, fragments, trailing slashes, query order) map to the same article, and
+so tracking parameters and AMP variants map to the page they were shared from.
+"""
+
+import ipaddress
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters added by analytics, ad and newsletter tooling
+TRACKING_PARAM_PREFIXES = ("utm_", "hsa_", "pk_")
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "gclsrc",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "twclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "_hsenc",
+    "_hsmi",
+    "mkt_tok",
+    "ocid",
+    "cmpid",
+    "smid",
+    "ref_src",
+    "ref_url",
+    "guccounter",
+}
+
+# Values of an "amp" query parameter that just switch the AMP variant on
+AMP_FLAG_VALUES = {"", "1", "true", "yes"}
+
+# Google AMP cache URLs: https://<mangled-host>.cdn.ampproject.org/c/s/<host>/<path>
+_AMP_CACHE_PATH = re.compile(r"^/[cv]/(s/)?(.+)$")
+
+
+def normalise_url(url: str) -> str:
+    """
+    Normalise a URL for use as a cache key.
+
+    Example:
+        >>> normalise_url("HTTPS://News.Example.com:443/story/?b=2&a=1#comments")
+        "https://news.example.com/story?a=1&b=2"
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def url_domain(url: str) -> str:
+    """
+    Registered host of a URL, lowercased and without a leading "www.".
+
+    Example:
+        >>> url_domain("https://WWW.News.Example.com/story")
+        "news.example.com"
+    """
+    host = (urlsplit(url.strip()).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalise a URL and strip tracking parameters and AMP variants.
+
+    Only unambiguous AMP markers are stripped: Google AMP cache URLs map to
+    the publisher URL, and amp / outputType=amp query flags are dropped. Path
+    conventions (a trailing /amp, .amp suffixes) are left alone, since on
+    some sites they name a different page; such variants are linked to the
+    article through the rel=canonical URL the page declares instead.
+
+    Example:
+        >>> canonical_url("https://example.com/story/?amp=1&utm_source=x&id=3#top")
+        "https://example.com/story?id=3"
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.endswith(".cdn.ampproject.org"):
+        match = _AMP_CACHE_PATH.match(parts.path)
+        if match:
+            scheme = "https" if match.group(1) else "http"
+            rest = match.group(2) + (f"?{parts.query}" if parts.query else "")
+            parts = urlsplit(f"{scheme}://{rest}")
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_ignored_param(key, value)
+    ]
+    return normalise_url(
+        urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+    )
+
+
+def _is_ignored_param(key: str, value: str) -> bool:
+    key = key.lower()
+    if key in TRACKING_PARAMS or key.startswith(TRACKING_PARAM_PREFIXES):
+        return True
+    # Not tracking, but these only select the AMP variant of the same page
+    value = value.lower()
+    return (key == "amp" and value in AMP_FLAG_VALUES) or (
+        key == "outputtype" and value == "amp"
+    )
+
+
+def is_public_address(address: str) -> bool:
+    """
+    Whether an IP address is publicly routable (not loopback, private,
+    link-local, reserved or shared address space).
+    """
+    return ipaddress.ip_address(address).is_global
+
+
+def host_matches(host: str, allowed: frozenset[str]) -> bool:
+    """Whether host is one of the allowed hosts or a subdomain of one."""
+    host = host.lower().rstrip(".")
+    return any(host == entry or host.endswith(f".{entry}") for entry in allowed)
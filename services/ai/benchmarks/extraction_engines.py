@@ -0,0 +1,120 @@
+"""
+Compare article extraction engines on speed and output parity.
+
+Runs every engine in app.utils.html_extraction over the HTML fixtures in
+benchmarks/fixtures (plus a large page built from them) and reports the
+median time per page and whether each engine's title and paragraphs match
+the readabilipy engine's.
+
+Usage (from services/ai):
+    python -m benchmarks.extraction_engines [--repeat N] [--check]
+
+With --check the exit status is 1 if any engine's output differs.
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from app.models.articles import Article
+from app.utils.html_extraction import ExtractionEngineType, parse_article
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+FIXTURE_URL = "https://news.example/section/story"
+REFERENCE = ExtractionEngineType.READABILIPY
+
+_BODY = re.compile(r"<body[^>]*>(.*)</body>", re.IGNORECASE | re.DOTALL)
+
+
+def load_fixtures() -> dict[str, str]:
+    """Fixture pages by name, plus one large page (all article bodies x 25)."""
+    pages = {
+        path.stem: path.read_text() for path in sorted(FIXTURES_DIR.glob("*.html"))
+    }
+    bodies = "".join(_BODY.search(html).group(1) for html in pages.values())
+    pages["large_page"] = (
+        "<html><head><title>Large page</title></head><body>"
+        + bodies * 25
+        + "</body></html>"
+    )
+    return pages
+
+
+def time_engine(engine: ExtractionEngineType, html: str, repeat: int) -> float:
+    """Median seconds per extraction."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_article(FIXTURE_URL, html, engine)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def parity(reference: Article, other: Article) -> str:
+    """Short description of how an article differs from the reference."""
+    if other.title != reference.title:
+        return f"title differs: {other.title!r} != {reference.title!r}"
+    ref_paragraphs = reference.content.split("\n\n")
+    paragraphs = other.content.split("\n\n")
+    if paragraphs != ref_paragraphs:
+        same = sum(a == b for a, b in zip(paragraphs, ref_paragraphs))
+        total = max(len(paragraphs), len(ref_paragraphs))
+        return f"paragraphs differ ({same}/{total} identical)"
+    if other.canonical_url != reference.canonical_url:
+        return "canonical URL differs"
+    return "identical"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="runs per page")
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 if any output differs"
+    )
+    args = parser.parse_args()
+
+    engines = list(ExtractionEngineType)
+    header = f"{'page':<20} {'KiB':>6} " + " ".join(
+        f"{engine.value + ' ms':>16}" for engine in engines
+    )
+    print(header + "  parity")
+    print("-" * (len(header) + 20))
+
+    mismatches = 0
+    totals = {engine: 0.0 for engine in engines}
+    for name, html in load_fixtures().items():
+        reference = parse_article(FIXTURE_URL, html, REFERENCE)
+        notes = []
+        for engine in engines:
+            if engine != REFERENCE:
+                result = parity(reference, parse_article(FIXTURE_URL, html, engine))
+                if result != "identical":
+                    mismatches += 1
+                notes.append(f"{engine.value}: {result}")
+        timings = {engine: time_engine(engine, html, args.repeat) for engine in engines}
+        for engine, seconds in timings.items():
+            totals[engine] += seconds
+        print(
+            f"{name:<20} {len(html.encode()) / 1024:>6.1f} "
+            + " ".join(f"{timings[engine] * 1000:>16.2f}" for engine in engines)
+            + "  "
+            + "; ".join(notes)
+        )
+
+    print("-" * (len(header) + 20))
+    print(
+        f"{'total':<27} "
+        + " ".join(f"{totals[engine] * 1000:>16.2f}" for engine in engines)
+    )
+    for engine in engines:
+        if engine != REFERENCE and totals[engine]:
+            speedup = totals[REFERENCE] / totals[engine]
+            print(f"{engine.value}: {speedup:.1f}x faster than {REFERENCE.value}")
+    return 1 if args.check and mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import pytest
+
+from app.models.articles import Article
+from app.models.llm_metadata import AnalyserMetadata
+from app.services.matching.models import MatchingResult, QueryPerson
+from app.services.results.storage import ResultsStorage
+from app.services.screening.models import ScreeningResult
+from app.utils.logger import get_logger
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return ResultsStorage(tmp_path, "1.0.0", get_logger(service="results"))
+
+
+@pytest.fixture
+def make_result():
+    def make(
+        name: str = "John Smith",
+        url: str = "https://news.example.com/story",
+        title: str = "Story",
+        content: str = "Article body.",
+    ) -> ScreeningResult:
+        person = QueryPerson(name=name)
+        return ScreeningResult(
+            article=Article(url=url, title=title, content=content),
+            query_person=person,
+            entities=[],
+            matching=MatchingResult(
+                query_person=person,
+                matches=[],
+                has_definite_match=False,
+                has_any_match=False,
+                requires_manual_review=False,
+                summary="No match",
+                metadata=AnalyserMetadata(processed_at="2026-01-01T00:00:00+00:00"),
+            ),
+        )
+
+    return make
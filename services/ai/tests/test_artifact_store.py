@@ -0,0 +1,59 @@
+import time
+
+from app.models.articles import Article
+from app.services.artifacts.models import ArticleArtifacts
+from app.services.artifacts.store import ArticleArtifactStore, article_content_hash
+
+STORY = " ".join(
+    f"Sentence {n} of the wire story about the fraud inquiry into Acme."
+    for n in range(20)
+)
+
+
+def _store_article(store, url_key: str, content: str, canonical: str | None = None):
+    article = Article(
+        url=url_key, title="Story", content=content, canonical_url=canonical
+    )
+    store.put(
+        ArticleArtifacts(
+            url_key=url_key,
+            content_hash=article_content_hash(article),
+            article=article,
+            created_at=time.time(),
+        )
+    )
+
+
+def _copy(content: str) -> Article:
+    return Article(url="https://other.example.org/copy", title="Copy", content=content)
+
+
+def test_near_duplicate_on_another_page_is_found(tmp_path):
+    store = ArticleArtifactStore(tmp_path / "artifacts.sqlite3", ttl_seconds=3600)
+    _store_article(store, "https://wire.example.com/story", STORY)
+
+    found = store.find_near_duplicate(
+        _copy(STORY + " Reporting by A. Writer."), min_similarity=0.8
+    )
+
+    assert found.url_key == "https://wire.example.com/story"
+
+
+def test_earlier_versions_of_the_same_page_are_excluded(tmp_path):
+    store = ArticleArtifactStore(tmp_path / "artifacts.sqlite3", ttl_seconds=3600)
+    _store_article(store, "https://wire.example.com/story", STORY)
+    _store_article(
+        store,
+        "https://wire.example.com/story/amp",
+        STORY,
+        canonical="https://wire.example.com/story",
+    )
+    updated = _copy(STORY + " Jane Doe has also been named.")
+
+    found = store.find_near_duplicate(
+        updated,
+        min_similarity=0.8,
+        exclude_url_keys=frozenset({"https://wire.example.com/story"}),
+    )
+
+    assert found is None
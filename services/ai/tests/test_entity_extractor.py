@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app.config import LLMProviderType
+from app.models.articles import Article
+from app.services.extraction.llm import EntityExtractor
+
+SOURCE = "John Smith was charged. He is CEO of Acme. Police said little."
+# A syndicated copy with a new first sentence: every id shifts by one
+COPY = "Updated at noon. John Smith was charged. He is CEO of Acme. Police said little."
+
+
+@pytest.fixture
+def extractor():
+    response = {
+        "entities": [
+            {
+                "id": "e1",
+                "name": "John Smith",
+                "mention_sentence_ids": [1, 2],
+                "employments": [
+                    {"role": "CEO", "organization": "Acme", "evidence_sentence_id": 2}
+                ],
+            }
+        ]
+    }
+    llm = FakeListChatModel(responses=[json.dumps(response)])
+    return EntityExtractor(llm, LLMProviderType.OPENAI, "fake-model")
+
+
+def _article(content: str) -> Article:
+    return Article(url="https://example.com/story", title="Story", content=content)
+
+
+def test_sentence_ids_are_resolved_to_text_and_offsets(extractor):
+    [entity] = extractor.extract(_article(SOURCE)).entities
+
+    assert entity.mention_sentences == ["John Smith was charged.", "He is CEO of Acme."]
+    assert entity.mention_count == 2
+    for span in entity.mention_spans:
+        assert SOURCE[span.start_index : span.end_index] == span.quote
+    assert entity.employments[0].evidence_quote == "He is CEO of Acme."
+
+
+def test_reanchor_resolves_against_the_new_article(extractor):
+    extraction = extractor.extract(_article(SOURCE))
+
+    [entity] = extractor.reanchor(extraction, _article(COPY)).entities
+
+    assert entity.mention_sentence_ids == [2, 3]
+    for span in entity.mention_spans:
+        assert COPY[span.start_index : span.end_index] == span.quote
+    employment = entity.employments[0]
+    assert employment.evidence_sentence_id == 3
+    assert COPY[employment.evidence.start_index : employment.evidence.end_index] == (
+        "He is CEO of Acme."
+    )
+    # The cached extraction itself is untouched
+    assert extraction.entities[0].mention_sentence_ids == [1, 2]
+
+
+def test_reanchor_drops_text_missing_from_the_new_article(extractor):
+    extraction = extractor.extract(_article(SOURCE))
+
+    [entity] = extractor.reanchor(
+        extraction, _article("John Smith was charged. Police said little.")
+    ).entities
+
+    assert entity.mention_sentence_ids == [1]
+    assert entity.mention_sentences == ["John Smith was charged."]
+    assert entity.employments[0].evidence is None
+    assert entity.employments[0].evidence_sentence_id is None
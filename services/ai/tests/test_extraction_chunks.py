@@ -0,0 +1,114 @@
+from app.services.extraction.chunking import split_text
+from app.services.extraction.merge import merge_entities, name_key
+from app.services.extraction.models import (
+    EmploymentRecord,
+    Entity,
+    EntityRelationship,
+)
+
+
+def _entity(name: str, **fields) -> Entity:
+    return Entity(id=name, name=name, **fields)
+
+
+def test_name_key_ignores_case_punctuation_and_titles():
+    assert name_key("Mr. John  O'Neill") == "john oneill"
+    assert name_key("DR JOHN O'NEILL") == "john oneill"
+    assert name_key("José O'Neill Jr.") == "jose oneill"
+    # A lone honorific is a name, not a prefix
+    assert name_key("Sir") == "sir"
+
+
+def test_same_person_across_chunks_is_merged_without_duplicates():
+    ceo = EmploymentRecord(role="CEO", organization="Acme", evidence_sentence_id=2)
+    first = _entity(
+        "John Smith",
+        employments=[ceo],
+        locations=["London"],
+        mention_sentence_ids=[1, 2],
+        extraction_confidence=0.7,
+    )
+    # The overlap repeats sentence 2; the employment is restated differently
+    second = _entity(
+        "Mr. John Smith",
+        aliases=["Johnny"],
+        age="52",
+        employments=[EmploymentRecord(role="ceo", organization="ACME")],
+        locations=["london", "Paris"],
+        mention_sentence_ids=[2, 5],
+        extraction_confidence=0.9,
+    )
+
+    [merged] = merge_entities([[first], [second]])
+
+    assert merged.name == "John Smith"
+    assert merged.aliases == ["Johnny"]
+    assert merged.age == "52"
+    assert merged.employments == [ceo]
+    assert merged.locations == ["London", "Paris"]
+    assert merged.mention_sentence_ids == [1, 2, 5]
+    assert merged.extraction_confidence == 0.9
+
+
+def test_entities_are_matched_through_aliases():
+    first = _entity("Jonathan Smith", aliases=["Jon Smith"])
+    second = _entity("Jon Smith", mention_sentence_ids=[8])
+
+    [merged] = merge_entities([[first], [second]])
+
+    assert merged.name == "Jonathan Smith"
+    assert merged.mention_sentence_ids == [8]
+
+
+def test_relationships_are_deduplicated_by_person_and_type():
+    relationship = EntityRelationship(
+        related_entity_name="Jane Doe",
+        relationship_type="associate_of",
+        description="Business partner",
+    )
+    restated = relationship.model_copy(
+        update={"related_entity_name": "Ms Jane Doe", "description": "Partner"}
+    )
+
+    [merged] = merge_entities(
+        [
+            [_entity("John Smith", relationships=[relationship])],
+            [_entity("John Smith", relationships=[restated])],
+        ]
+    )
+
+    assert merged.relationships == [relationship]
+
+
+def test_different_people_stay_apart_in_order_of_appearance():
+    chunks = [[_entity("John Smith")], [_entity("Jane Doe"), _entity("John Smith")]]
+
+    assert [e.name for e in merge_entities(chunks)] == ["John Smith", "Jane Doe"]
+
+
+def test_merging_does_not_modify_the_chunk_entities():
+    first = _entity("John Smith", locations=["London"])
+
+    merge_entities([[first], [_entity("John Smith", locations=["Paris"])]])
+
+    assert first.locations == ["London"]
+
+
+def test_short_text_is_one_chunk():
+    assert split_text("Short text.", 3, max_tokens=100, overlap_tokens=10) == [
+        "Short text."
+    ]
+
+
+def test_long_text_is_split_into_overlapping_paragraph_chunks():
+    paragraphs = [f"Paragraph {n} " + "word " * 20 for n in range(10)]
+    text = "\n\n".join(p.strip() for p in paragraphs)
+
+    chunks = split_text(text, len(text) // 4, max_tokens=80, overlap_tokens=30)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 80 * 4 for chunk in chunks)
+    # Every paragraph is kept, and each chunk starts with the previous tail
+    assert all(any(p.strip() in chunk for chunk in chunks) for p in paragraphs)
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.split("\n\n")[0] in previous.split("\n\n")
@@ -0,0 +1,89 @@
+import asyncio
+import socket
+import sqlite3
+
+import pytest
+
+from app.services.jobs import JobQueue, JobRunner
+from app.services.jobs.models import JobStatus
+from app.services.matching.models import QueryPerson
+
+
+def test_worker_survives_queue_errors(tmp_path, make_result):
+    class Pipeline:
+        persister = None
+
+        async def ascreen(self, url, query_person):
+            result = make_result()
+            result.id = "r1"
+            return result
+
+    class FlakyQueue(JobQueue):
+        failures = 2
+
+        def claim_next(self):
+            if self.failures:
+                self.failures -= 1
+                raise sqlite3.OperationalError("database is locked")
+            return super().claim_next()
+
+    queue = FlakyQueue(tmp_path / "jobs.sqlite3")
+    job = queue.enqueue("https://news.example.com/story", QueryPerson(name="A B"))
+
+    async def run():
+        runner = JobRunner(
+            queue, Pipeline(), http_client=None, workers=1, poll_interval_seconds=0
+        )
+        await runner.start()
+        for _ in range(100):
+            if queue.get(job.id).status == JobStatus.SUCCEEDED:
+                break
+            await asyncio.sleep(0.01)
+        await runner.stop()
+
+    asyncio.run(run())
+
+    assert queue.get(job.id).status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://localhost:8000/hook",
+        "http://127.0.0.1/hook",
+        "http://10.0.0.5/hook",
+        "http://169.254.169.254/latest/meta-data",
+        "http://[::1]/hook",
+    ],
+)
+def test_callbacks_to_internal_hosts_are_rejected(tmp_path, url):
+    runner = JobRunner(JobQueue(tmp_path / "jobs.sqlite3"), None, http_client=None)
+
+    with pytest.raises(ValueError):
+        runner.check_callback_url(url)
+
+
+def test_callback_allowlist_is_enforced_and_trusted(tmp_path):
+    runner = JobRunner(
+        JobQueue(tmp_path / "jobs.sqlite3"),
+        None,
+        http_client=None,
+        callback_allowed_hosts=frozenset({"hooks.internal"}),
+    )
+
+    runner.check_callback_url("http://api.hooks.internal/done")
+    with pytest.raises(ValueError, match="not allowed"):
+        runner.check_callback_url("https://example.com/done")
+
+
+def test_callback_names_resolving_to_internal_addresses_are_refused(
+    tmp_path, monkeypatch
+):
+    async def getaddrinfo(self, host, port, **kwargs):
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", port))]
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, "getaddrinfo", getaddrinfo)
+    runner = JobRunner(JobQueue(tmp_path / "jobs.sqlite3"), None, http_client=None)
+
+    with pytest.raises(ValueError, match="resolves to 10.0.0.7"):
+        asyncio.run(runner._check_callback_addresses("https://rebind.example/hook"))
@@ -0,0 +1,53 @@
+import hashlib
+import json
+
+from app.services.results.blobs import BlobStore, blob_digest, blob_ref
+from app.utils.compression import Compression
+
+
+def test_blob_store_round_trip_and_dedup(tmp_path):
+    blobs = BlobStore(tmp_path, Compression.NONE)
+
+    digest = blobs.put(b'"article text"')
+
+    assert blobs.put(b'"article text"') == digest
+    assert blobs.get(digest) == b'"article text"'
+    assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 1
+
+
+def test_blob_digest_only_accepts_whole_references():
+    digest = "a" * 64
+
+    assert blob_digest(blob_ref(digest)) == digest
+    assert blob_digest(f"see {blob_ref(digest)}") is None
+    assert blob_digest("blob:sha256:abc") is None
+    assert blob_digest(None) is None
+
+
+def test_article_body_is_stored_once_and_restored(storage, make_result):
+    body = "A long article body. " * 50
+    first, second = storage.save_results(
+        [make_result(content=body), make_result(name="Jane Doe", content=body)]
+    )
+
+    assert storage.get_result(first).article.content == body
+    assert storage.get_result(second).article.content == body
+    assert len([p for p in storage.blobs.root.rglob("*") if p.is_file()]) == 1
+    data = json.loads(storage.get_result_json(first, ["article"]))
+    assert data["article"]["content"] == body
+
+
+def test_reference_shaped_user_input_is_not_spliced(storage, make_result):
+    secret = "Body of another screening."
+    storage.save_result(make_result(content=secret))
+    digest = hashlib.sha256(json.dumps(secret).encode("utf-8")).hexdigest()
+    lookalike = blob_ref(digest)
+
+    result_id = storage.save_result(
+        make_result(name=lookalike, title=lookalike, content="Own body.")
+    )
+
+    data = json.loads(storage.get_result_json(result_id))
+    assert data["article"]["title"] == lookalike
+    assert data["query_person"]["name"] == lookalike
+    assert data["article"]["content"] == "Own body."
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from app.services.jobs import JobQueue, JobRunner
+from app.services.jobs.models import JobStatus
+from app.services.matching.models import QueryPerson
+from app.services.results.persister import ResultPersister
+
+
+class FailingStorage:
+    """Storage whose saves fail for the given result ids (all if None)."""
+
+    def __init__(self, failing_ids: set[str] | None = None) -> None:
+        self.failing_ids = failing_ids
+        self.saved: list[str] = []
+
+    def save_results(self, results):
+        ids = [result.id for result in results]
+        if self.failing_ids is None or self.failing_ids & set(ids):
+            raise OSError("disk full")
+        self.saved.extend(ids)
+        return ids
+
+
+def _with_id(result, result_id: str):
+    result.id = result_id
+    return result
+
+
+def test_wait_written_returns_once_saved(storage, make_result):
+    async def run():
+        persister = ResultPersister(storage)
+        await persister.start()
+        await persister.submit(_with_id(make_result(), "r1"))
+        await persister.wait_written("r1")
+        await persister.stop()
+        return persister
+
+    persister = asyncio.run(run())
+
+    assert storage.get_result("r1").query_person.name == "John Smith"
+    assert persister.stats().written == 1
+    assert persister.stats().pending == 0
+
+
+def test_wait_written_raises_the_save_error(make_result):
+    async def run():
+        persister = ResultPersister(FailingStorage())
+        await persister.start()
+        await persister.submit(_with_id(make_result(), "r1"))
+        with pytest.raises(OSError, match="disk full"):
+            await persister.wait_written("r1")
+        await persister.stop()
+        return persister
+
+    persister = asyncio.run(run())
+
+    assert persister.stats().failures == 1
+    assert persister.get_pending("r1") is None
+
+
+def test_one_bad_result_does_not_lose_its_batch(make_result):
+    storage = FailingStorage(failing_ids={"bad"})
+
+    async def run():
+        persister = ResultPersister(storage)
+        for result_id in ("a", "bad", "b"):
+            await persister.submit(_with_id(make_result(), result_id))
+        await persister.start()
+        await persister.wait_written("a")
+        with pytest.raises(OSError):
+            await persister.wait_written("bad")
+        await persister.wait_written("b")
+        await persister.stop()
+
+    asyncio.run(run())
+
+    assert storage.saved == ["a", "b"]
+
+
+def test_job_fails_when_its_result_cannot_be_saved(tmp_path, make_result):
+    class Pipeline:
+        def __init__(self) -> None:
+            self.persister = ResultPersister(FailingStorage())
+
+        async def ascreen(self, url, query_person):
+            result = _with_id(make_result(), "r1")
+            await self.persister.submit(result)
+            return result
+
+    queue = JobQueue(tmp_path / "jobs.sqlite3")
+    job = queue.enqueue("https://news.example.com/story", QueryPerson(name="A B"))
+
+    async def run():
+        pipeline = Pipeline()
+        runner = JobRunner(queue, pipeline, http_client=None)
+        await pipeline.persister.start()
+        await runner._run(queue.claim_next(), worker_id=0)
+        await pipeline.persister.stop()
+
+    asyncio.run(run())
+
+    finished = queue.get(job.id)
+    assert finished.status == JobStatus.FAILED
+    assert "disk full" in finished.error
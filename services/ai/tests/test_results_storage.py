@@ -0,0 +1,107 @@
+import pytest
+
+from app.services.results.models import ResultQuery, ResultSort
+from app.services.results.storage import ResultsStorage
+from app.utils.logger import get_logger
+
+
+def _all_pages(storage, sort: ResultSort, limit: int) -> list:
+    items, cursor = [], None
+    while True:
+        page = storage.list_results(ResultQuery(sort=sort, limit=limit, cursor=cursor))
+        items.extend(page.items)
+        if page.next_cursor is None:
+            return items
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize(
+    "sort, key, reverse",
+    [
+        (ResultSort.NEWEST, lambda item: (item.created_at, item.id), True),
+        (ResultSort.OLDEST, lambda item: (item.created_at, item.id), False),
+        (
+            ResultSort.PERSON_NAME,
+            lambda item: (item.person_name.casefold(), item.id),
+            False,
+        ),
+    ],
+)
+def test_cursor_pages_cover_every_result_once_in_order(
+    storage, make_result, sort, key, reverse
+):
+    names = ["carol", "Alice", "bob", "alice", "Dave", "carol", "eve"]
+    storage.save_results([make_result(name=name) for name in names])
+
+    items = _all_pages(storage, sort, limit=3)
+
+    assert len(items) == len(names)
+    assert len({item.id for item in items}) == len(names)
+    assert items == sorted(items, key=key, reverse=reverse)
+
+
+def test_cursor_round_trips_to_the_next_page(storage, make_result):
+    storage.save_results([make_result(name=f"Person {n}") for n in range(5)])
+    first = storage.list_results(ResultQuery(limit=2))
+
+    second = storage.list_results(ResultQuery(limit=2, cursor=first.next_cursor))
+
+    assert [item.id for item in second.items] == [
+        item.id for item in storage.list_results(ResultQuery(limit=5)).items[2:4]
+    ]
+
+
+def test_last_page_has_no_cursor(storage, make_result):
+    storage.save_results([make_result() for _ in range(2)])
+
+    assert storage.list_results(ResultQuery(limit=2)).next_cursor is None
+
+
+def test_cursor_from_another_sort_is_rejected(storage, make_result):
+    storage.save_results([make_result() for _ in range(3)])
+    cursor = storage.list_results(ResultQuery(limit=1)).next_cursor
+
+    with pytest.raises(ValueError, match="different sort"):
+        storage.list_results(ResultQuery(sort=ResultSort.OLDEST, cursor=cursor))
+
+
+def test_malformed_cursor_is_rejected(storage):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        storage.list_results(ResultQuery(cursor="not-a-cursor"))
+
+
+def test_saving_an_existing_id_again_is_found_once(storage, make_result):
+    result = make_result(name="Jane Doe")
+    storage.save_result(result)
+
+    storage.save_result(result)
+
+    hits = storage.search_results("Jane Doe").items
+    assert [hit.id for hit in hits] == [result.id]
+
+
+def test_results_from_an_older_schema_version_are_upgraded(
+    storage, make_result, tmp_path
+):
+    result = make_result(name="alice")
+    storage.save_results([result])
+
+    upgraded = ResultsStorage(tmp_path, "1.1.0", get_logger(service="results"))
+
+    assert upgraded.get_result_etag(result.id) == f'"{result.id}.1.0.0-1.1.0"'
+    assert upgraded.get_result_json(result.id) == result.model_dump_json().encode()
+
+
+def test_person_name_filter_matches_name_words(storage, make_result):
+    names = ["John Smith", "José Smithers", "Johanna Blacksmith", "Jane Doe"]
+    storage.save_results([make_result(name=name) for name in names])
+
+    def filtered(person_name: str) -> list[str]:
+        page = storage.list_results(ResultQuery(person_name=person_name))
+        return sorted(item.person_name for item in page.items)
+
+    assert filtered("smith") == ["John Smith", "José Smithers"]
+    assert filtered("JOSE") == ["José Smithers"]
+    assert filtered("john smi") == ["John Smith"]
+    with pytest.raises(ValueError):
+        filtered("!!")
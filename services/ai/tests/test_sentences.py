@@ -0,0 +1,97 @@
+import pytest
+
+from app.models.articles import Article
+from app.models.evidence import EvidenceSpan
+from app.utils.sentences import SentenceIndex
+
+TEXT = (
+    "Mr. J. Smith was charged on Monday. He denies the allegations.\n\n"
+    "“The case is weak,” his lawyer said. Police declined to comment!"
+)
+
+
+@pytest.fixture
+def index():
+    return SentenceIndex(TEXT)
+
+
+def test_sentences_split_on_ends_not_abbreviations(index):
+    assert [s.text for s in index.sentences] == [
+        "Mr. J. Smith was charged on Monday.",
+        "He denies the allegations.",
+        "“The case is weak,” his lawyer said.",
+        "Police declined to comment!",
+    ]
+    assert [s.paragraph for s in index.sentences] == [0, 0, 1, 1]
+
+
+def test_sentence_offsets_point_into_the_text(index):
+    for sentence in index.sentences:
+        assert TEXT[sentence.start : sentence.end] == sentence.text
+
+
+def test_get_by_id(index):
+    assert index.get(2).text == "He denies the allegations."
+    assert index.get(0) is None
+    assert index.get(5) is None
+    assert index.get(None) is None
+
+
+def test_render_numbers_sentences_by_paragraph(index):
+    assert index.render() == (
+        "[1] Mr. J. Smith was charged on Monday. [2] He denies the allegations."
+        "\n\n[3] “The case is weak,” his lawyer said. [4] Police declined to comment!"
+    )
+
+
+def test_locate_exact_quote_inside_a_sentence(index):
+    span = index.locate("charged on Monday")
+
+    assert span.sentence_id == 1
+    assert TEXT[span.start_index : span.end_index] == "charged on Monday"
+
+
+def test_locate_ignores_case_whitespace_and_quote_styles(index):
+    span = index.locate('"the case   is WEAK," his lawyer said')
+
+    assert span.sentence_id == 3
+    assert TEXT[span.start_index : span.end_index] == (
+        "The case is weak,” his lawyer said"
+    )
+
+
+def test_locate_falls_back_to_the_most_similar_sentence(index):
+    span = index.locate("He denied the allegation.")
+
+    assert span.sentence_id == 2
+    assert span.quote == "He denies the allegations."
+
+
+def test_locate_unrelated_quote_is_none(index):
+    assert index.locate("Completely different words here") is None
+    assert index.locate("  ") is None
+
+
+def test_resolve_prefers_a_found_quote_to_the_id(index):
+    span = index.resolve(EvidenceSpan(sentence_id=1, quote="declined to comment"))
+
+    assert span.sentence_id == 4
+
+
+def test_resolve_falls_back_to_the_id(index):
+    span = index.resolve(EvidenceSpan(sentence_id=2, quote="not in the text at all"))
+
+    assert span == EvidenceSpan(
+        sentence_id=2,
+        quote="He denies the allegations.",
+        start_index=index.get(2).start,
+        end_index=index.get(2).end,
+    )
+    assert index.resolve(EvidenceSpan(sentence_id=9)) is None
+
+
+def test_for_article_reuses_the_index_for_the_same_content():
+    article = Article(url="https://example.com/a", title="A", content=TEXT)
+    copy = Article(url="https://example.com/b", title="B", content=TEXT)
+
+    assert SentenceIndex.for_article(article) is SentenceIndex.for_article(copy)
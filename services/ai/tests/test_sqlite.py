@@ -0,0 +1,54 @@
+import sqlite3
+import threading
+
+import pytest
+
+from app.utils.sqlite import ThreadLocalConnection, migrate
+
+MIGRATIONS = [
+    "CREATE TABLE items (id INTEGER PRIMARY KEY);",
+    """
+    ALTER TABLE items ADD COLUMN name TEXT;
+    CREATE TRIGGER items_name AFTER INSERT ON items BEGIN
+        UPDATE items SET name = 'item' WHERE id = new.id;
+    END;
+    """,
+]
+
+
+def test_concurrent_migrations_run_each_step_once(tmp_path):
+    db_path = tmp_path / "test.db"
+    barrier = threading.Barrier(4)
+    errors = []
+
+    def open_and_migrate():
+        conn = ThreadLocalConnection(db_path).get()
+        barrier.wait()
+        try:
+            migrate(conn, MIGRATIONS)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=open_and_migrate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    conn = ThreadLocalConnection(db_path).get()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    with conn:
+        conn.execute("INSERT INTO items (id) VALUES (1)")
+    assert conn.execute("SELECT name FROM items").fetchone()["name"] == "item"
+
+
+def test_failed_migration_rolls_back(tmp_path):
+    conn = ThreadLocalConnection(tmp_path / "test.db").get()
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(conn, [*MIGRATIONS, "CREATE TABLE extra (id); SELECT missing;"])
+
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 2
+    assert not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'extra'"
+    ).fetchone()
@@ -0,0 +1,64 @@
+import pytest
+
+from app.utils.urls import canonical_url, normalise_url, url_domain
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "HTTPS://News.Example.com:443/story/?b=2&a=1#comments",
+            "https://news.example.com/story?a=1&b=2",
+        ),
+        ("http://example.com:8080", "http://example.com:8080/"),
+    ],
+)
+def test_normalise_url(url, expected):
+    assert normalise_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        # Tracking parameters are dropped, others kept in sorted order
+        (
+            "https://example.com/story?utm_source=x&id=3&fbclid=abc&hsa_cam=1",
+            "https://example.com/story?id=3",
+        ),
+        # AMP query flags
+        ("https://example.com/story?amp", "https://example.com/story"),
+        ("https://example.com/story?amp=1", "https://example.com/story"),
+        ("https://example.com/story?outputType=amp", "https://example.com/story"),
+        # Google AMP cache
+        (
+            "https://example-com.cdn.ampproject.org/c/s/example.com/story?id=3",
+            "https://example.com/story?id=3",
+        ),
+        (
+            "https://example-com.cdn.ampproject.org/v/example.com/story",
+            "http://example.com/story",
+        ),
+    ],
+)
+def test_canonical_url_strips_tracking_and_amp_markers(url, expected):
+    assert canonical_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        # Path conventions can name different pages; rel=canonical links them
+        "https://example.com/news/amp",
+        "https://example.com/story.amp",
+        "https://example.com/story.amp.html",
+        # An amp parameter with a real value is not just a flag
+        "https://example.com/story?amp=section-2",
+    ],
+)
+def test_canonical_url_keeps_ambiguous_amp_lookalikes(url):
+    assert canonical_url(url) == normalise_url(url)
+
+
+def test_url_domain():
+    assert url_domain("https://WWW.News.Example.com/story") == "news.example.com"
+    assert url_domain("not a url") == ""
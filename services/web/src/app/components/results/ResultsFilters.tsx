@@ -0,0 +1,89 @@
+import { Button, Group, NativeSelect, TextInput } from "@mantine/core";
+import Link from "next/link";
+import type { ResultsQuery } from "~/types/results";
+
+interface ResultsFiltersProps {
+  query: ResultsQuery;
+}
+
+// Config: Select options (empty value = no filter)
+const DECISION_OPTIONS = [
+  { value: "", label: "Any match decision" },
+  { value: "definite_match", label: "Definite match" },
+  { value: "probable_match", label: "Probable match" },
+  { value: "possible_match", label: "Possible match" },
+  { value: "uncertain", label: "Uncertain" },
+  { value: "no_match", label: "No match" },
+];
+
+const RISK_OPTIONS = [
+  { value: "", label: "Any risk" },
+  { value: "high_risk", label: "High risk" },
+  { value: "medium_risk", label: "Medium risk" },
+  { value: "low_risk", label: "Low risk" },
+  { value: "no_adverse_content", label: "No adverse content" },
+];
+
+const SORT_OPTIONS = [
+  { value: "newest", label: "Newest first" },
+  { value: "oldest", label: "Oldest first" },
+  { value: "person_name", label: "Person name" },
+];
+
+/**
+ * Plain GET form: submitting reloads the results page with the filters as
+ * search params (and drops any cursor, so results restart from page one).
+ */
+export function ResultsFilters({ query }: ResultsFiltersProps) {
+  return (
+    <form method="get">
+      <Group align="end" gap="sm">
+        <TextInput
+          name="person_name"
+          label="Person"
+          defaultValue={query.person_name}
+        />
+        <TextInput
+          name="domain"
+          label="Domain"
+          placeholder="example.com"
+          defaultValue={query.domain}
+        />
+        <TextInput
+          name="created_from"
+          label="From"
+          type="date"
+          defaultValue={query.created_from}
+        />
+        <TextInput
+          name="created_to"
+          label="To"
+          type="date"
+          defaultValue={query.created_to}
+        />
+        <NativeSelect
+          name="match_decision"
+          label="Match"
+          data={DECISION_OPTIONS}
+          defaultValue={query.match_decision ?? ""}
+        />
+        <NativeSelect
+          name="risk_category"
+          label="Risk"
+          data={RISK_OPTIONS}
+          defaultValue={query.risk_category ?? ""}
+        />
+        <NativeSelect
+          name="sort"
+          label="Sort"
+          data={SORT_OPTIONS}
+          defaultValue={query.sort ?? "newest"}
+        />
+        <Button type="submit">Apply</Button>
+        <Button component={Link} href="/results" variant="subtle">
+          Clear
+        </Button>
+      </Group>
+    </form>
+  );
+}
@@ -1,24 +1,92 @@
-import { SimpleGrid, Stack, Title } from "@mantine/core";
+import { Button, Group, SimpleGrid, Stack, Text, Title } from "@mantine/core";
+import Link from "next/link";
 import { fetchResultsList } from "~/lib/results-api";
 import { ResultCard } from "~/app/components/results/ResultCard";
 import { EmptyState } from "~/app/components/results/EmptyState";
+import { ResultsFilters } from "~/app/components/results/ResultsFilters";
+import type { ResultsQuery } from "~/types/results";
 
-export default async function ResultsPage() {
-  const results = await fetchResultsList();
+const PAGE_SIZE = 24;
+
+// Search params carried between pages (cursor is added per page)
+const FILTER_KEYS = [
+  "person_name",
+  "domain",
+  "created_from",
+  "created_to",
+  "match_decision",
+  "risk_category",
+  "sort",
+] as const;
+
+export default async function ResultsPage({
+  searchParams,
+}: {
+  searchParams: Promise<Record<string, string | string[] | undefined>>;
+}) {
+  const params = await searchParams;
+  const filters: Record<string, string> = {};
+  for (const key of FILTER_KEYS) {
+    const value = params[key];
+    if (typeof value === "string" && value !== "") {
+      filters[key] = value;
+    }
+  }
+  const query = filters as ResultsQuery;
+  const cursor = typeof params.cursor === "string" ? params.cursor : undefined;
+
+  const page = await fetchResultsList({
+    ...query,
+    // Date inputs give a day; include the whole of the "to" day
+    created_to: query.created_to && `${query.created_to}T23:59:59.999999`,
+    limit: PAGE_SIZE,
+    cursor,
+  });
+
+  const hasFilters = Object.keys(filters).length > 0;
+  const nextHref = page.next_cursor
+    ? `/results?${new URLSearchParams({ ...filters, cursor: page.next_cursor }).toString()}`
+    : null;
 
   return (
     <Stack p="xl" maw={1200} mx="auto">
       <Title order={1}>All Results</Title>
+      <ResultsFilters query={query} />
 
-      {results.length === 0 ? (
-        <EmptyState />
+      {page.items.length === 0 ? (
+        hasFilters || cursor ? (
+          <Text c="dimmed" ta="center" py="xl">
+            No results match these filters
+          </Text>
+        ) : (
+          <EmptyState />
+        )
       ) : (
         <SimpleGrid cols={{ base: 1, sm: 2, md: 3 }} spacing="lg">
-          {results.map((result) => (
+          {page.items.map((result) => (
             <ResultCard key={result.id} result={result} />
           ))}
         </SimpleGrid>
       )}
+
+      <Group justify="space-between">
+        {cursor ? (
+          <Button
+            component={Link}
+            href={`/results?${new URLSearchParams(filters).toString()}`}
+            variant="subtle"
+          >
+            Back to first page
+          </Button>
+        ) : (
+          <span />
+        )}
+        {nextHref && (
+          <Button component={Link} href={nextHref} variant="light">
+            Next page
+          </Button>
+        )}
+      </Group>
     </Stack>
   );
 }
@@ -5,20 +5,30 @@
  */
 
 import type { ScreeningResult } from "~/types/screening";
-import type { ResultMetadata } from "~/types/results";
+import type { ResultsPage, ResultsQuery } from "~/types/results";
 
 const AI_SERVICE_URL = process.env.AI_SERVICE_URL ?? "http://ai:5001";
 
-export async function fetchResultsList(): Promise<ResultMetadata[]> {
-  const response = await fetch(`${AI_SERVICE_URL}/screening/results`, {
-    cache: "no-store",
-  });
+export async function fetchResultsList(
+  query: ResultsQuery = {},
+): Promise<ResultsPage> {
+  const params = new URLSearchParams();
+  for (const [key, value] of Object.entries(query)) {
+    if (value !== undefined && value !== "") {
+      params.set(key, String(value));
+    }
+  }
+
+  const response = await fetch(
+    `${AI_SERVICE_URL}/screening/results?${params.toString()}`,
+    { cache: "no-store" },
+  );
 
   if (!response.ok) {
     throw new Error(`Failed to fetch results list: ${response.statusText}`);
   }
 
-  return response.json() as Promise<ResultMetadata[]>;
+  return response.json() as Promise<ResultsPage>;
 }
 
 export async function fetchResultById(id: string): Promise<ScreeningResult> {
@@ -4,6 +4,8 @@
  * Manually mapped from Python Pydantic models.
  */
 
+import type { MatchDecision, RiskCategory } from "~/types/screening";
+
 export interface ResultMetadata {
   id: string;
   display_name: string;
@@ -12,4 +14,27 @@ export interface ResultMetadata {
   article_title: string;
   created_at: string;
   schema_version: string;
+  article_domain: string | null;
+  match_decision: MatchDecision | null;
+  risk_category: RiskCategory | null;
+}
+
+export type ResultSort = "newest" | "oldest" | "person_name";
+
+export interface ResultsQuery {
+  person_name?: string;
+  url?: string;
+  domain?: string;
+  created_from?: string; // ISO date or datetime
+  created_to?: string; // ISO date or datetime (inclusive)
+  match_decision?: MatchDecision;
+  risk_category?: RiskCategory;
+  sort?: ResultSort;
+  limit?: number;
+  cursor?: string;
+}
+
+export interface ResultsPage {
+  items: ResultMetadata[];
+  next_cursor: string | null;
 }
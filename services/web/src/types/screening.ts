@@ -15,6 +15,7 @@ export interface Article {
   url: string;
   title: string;
   content: string;
+  canonical_url?: string | null;
 }
 
 // Query Person
@@ -74,14 +75,18 @@ export interface Employment {
   organization: string | null;
   location: string | null;
   timeframe: string | null;
+  evidence_sentence_id?: number | null;
   evidence_quote: string;
+  evidence?: EvidenceSpan | null;
 }
 
 export interface Relationship {
   related_entity_name: string;
   relationship_type: string;
   description: string;
+  evidence_sentence_id?: number | null;
   evidence_quote: string;
+  evidence?: EvidenceSpan | null;
 }
 
 export interface Entity {
@@ -97,7 +102,9 @@ export interface Entity {
   place_of_birth: string | null;
   identifiers: string[];
   relationships: Relationship[];
+  mention_sentence_ids?: number[];
   mention_sentences: string[];
+  mention_spans?: EvidenceSpan[];
   mention_count: number;
   extraction_confidence: number;
 }
@@ -151,6 +158,7 @@ export interface PersonMatch {
 export interface MatchingResult {
   query_person: QueryPerson;
   entities_analysed: string[];
+  prefilter_rejections?: PersonMatch[];
   matches: PersonMatch[];
   has_definite_match: boolean;
   has_any_match: boolean;
@@ -195,6 +203,7 @@ export type AllegationStatus =
 export type AllegationSeverity = "low" | "medium" | "high" | "critical";
 
 export interface EvidenceSpan {
+  sentence_id?: number | null;
   quote: string;
   start_index: number | null;
   end_index: number | null;
@@ -259,6 +268,7 @@ export interface SentimentResult {
 
 // Main Screening Result
 export interface ScreeningResult {
+  id?: string | null;
   article: Article;
   article_credibility: CredibilityResult | null;
   query_person: QueryPerson;